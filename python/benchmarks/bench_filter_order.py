@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Latency of the filtering of a dask dataframe by one tight range filter and
+several loose ones, evaluated as one combined mask over the full columns,
+or in increasing order of selectivity, the strategy of the dask_cudf path
+of DashBoard._filtered_data.
+
+    python benchmarks/bench_filter_order.py --rows 20000000 --loose 4
+
+Uses dask_cudf when it is installed, dask with pandas partitions otherwise.
+With --in-memory the two strategies run on a single cudf (or pandas)
+dataframe, the work done for every partition without the dask overhead.
+"""
+
+import argparse
+import functools
+import operator
+import time
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+
+try:
+    import cudf
+    import cupy as cp
+    import dask_cudf
+except ImportError:
+    cudf = cp = dask_cudf = None
+
+
+def make_data(n_rows, n_columns, npartitions, in_memory=False, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({f"c{i}": rng.random(n_rows) for i in range(n_columns)})
+    if in_memory:
+        return df if cudf is None else cudf.from_pandas(df)
+    if dask_cudf is not None:
+        return dask_cudf.from_cudf(cudf.from_pandas(df), npartitions)
+    return dd.from_pandas(df, npartitions=npartitions)
+
+
+def ranges(n_loose, tight, loose):
+    """
+    (column, lo, hi, selectivity) of the filters, the tight one last as the
+    dashboard would see it when it is brushed after the others
+    """
+    filters = [(f"c{i + 1}", 0.0, loose, loose) for i in range(n_loose)]
+    return filters + [("c0", 0.0, tight, tight)]
+
+
+def combined(data, filters):
+    masks = [
+        (data[column] >= lo) & (data[column] <= hi)
+        for column, lo, hi, _ in filters
+    ]
+    return data[functools.reduce(operator.and_, masks)]
+
+
+def _filter_in_order(df, filters):
+    # same strategy as cuxfilter.dashboard._filter_in_order
+    xp = np if isinstance(df, pd.DataFrame) else cp
+    positions = None
+    for column, lo, hi, _ in filters:
+        values = (
+            df[column] if positions is None else df[column].take(positions)
+        )
+        selected = ((values >= lo) & (values <= hi)).values
+        selected = xp.flatnonzero(selected)
+        positions = selected if positions is None else positions[selected]
+    return df.take(positions)
+
+
+def ordered(data, filters):
+    if not hasattr(data, "map_partitions"):
+        return _filter_in_order(
+            data, sorted(filters, key=lambda item: item[3])
+        )
+    # one partition function, the dask optimizer merges chained filters
+    # into one predicate over all the rows
+    return data.map_partitions(
+        _filter_in_order,
+        sorted(filters, key=lambda item: item[3]),
+        meta=data._meta,
+    )
+
+
+def timeit(fn, data, filters, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        n_rows = len(fn(data, filters))
+        times.append(time.perf_counter() - start)
+    return min(times), n_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--loose", type=int, default=4)
+    parser.add_argument("--extra-columns", type=int, default=4)
+    parser.add_argument("--tight", type=float, default=0.001)
+    parser.add_argument("--loose-fraction", type=float, default=0.9)
+    parser.add_argument("--npartitions", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--in-memory", action="store_true")
+    args = parser.parse_args()
+
+    data = make_data(
+        args.rows,
+        1 + args.loose + args.extra_columns,
+        args.npartitions,
+        args.in_memory,
+    )
+    if not args.in_memory:
+        data = data.persist()
+    filters = ranges(args.loose, args.tight, args.loose_fraction)
+    backend = "cudf" if cudf is not None else "pandas"
+    print(
+        f"{backend if args.in_memory else 'dask ' + backend}, "
+        f"{args.rows} rows, 1 tight ({args.tight}) and {args.loose} loose "
+        f"({args.loose_fraction}) range filters"
+    )
+    results = {
+        name: timeit(fn, data, filters, args.repeat)
+        for name, fn in (("combined", combined), ("ordered", ordered))
+    }
+    assert results["combined"][1] == results["ordered"][1]
+    for name, (seconds, n_rows) in results.items():
+        print(f"{name:>9}: {seconds * 1000:9.1f} ms  ({n_rows} rows)")
+    print(f"  speedup: {results['combined'][0] / results['ordered'][0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
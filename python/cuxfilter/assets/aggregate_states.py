@@ -0,0 +1,535 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Mergeable aggregate states.
+
+An aggregate function is represented by the state it keeps over a chunk of
+values: the state of a chunk is built in one pass, the states of two chunks
+merge into the state of their union, and the aggregate is read from the
+final state. Partitions of a dask frame are aggregated independently and
+combined without going back to the rows, and the invertible states (count,
+sum, mean, var, std) can also remove the contribution of a chunk, to apply
+incremental deltas.
+
+Every state has a scalar interface, for the values of a single group, and
+a grouped interface, for the groups of a cudf or pandas groupby, used by
+calc_groupby.
+
+The approximate aggregates (SKETCH_STATES, and approx_quantile_<q> for
+any quantile q) keep a sketch of the values instead
+(cuxfilter.assets.sketches). cudf and pandas groupbys cannot build them,
+their grouped interface takes the group id of every value instead.
+"""
+
+from abc import ABC, abstractmethod
+from functools import lru_cache, reduce
+
+import dask
+import numpy as np
+import pandas as pd
+
+from .sketches import HyperLogLog, TDigest
+
+
+def _nan_min(a, b):
+    return b if pd.isna(a) else a if pd.isna(b) else min(a, b)
+
+
+def _nan_max(a, b):
+    return b if pd.isna(a) else a if pd.isna(b) else max(a, b)
+
+
+class AggregateState(ABC):
+    """
+    Base class of the aggregate states.
+
+    Parameters
+    ----------
+    **fields
+        values of the fields of the state, the fields left out get their
+        identity value (the state of an empty chunk)
+    """
+
+    # field -> identity value
+    fields = {}
+    # field -> cudf/pandas groupby aggregation computing it for every group
+    groupby_fns = {}
+    # field -> groupby aggregation combining it over the chunks of a group
+    merge_fns = {}
+    invertible = False
+
+    def __init__(self, **fields):
+        for field, identity in self.fields.items():
+            setattr(self, field, fields.get(field, identity))
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self.fields
+        )
+        return f"{type(self).__name__}({fields})"
+
+    @classmethod
+    @abstractmethod
+    def from_values(cls, values):
+        """
+        state of a chunk of values, a cudf or pandas Series
+        """
+
+    def update(self, values):
+        """
+        state of the values seen so far and the chunk `values`
+        """
+        return self.merge(self.from_values(values))
+
+    @abstractmethod
+    def merge(self, other):
+        """
+        state of the union of the chunks of `self` and `other`
+        """
+
+    def subtract(self, other):
+        """
+        state of the chunks of `self` without the chunks of `other`, only
+        for invertible states
+        """
+        raise TypeError(f"{type(self).__name__} is not invertible")
+
+    @abstractmethod
+    def finalize(self):
+        """
+        value of the aggregate
+        """
+
+    @classmethod
+    def from_groupby(cls, partials, column):
+        """
+        convert, in place, the groupby aggregations `{column}_{fn}` of the
+        `partials` frame to the fields `{column}_{field}`
+        """
+        for field, fn in cls.groupby_fns.items():
+            if field != fn:
+                partials[f"{column}_{field}"] = partials.pop(f"{column}_{fn}")
+
+    @classmethod
+    def merge_groups(cls, partials, by, column):
+        """
+        prepare, in place, the fields of the concatenated chunks `partials`
+        for their combination with merge_fns, `by` being the group keys
+        """
+
+    @classmethod
+    @abstractmethod
+    def finalize_groups(cls, combined, column):
+        """
+        aggregate of every group, from the combined fields of the groups
+        """
+
+
+class CountState(AggregateState):
+    fields = {"count": 0}
+    groupby_fns = {"count": "count"}
+    merge_fns = {"count": "sum"}
+    invertible = True
+
+    @classmethod
+    def from_values(cls, values):
+        return cls(count=int(values.count()))
+
+    def merge(self, other):
+        return type(self)(count=self.count + other.count)
+
+    def subtract(self, other):
+        return type(self)(count=self.count - other.count)
+
+    def finalize(self):
+        return self.count
+
+    @classmethod
+    def finalize_groups(cls, combined, column):
+        return combined[f"{column}_count"]
+
+
+class SumState(AggregateState):
+    fields = {"sum": 0}
+    groupby_fns = {"sum": "sum"}
+    merge_fns = {"sum": "sum"}
+    invertible = True
+
+    @classmethod
+    def from_values(cls, values):
+        return cls(sum=values.sum())
+
+    def merge(self, other):
+        return type(self)(sum=self.sum + other.sum)
+
+    def subtract(self, other):
+        return type(self)(sum=self.sum - other.sum)
+
+    def finalize(self):
+        return self.sum
+
+    @classmethod
+    def finalize_groups(cls, combined, column):
+        return combined[f"{column}_sum"]
+
+
+class MinState(AggregateState):
+    fields = {"min": np.nan}
+    groupby_fns = {"min": "min"}
+    merge_fns = {"min": "min"}
+
+    @classmethod
+    def from_values(cls, values):
+        return cls(min=values.min())
+
+    def merge(self, other):
+        return type(self)(min=_nan_min(self.min, other.min))
+
+    def finalize(self):
+        return self.min
+
+    @classmethod
+    def finalize_groups(cls, combined, column):
+        return combined[f"{column}_min"]
+
+
+class MaxState(AggregateState):
+    fields = {"max": np.nan}
+    groupby_fns = {"max": "max"}
+    merge_fns = {"max": "max"}
+
+    @classmethod
+    def from_values(cls, values):
+        return cls(max=values.max())
+
+    def merge(self, other):
+        return type(self)(max=_nan_max(self.max, other.max))
+
+    def finalize(self):
+        return self.max
+
+    @classmethod
+    def finalize_groups(cls, combined, column):
+        return combined[f"{column}_max"]
+
+
+class MeanState(AggregateState):
+    fields = {"count": 0, "sum": 0}
+    groupby_fns = {"count": "count", "sum": "sum"}
+    merge_fns = {"count": "sum", "sum": "sum"}
+    invertible = True
+
+    @classmethod
+    def from_values(cls, values):
+        return cls(count=int(values.count()), sum=values.sum())
+
+    def merge(self, other):
+        return type(self)(
+            count=self.count + other.count, sum=self.sum + other.sum
+        )
+
+    def subtract(self, other):
+        return type(self)(
+            count=self.count - other.count, sum=self.sum - other.sum
+        )
+
+    def finalize(self):
+        return self.sum / self.count if self.count > 0 else np.nan
+
+    @classmethod
+    def finalize_groups(cls, combined, column):
+        count = combined[f"{column}_count"]
+        return (combined[f"{column}_sum"] / count).where(count > 0)
+
+
+class VarState(AggregateState):
+    """
+    Welford state: count, mean and sum of squared deviations from the mean
+    (m2) of the values. Unlike the sum of squares, m2 stays accurate for
+    values with a large mean and a small spread.
+    """
+
+    fields = {"count": 0, "mean": 0.0, "m2": 0.0}
+    groupby_fns = {"count": "count", "mean": "mean", "m2": "var"}
+    merge_fns = {"count": "sum", "mean": "max", "m2": "sum"}
+    invertible = True
+    ddof = 1
+
+    @classmethod
+    def from_values(cls, values):
+        count = int(values.count())
+        if count == 0:
+            return cls()
+        return cls(
+            count=count,
+            mean=float(values.mean()),
+            m2=float(values.var(ddof=0)) * count,
+        )
+
+    def merge(self, other):
+        count = self.count + other.count
+        if count == 0:
+            return type(self)()
+        delta = other.mean - self.mean
+        return type(self)(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2
+            + other.m2
+            + delta**2 * self.count * other.count / count,
+        )
+
+    def subtract(self, other):
+        count = self.count - other.count
+        if count <= 0:
+            return type(self)()
+        mean = (self.count * self.mean - other.count * other.mean) / count
+        delta = other.mean - mean
+        return type(self)(
+            count=count,
+            mean=mean,
+            m2=max(
+                self.m2
+                - other.m2
+                - delta**2 * count * other.count / self.count,
+                0.0,
+            ),
+        )
+
+    def finalize(self):
+        if self.count <= self.ddof:
+            return np.nan
+        return self.m2 / (self.count - self.ddof)
+
+    @classmethod
+    def from_groupby(cls, partials, column):
+        count = partials[f"{column}_count"]
+        partials[f"{column}_m2"] = (
+            partials.pop(f"{column}_var") * (count - 1)
+        ).where(count > 1, 0)
+
+    @classmethod
+    def merge_groups(cls, partials, by, column):
+        # parallel variance: the m2 of the union adds, for every chunk,
+        # count * (chunk mean - group mean) ** 2
+        count = partials[f"{column}_count"]
+        partials[f"{column}_weighted"] = (
+            count * partials[f"{column}_mean"]
+        ).where(count > 0, 0)
+        grouped = partials.groupby(by, sort=False)
+        mean = grouped[f"{column}_weighted"].transform("sum") / grouped[
+            f"{column}_count"
+        ].transform("sum")
+        partials[f"{column}_m2"] = partials[f"{column}_m2"] + (
+            count * (partials[f"{column}_mean"] - mean) ** 2
+        ).where(count > 0, 0)
+        partials[f"{column}_mean"] = mean
+        del partials[f"{column}_weighted"]
+
+    @classmethod
+    def finalize_groups(cls, combined, column):
+        count = combined[f"{column}_count"]
+        return (combined[f"{column}_m2"] / (count - cls.ddof)).where(
+            count > cls.ddof
+        )
+
+
+class StdState(VarState):
+    def finalize(self):
+        return np.sqrt(super().finalize())
+
+    @classmethod
+    def finalize_groups(cls, combined, column):
+        return super().finalize_groups(combined, column) ** 0.5
+
+
+AGGREGATE_STATES = {
+    "count": CountState,
+    "sum": SumState,
+    "min": MinState,
+    "max": MaxState,
+    "mean": MeanState,
+    "var": VarState,
+    "std": StdState,
+}
+
+
+class SketchState(AggregateState):
+    """
+    Base class of the approximate aggregate states, holding the sketches of
+    one or more groups (None for an empty chunk).
+    """
+
+    fields = {"sketch": None}
+    sketch_cls = None
+    sketch_params = {}
+
+    @classmethod
+    def from_values(cls, values):
+        return cls.from_groups(values)
+
+    @classmethod
+    def from_groups(cls, values, group_ids=None, n_groups=1):
+        """
+        state of the groups of a chunk of values, `group_ids` being the
+        group of every value, a cupy or numpy int array
+        """
+        valid = values.notna()
+        if group_ids is not None:
+            group_ids = group_ids[valid.values]
+        return cls(
+            sketch=cls.sketch_cls.from_values(
+                values[valid], group_ids, n_groups, **cls.sketch_params
+            )
+        )
+
+    def merge(self, other):
+        if self.sketch is None:
+            return other
+        if other.sketch is None:
+            return self
+        return type(self)(sketch=self.sketch.merge(other.sketch))
+
+    def reindex(self, codes, n_groups):
+        """
+        state moved to the groups `codes` of `n_groups` groups, to merge it
+        with the states of chunks holding other groups
+        """
+        return type(self)(sketch=self.sketch.reindex(codes, n_groups))
+
+    def finalize(self):
+        if self.sketch is None:
+            return np.nan
+        return self.finalize_sketch()[0]
+
+    @classmethod
+    def finalize_groups(cls, combined, column):
+        raise TypeError(
+            f"{cls.__name__} has no groupby fields, group its values with "
+            "from_groups"
+        )
+
+    @abstractmethod
+    def finalize_sketch(self):
+        """
+        aggregate of every group of the sketch, numpy array
+        """
+
+
+class ApproxNuniqueState(SketchState):
+    sketch_cls = HyperLogLog
+    sketch_params = {"precision": 12}
+
+    def finalize_sketch(self):
+        return self.sketch.estimate()
+
+
+class ApproxQuantileState(SketchState):
+    sketch_cls = TDigest
+    sketch_params = {"compression": 200}
+    quantile = 0.5
+
+    def finalize_sketch(self):
+        return self.sketch.quantile(self.quantile)
+
+
+SKETCH_STATES = {
+    "approx_nunique": ApproxNuniqueState,
+    "approx_median": ApproxQuantileState,
+}
+
+# prefix of the approximate quantile aggregates, approx_quantile_<q>
+_APPROX_QUANTILE = "approx_quantile_"
+
+
+def _check_quantile(q):
+    if not 0 <= q <= 1:
+        raise ValueError(f"quantile {q} is not between 0 and 1")
+
+
+@lru_cache(maxsize=None)
+def _approx_quantile_state(q):
+    return type("ApproxQuantileState", (ApproxQuantileState,), {"quantile": q})
+
+
+def approx_quantile(q):
+    """
+    name of the approximate q-quantile aggregate, to use as aggregate_fn
+
+    Parameters
+    ----------
+    q: float
+        between 0 and 1
+
+    Returns
+    -------
+    str, "approx_quantile_{q}"
+    """
+    _check_quantile(q)
+    return f"{_APPROX_QUANTILE}{float(q)!r}"
+
+
+def aggregate_state(aggregate_fn):
+    """
+    mergeable state class of an aggregate, exact or approximate, None if
+    the aggregate has none. approx_quantile_<q> names are parsed, for any
+    quantile q between 0 and 1
+    """
+    state = AGGREGATE_STATES.get(aggregate_fn, SKETCH_STATES.get(aggregate_fn))
+    if (
+        state is None
+        and isinstance(aggregate_fn, str)
+        and aggregate_fn.startswith(_APPROX_QUANTILE)
+    ):
+        try:
+            q = float(aggregate_fn[len(_APPROX_QUANTILE) :])
+        except ValueError:
+            raise ValueError(
+                f"{aggregate_fn} is not an approximate quantile, the name "
+                f"should be {_APPROX_QUANTILE}<q>"
+            ) from None
+        _check_quantile(q)
+        state = _approx_quantile_state(q)
+    return state
+
+
+def is_sketch(aggregate_fn):
+    """
+    whether the aggregate is approximate, with a SketchState
+    """
+    state = aggregate_state(aggregate_fn)
+    return state is not None and issubclass(state, SketchState)
+
+
+def aggregate(values, aggregate_fn):
+    """
+    aggregate of a cudf, pandas or dask Series. For dask, the states of the
+    partitions are computed together and merged, a single compute for any
+    aggregate with a mergeable state
+
+    Parameters
+    ----------
+    values: cudf.Series, pandas.Series or dask_cudf.Series
+    aggregate_fn: str
+        name of the aggregate, a Series method or an approximate aggregate
+        (see is_sketch)
+
+    Returns
+    -------
+    scalar
+    """
+    state = aggregate_state(aggregate_fn)
+    if is_sketch(aggregate_fn) and not dask.is_dask_collection(values):
+        return state.from_values(values).finalize()
+    if state is None or not dask.is_dask_collection(values):
+        return getattr(values, aggregate_fn)()
+    return reduce(
+        state.merge,
+        dask.compute(
+            *[
+                dask.delayed(state.from_values)(part)
+                for part in values.to_delayed()
+            ]
+        ),
+    ).finalize()
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+from collections import OrderedDict
+
+import cupy as cp
+import numpy as np
+
+
+class BufferPool:
+    """
+    Pool of reusable scratch arrays for the aggregations of a dashboard.
+
+    Buffers are keyed by array module, dtype and size, the size rounded up
+    to a power of two, and handed out as a view of their first elements. A
+    buffer acquired during a reload is released back to the pool once its
+    content has been consumed, and handed out again by the next reload
+    asking for the same key, so interactions reuse the same memory instead
+    of allocating new arrays and leaving them to the garbage collector,
+    even when the number of selected rows changes with every brush. The
+    pool is safe to use from the reload worker threads.
+
+    The free buffers are bounded by `max_bytes`, the buffers of the least
+    recently used keys are dropped first. Every buffer is freed by clear(),
+    called by the dashboard when it is stopped or its data is reset.
+
+    Parameters
+    ----------
+    max_buffers: int, default 8
+        maximum number of free buffers kept per key
+    max_bytes: int, default 256MB
+        maximum memory held by the free buffers of the pool
+    """
+
+    def __init__(self, max_buffers=8, max_bytes=256 * 2**20):
+        self.max_buffers = max_buffers
+        self.max_bytes = max_bytes
+        # (module name, dtype, bucket size) -> free buffers, least recently
+        # used key first
+        self._free = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _bucket(size):
+        """
+        smallest power of two >= size
+        """
+        return 1 << max(int(size) - 1, 0).bit_length()
+
+    @staticmethod
+    def _key(xp, dtype, size):
+        return (xp.__name__, np.dtype(dtype), int(size))
+
+    @property
+    def nbytes(self):
+        """
+        memory held by the free buffers of the pool
+        """
+        with self._lock:
+            return self._nbytes
+
+    def acquire(self, shape, dtype, xp=np, fill=None):
+        """
+        Buffer of the given shape and dtype, reused from the pool when one
+        is free.
+
+        Parameters
+        ----------
+        shape: int or tuple of int
+        dtype: numpy dtype
+        xp: module, default numpy
+            array module (numpy or cupy) of the buffer
+        fill: scalar, optional
+            value to fill the buffer with, the content of a reused buffer
+            is undefined otherwise
+
+        Returns
+        -------
+        numpy or cupy array, to hand back with release() once consumed
+        """
+        shape = (shape,) if np.isscalar(shape) else tuple(shape)
+        size = int(np.prod(shape))
+        bucket = self._bucket(size)
+        key = self._key(xp, dtype, bucket)
+        with self._lock:
+            buffers = self._free.get(key)
+            buffer = buffers.pop() if buffers else None
+            if buffer is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._nbytes -= buffer.nbytes
+                if len(buffers) == 0:
+                    del self._free[key]
+        if buffer is None:
+            buffer = xp.empty(bucket, dtype=dtype)
+        buffer = buffer[:size].reshape(shape)
+        if fill is not None:
+            buffer.fill(fill)
+        return buffer
+
+    def release(self, buffer):
+        """
+        Hand `buffer`, acquired from this pool, back to the pool. The
+        caller must not use it afterwards.
+        """
+        # the whole bucket sized array the buffer is a view of
+        if buffer.base is not None:
+            buffer = buffer.base
+        if buffer.nbytes > self.max_bytes:
+            return
+        xp = cp.get_array_module(buffer)
+        key = self._key(xp, buffer.dtype, buffer.size)
+        with self._lock:
+            buffers = self._free.get(key, [])
+            if len(buffers) >= self.max_buffers:
+                return
+            buffers.append(buffer)
+            self._free[key] = buffers
+            self._free.move_to_end(key)
+            self._nbytes += buffer.nbytes
+            # evict the buffers of the least recently used keys
+            while self._nbytes > self.max_bytes:
+                lru_key, lru_buffers = next(iter(self._free.items()))
+                self._nbytes -= lru_buffers.pop().nbytes
+                if len(lru_buffers) == 0:
+                    del self._free[lru_key]
+
+    def clear(self):
+        """
+        Drop every buffer held by the pool. Their memory goes back to the
+        allocator of the process, the other users of the cupy memory pool
+        are left alone.
+        """
+        with self._lock:
+            self._free.clear()
+            self._nbytes = 0
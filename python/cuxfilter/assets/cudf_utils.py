@@ -1,10 +1,33 @@
 # SPDX-FileCopyrightText: Copyright (c) 2020-2025, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import ast
+import operator
+import re
 import dask_cudf
 import dask.dataframe as dd
 from ..charts.constants import CUDF_DATETIME_TYPES
 
+_LOCAL_PREFIX = "__cuxf_local__"
+_COMPARE_OPS = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+# comparison with the operands swapped, so that the column is always on
+# the left hand side
+_REFLECTED_OPS = {
+    ast.Lt: operator.gt,
+    ast.LtE: operator.ge,
+    ast.Gt: operator.lt,
+    ast.GtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
 
 def get_min_max(df, col_name):
     min, max = df[col_name].min(), df[col_name].max()
@@ -43,6 +66,26 @@ def cull_empty_partitions(df):
     return df
 
 
+def cancel_futures(collection):
+    """
+    cancel the pending futures of a persisted dask collection on the
+    distributed scheduler, no-op for local collections or without a
+    distributed client
+    """
+    try:
+        from distributed import default_client, futures_of
+    except ImportError:
+        return
+    futures = futures_of(collection)
+    if len(futures) == 0:
+        return
+    try:
+        default_client().cancel(futures)
+    except ValueError:
+        # no distributed client
+        pass
+
+
 def query_df(df, query, local_dict, indices=None):
     # filter the source data with current queries: indices and query strs
     result = df if indices is None else df[indices]
@@ -56,3 +99,141 @@ def query_df(df, query, local_dict, indices=None):
         result = cull_empty_partitions(result)
 
     return result
+
+
+def _is_column(value):
+    return hasattr(value, "isin")
+
+
+def _eval_compare(op, left, right):
+    if isinstance(op, (ast.In, ast.NotIn)):
+        result = left.isin(list(right))
+        return ~result if isinstance(op, ast.NotIn) else result
+    if not _is_column(left) and _is_column(right):
+        return _REFLECTED_OPS[type(op)](right, left)
+    return _COMPARE_OPS[type(op)](left, right)
+
+
+def _combine(combine, left, right):
+    # masks coming from a sorted index are arrays, convert the Series
+    # operand when both kinds are mixed
+    if _is_column(left) != _is_column(right):
+        left, right = to_mask_array(left), to_mask_array(right)
+    return combine(left, right)
+
+
+def _is_local(node):
+    return isinstance(node, ast.Name) and node.id.startswith(_LOCAL_PREFIX)
+
+
+def _is_range(node):
+    """
+    return True for `@lo <= column <= @hi` comparisons
+    """
+    if len(node.ops) != 2 or not all(
+        isinstance(op, ast.LtE) for op in node.ops
+    ):
+        return False
+    lo, column, hi = node.left, *node.comparators
+    return (
+        isinstance(column, ast.Name)
+        and not _is_local(column)
+        and _is_local(lo)
+        and _is_local(hi)
+    )
+
+
+def _eval_query_node(node, df, local_dict, range_mask=None):
+    def _eval(child):
+        return _eval_query_node(child, df, local_dict, range_mask)
+
+    if isinstance(node, ast.Expression):
+        return _eval(node.body)
+    if isinstance(node, ast.BoolOp):
+        values = [_eval(v) for v in node.values]
+        combine = (
+            operator.and_ if isinstance(node.op, ast.And) else operator.or_
+        )
+        result = values[0]
+        for value in values[1:]:
+            result = _combine(combine, result, value)
+        return result
+    if isinstance(node, ast.BinOp) and isinstance(
+        node.op, (ast.BitAnd, ast.BitOr)
+    ):
+        combine = (
+            operator.and_ if isinstance(node.op, ast.BitAnd) else operator.or_
+        )
+        return _combine(combine, _eval(node.left), _eval(node.right))
+    if isinstance(node, ast.UnaryOp) and isinstance(
+        node.op, (ast.Not, ast.Invert)
+    ):
+        return ~_eval(node.operand)
+    if isinstance(node, ast.Compare):
+        if range_mask is not None and _is_range(node):
+            mask = range_mask(
+                node.comparators[0].id,
+                _eval(node.left),
+                _eval(node.comparators[1]),
+            )
+            if mask is not None:
+                return mask
+        # chained comparisons (a <= x <= b) are split into pairwise ones
+        result = None
+        left = _eval(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _eval(comparator)
+            mask = _eval_compare(op, left, right)
+            result = mask if result is None else result & mask
+            left = right
+        return result
+    if isinstance(node, ast.Name):
+        if node.id.startswith(_LOCAL_PREFIX):
+            return local_dict[node.id[len(_LOCAL_PREFIX) :]]
+        return df[node.id]
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, (ast.Tuple, ast.List)):
+        return [_eval(e) for e in node.elts]
+    raise NotImplementedError(
+        f"unsupported query expression: {ast.dump(node)}"
+    )
+
+
+def query_mask(df, query, local_dict, range_mask=None):
+    """
+    evaluate a DataFrame.query expression (as generated by the charts'
+    compute_query_dict) into a boolean Series aligned with df, instead of
+    materializing the filtered DataFrame.
+
+    Supports comparisons (including chained ones), `in`/`not in`, `and`,
+    `or`, `not`, `&`, `|`, `~`, column names and `@` local variables.
+
+    range_mask: callable(column, lo, hi), optional
+        called for `@lo <= column <= @hi` comparisons, returns a boolean
+        array for the range, or None to evaluate the comparison on the
+        column
+    """
+    expr = re.sub(r"@(\w+)", _LOCAL_PREFIX + r"\1", query)
+    try:
+        tree = ast.parse(expr, mode="eval")
+        return _eval_query_node(tree, df, local_dict, range_mask)
+    except (SyntaxError, NotImplementedError):
+        # fall back to DataFrame.query for expressions outside the subset
+        # generated by cuxfilter charts, over a positional index: the
+        # labels of df may repeat
+        df = df.reset_index(drop=True)
+        return df.index.isin(df.query(expr=query, local_dict=local_dict).index)
+
+
+def to_mask_array(mask):
+    """
+    convert a boolean cudf/pandas Series or DataFrame of selected rows, as
+    stored in DashBoard._query_str_dict, into a positional boolean
+    cupy/numpy array
+    """
+    if hasattr(mask, "columns"):
+        mask = mask.fillna(False).all(axis=1)
+    if hasattr(mask, "fillna"):
+        mask = mask.fillna(False).astype("bool").values
+    return mask
@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import cupy as cp
+import numpy as np
+
+
+class DataTiles:
+    """
+    Pairwise count tiles of the chart being brushed (the active chart)
+    against the other binned aggregate charts.
+
+    The tile of a chart holds, for every (active bin, chart bin) pair, the
+    number of rows passing every filter except the active chart's own. A
+    range brush on the active chart then sums the tile rows of the bins it
+    covers, so the other charts update in O(bins) without touching the raw
+    rows. The two edge bins of the range, only partially covered by the
+    brush, are counted from their rows through the sorted index of the
+    active column, which keeps the counts exact.
+
+    Parameters
+    ----------
+    active: str
+        name of the active chart
+    bin_ids: cupy.ndarray or numpy.ndarray
+        bin ids of the active column, see calc_bin_ids
+    n_bins: int
+        number of bins of the active chart
+    index: cuxfilter.assets.sorted_index.SortedIndex
+        sorted index of the active column
+    selection: boolean array, optional
+        rows passing every filter except the active chart's own, None for
+        every row
+    charts: dict
+        chart name -> (bin_ids, n_bins) of the charts to tile
+    signature: dict, optional
+        signatures of the filters the selection was built from, used by
+        the dashboard to detect stale tiles
+    cumulative: bool, default False
+        store the running sums of the tiles over the active bins
+    """
+
+    def __init__(
+        self,
+        active,
+        bin_ids,
+        n_bins,
+        index,
+        selection,
+        charts,
+        signature=None,
+        cumulative=False,
+    ):
+        self.active = active
+        self.cumulative = cumulative
+        self.index = index
+        self.selection = selection
+        self.signature = signature
+        self.xp = cp.get_array_module(bin_ids)
+        self.sorted_bin_ids = bin_ids[index.order]
+        self.bin_ids = {}
+        self.tiles = {}
+        rows = bin_ids.astype(np.int64)
+        if selection is not None:
+            rows = rows[selection]
+        for name, (chart_bin_ids, chart_n_bins) in charts.items():
+            chart_rows = chart_bin_ids
+            if selection is not None:
+                chart_rows = chart_rows[selection]
+            # one extra bin on both axes for the null rows
+            shape = (n_bins + 1, chart_n_bins + 1)
+            tile = (
+                self.xp.bincount(
+                    rows * shape[1] + chart_rows,
+                    minlength=shape[0] * shape[1],
+                )
+                .astype(self.tile_dtype(len(bin_ids)))
+                .reshape(shape)
+            )
+            if cumulative:
+                tile = self.xp.cumsum(tile, axis=0, dtype=tile.dtype)
+            self.tiles[name] = tile
+            self.bin_ids[name] = chart_bin_ids
+
+    @staticmethod
+    def tile_dtype(n_rows):
+        return np.int32 if n_rows < np.iinfo(np.int32).max else np.int64
+
+    @classmethod
+    def nbytes(cls, bin_ids, n_bins, charts):
+        """
+        peak memory used to build the tiles of an active chart with bin ids
+        `bin_ids` and `n_bins` bins against `charts`, a dict chart name ->
+        (bin_ids, n_bins): the tiles and the sorted bin ids they keep, plus
+        the row sized temporaries of the build, counted as if every row was
+        selected
+        """
+        n_rows = len(bin_ids)
+        int64 = np.dtype(np.int64).itemsize
+        itemsize = np.dtype(cls.tile_dtype(n_rows)).itemsize
+        tiles = sum(
+            (n_bins + 1) * (chart_n_bins + 1) * itemsize
+            for _, chart_n_bins in charts.values()
+        )
+        # sorted bin ids, then the int64 bin ids before and after the
+        # selection
+        kept = n_rows * bin_ids.dtype.itemsize
+        rows = 2 * n_rows * int64
+        # built one tile at a time: the selected bin ids of the chart, the
+        # two int64 arrays of `rows * shape[1] + chart_rows`, and the int64
+        # bincount before the cast to the tile dtype
+        build = max(
+            (
+                n_rows * chart_bin_ids.dtype.itemsize
+                + 2 * n_rows * int64
+                + (n_bins + 1) * (chart_n_bins + 1) * int64
+                for chart_bin_ids, chart_n_bins in charts.values()
+            ),
+            default=0,
+        )
+        return tiles + kept + rows + build
+
+    def counts(self, name, lo, hi):
+        """
+        bin counts of the chart `name` over the rows passing every filter
+        except the active chart's, and lo <= active column <= hi
+
+        Returns
+        -------
+        numpy array of length n_bins of the chart
+        """
+        tile = self.tiles[name]
+        n_bins = tile.shape[1] - 1
+        start, stop = self.index.positions(lo, hi)
+        if start >= stop:
+            return np.zeros(n_bins, dtype=tile.dtype)
+        first = int(self.sorted_bin_ids[start])
+        last = int(self.sorted_bin_ids[stop - 1])
+        # bins strictly between the edge bins are fully covered
+        if not self.cumulative:
+            counts = tile[first + 1 : last].sum(axis=0)
+        elif last - first > 1:
+            counts = tile[last - 1] - tile[first]
+        else:
+            counts = self.xp.zeros(n_bins + 1, dtype=tile.dtype)
+        # rows of the edge bins within the range
+        first_stop = min(
+            stop,
+            int(
+                self.xp.searchsorted(self.sorted_bin_ids, first, side="right")
+            ),
+        )
+        edges = [self.index.order[start:first_stop]]
+        if last != first:
+            last_start = max(
+                first_stop,
+                int(
+                    self.xp.searchsorted(
+                        self.sorted_bin_ids, last, side="left"
+                    )
+                ),
+            )
+            edges.append(self.index.order[last_start:stop])
+        rows = self.xp.concatenate(edges)
+        if self.selection is not None:
+            rows = rows[self.selection[rows]]
+        counts = counts + self.xp.bincount(
+            self.bin_ids[name][rows], minlength=n_bins + 1
+        )
+        counts = counts[:n_bins]
+        return cp.asnumpy(counts) if self.xp is cp else counts
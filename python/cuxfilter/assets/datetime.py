@@ -129,3 +129,124 @@ def transform_stride_type(stride_type, typ):
     if typ in CUDF_DATETIME_TYPES:
         return CUDF_TIMEDELTA_TYPE
     return stride_type
+
+
+# calendar periods of bin_by, weeks start on Monday
+CALENDAR_UNITS = ("minute", "hour", "day", "week", "month")
+
+_units_per_second = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}
+
+
+def _days_to_months(days):
+    """
+    months since 1970-01 of days since the epoch, integer arithmetic of the
+    proleptic Gregorian calendar (civil_from_days)
+    """
+    days = days + 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (
+        day_of_era
+        - day_of_era // 1460
+        + day_of_era // 36524
+        - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    # months starting in March
+    month = (5 * day_of_year + 2) // 153
+    after_february = (month >= 10).astype("int64")
+    year = year_of_era + era * 400 + after_february
+    return (year - 1970) * 12 + month + 2 - 12 * after_february
+
+
+def calendar_bin_ids(dates, bin_by):
+    """
+    Description:
+        calendar period of every date, counted from the epoch: minutes,
+        hours, days, weeks or months since 1970-01-01, by vectorized
+        integer truncation of the int64 epoch values
+    -------------------------------------------
+    Input:
+        dates = cudf.Series | dask_cudf.Series | pandas.Series | numpy
+            array of datetimes
+        bin_by = one of CALENDAR_UNITS
+    -------------------------------------------
+
+    Ouput:
+        int64 series or array, null for null dates (NaN for pandas)
+    """
+    if isinstance(dates, pd.Series) and dates.hasnans:
+        return calendar_bin_ids(dates.dropna(), bin_by).reindex(dates.index)
+    per_day = _units_per_second[np.datetime_data(dates.dtype)[0]] * 86400
+    values = dates.astype("int64")
+    if bin_by == "minute":
+        return values // (per_day // 1440)
+    if bin_by == "hour":
+        return values // (per_day // 24)
+    days = values // per_day
+    if bin_by == "day":
+        return days
+    if bin_by == "week":
+        # 1970-01-01 is a Thursday
+        return (days + 3) // 7
+    if bin_by == "month":
+        return _days_to_months(days)
+    raise ValueError(f"bin_by must be one of {CALENDAR_UNITS}, not {bin_by!r}")
+
+
+def calendar_bin_id(date, bin_by, typ):
+    """
+    Description:
+        calendar period of a single date, see calendar_bin_ids
+    """
+    date = np.array([pd.Timestamp(date).to_datetime64()]).astype(typ)
+    return int(calendar_bin_ids(date, bin_by)[0])
+
+
+def calendar_bin_starts(first, n_bins, bin_by, typ):
+    """
+    Description:
+        start of the calendar periods first, first + 1, ...,
+        first + n_bins - 1
+    -------------------------------------------
+    Input:
+        first = calendar period id, see calendar_bin_ids
+        n_bins = number of periods
+        bin_by = one of CALENDAR_UNITS
+        typ = datetime dtype of the output
+    -------------------------------------------
+
+    Ouput:
+        numpy datetime64 array of length n_bins
+    """
+    ids = np.arange(first, first + n_bins, dtype="int64")
+    if bin_by == "week":
+        return (ids * 7 - 3).astype("datetime64[D]").astype(typ)
+    unit = {"minute": "m", "hour": "h", "day": "D", "month": "M"}[bin_by]
+    return ids.astype(f"datetime64[{unit}]").astype(typ)
+
+
+def snap_to_calendar(dates, bin_by, typ):
+    """
+    Description:
+        widen a (lo, hi) range of dates to the calendar periods they fall
+        in: from the start of the period of lo to the last time unit of
+        the period of hi
+    -------------------------------------------
+    Input:
+        dates = (lo, hi) of datetime-like objects
+        bin_by = one of CALENDAR_UNITS
+        typ = datetime dtype of the column
+    -------------------------------------------
+
+    Ouput:
+        (lo, hi) pd.Timestamp tuple
+    """
+    lo, hi = (calendar_bin_id(date, bin_by, typ) for date in dates)
+    lo_start = calendar_bin_starts(lo, 1, bin_by, typ)[0]
+    hi_end = calendar_bin_starts(hi + 1, 1, bin_by, typ)[0] - np.timedelta64(
+        1, np.datetime_data(np.dtype(typ))[0]
+    )
+    return pd.Timestamp(lo_start), pd.Timestamp(hi_end)
@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+
+# packed bitfield dtypes, in the order they are widened to as filters are
+# added to the dashboard
+BITFIELD_DTYPES = (np.uint8, np.uint16, np.uint32, np.uint64)
+MAX_FILTERS = 64
+
+
+def _bitfield_dtype(n_filters):
+    for dtype in BITFIELD_DTYPES:
+        if n_filters <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError(
+        f"FilterBitfield supports at most {MAX_FILTERS} active filters"
+    )
+
+
+class FilterBitfield:
+    """
+    Crossfilter.js style filter state for a dashboard.
+
+    Every row owns one packed unsigned integer, with one bit per active
+    chart or widget filter. A set bit means the row is rejected by that
+    filter, so a row is selected when all of its bits are clear.
+
+    Updating a filter only rewrites that filter's bit, and the selection
+    for "all filters except one" is a single masked comparison, without
+    re-evaluating any of the other filters.
+
+    The bitfield lives on the same device as the masks it is fed with:
+    cupy arrays for cudf backed dashboards and numpy arrays for
+    pandas/numpy data.
+
+    Parameters
+    ----------
+    n_rows: int
+        number of rows in the dashboard dataframe
+    xp: module, default numpy
+        array module (numpy or cupy) used to allocate the bitfield
+    pool: cuxfilter.assets.buffer_pool.BufferPool, optional
+        pool of the row sized scratch arrays used by set_filter and
+        selection, allocated on every call when None
+    """
+
+    def __init__(self, n_rows, xp=np, pool=None):
+        self.n_rows = n_rows
+        self.xp = xp
+        self.pool = pool
+        self.bits = xp.zeros(n_rows, dtype=BITFIELD_DTYPES[0])
+        # filter name -> bit position
+        self._positions = {}
+        # filter name -> monotonic version, bumped on every rewrite
+        self._versions = {}
+        self._version_counter = 0
+
+    @property
+    def filters(self):
+        """
+        names of the active filters
+        """
+        return list(self._positions.keys())
+
+    @property
+    def versions(self):
+        """
+        dictionary of filter name -> version, a value that changes every
+        time the filter bit is rewritten and is never reused
+        """
+        return dict(self._versions)
+
+    def __contains__(self, name):
+        return name in self._positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def _free_position(self):
+        used = set(self._positions.values())
+        position = next(i for i in range(len(used) + 1) if i not in used)
+        if position >= MAX_FILTERS:
+            raise ValueError(
+                f"FilterBitfield supports at most {MAX_FILTERS} active filters"
+            )
+        dtype = _bitfield_dtype(position + 1)
+        if dtype != self.bits.dtype:
+            self.bits = self.bits.astype(dtype)
+        return position
+
+    def _bit(self, position):
+        return self.bits.dtype.type(1) << self.bits.dtype.type(position)
+
+    def _scratch(self):
+        if self.pool is None:
+            return self.xp.empty(self.n_rows, dtype=self.bits.dtype)
+        return self.pool.acquire(self.n_rows, self.bits.dtype, self.xp)
+
+    def _release(self, scratch):
+        if self.pool is not None:
+            self.pool.release(scratch)
+
+    def set_filter(self, name, mask):
+        """
+        Set or replace the filter `name` with a boolean mask of the selected
+        rows. Only the bit owned by `name` is rewritten.
+
+        Parameters
+        ----------
+        name: str
+            chart/widget name owning the filter
+        mask: array-like of bool, length n_rows
+            True for rows passing the filter
+        """
+        mask = self.xp.asarray(mask, dtype=bool)
+        if mask.shape != self.bits.shape:
+            raise ValueError(
+                f"filter mask for {name} has {mask.shape[0]} rows, "
+                f"expected {self.n_rows}"
+            )
+        if name not in self._positions:
+            self._positions[name] = self._free_position()
+        position = self._positions[name]
+        dtype = self.bits.dtype.type
+
+        scratch = self._scratch()
+        self.xp.logical_not(mask, out=scratch)
+        self.xp.left_shift(scratch, dtype(position), out=scratch)
+        self.bits &= ~self._bit(position)
+        self.bits |= scratch
+        self._release(scratch)
+        self._version_counter += 1
+        self._versions[name] = self._version_counter
+
+    def remove_filter(self, name):
+        """
+        Remove the filter `name`, clearing its bit and releasing the bit
+        position for reuse.
+        """
+        position = self._positions.pop(name, None)
+        if position is not None:
+            self.bits &= ~self._bit(position)
+            self._versions.pop(name, None)
+
+    def clear(self):
+        """
+        Remove all filters.
+        """
+        self.bits[:] = 0
+        self._positions.clear()
+        self._versions.clear()
+
+    def selection(self, exclude=None):
+        """
+        Boolean mask of the rows passing every active filter, except the
+        filters named in `exclude`.
+
+        Parameters
+        ----------
+        exclude: str or list of str, optional
+            filter name(s) to ignore, e.g. the chart's own filter for
+            "all filters except my own" semantics
+
+        Returns
+        -------
+        boolean array of length n_rows, or None if no filter applies
+        (all rows selected)
+        """
+        if isinstance(exclude, str):
+            exclude = [exclude]
+        ignored = [
+            self._positions[name]
+            for name in exclude or []
+            if name in self._positions
+        ]
+        if len(ignored) == len(self._positions):
+            return None
+        if len(ignored) == 0:
+            return self.bits == 0
+
+        keep = self.bits.dtype.type(0)
+        for position in ignored:
+            keep |= self._bit(position)
+        scratch = self._scratch()
+        self.xp.bitwise_and(self.bits, ~keep, out=scratch)
+        selection = scratch == 0
+        self._release(scratch)
+        return selection
+
+
+def exclusive_masks(masks):
+    """
+    For every mask i, return the AND of all the other masks, computed from
+    one prefix pass and one suffix pass over the masks (O(N) ANDs instead
+    of O(N^2) for N filters).
+
+    Parameters
+    ----------
+    masks: list of boolean arrays or Series
+
+    Returns
+    -------
+    list of the same length as masks, holding None where there are no
+    other masks to combine
+    """
+    n = len(masks)
+    # prefix[i] = masks[0] & ... & masks[i - 1]
+    prefix = [None] * (n + 1)
+    # suffix[i] = masks[i] & ... & masks[n - 1]
+    suffix = [None] * (n + 1)
+    for i in range(n):
+        prefix[i + 1] = masks[i] if prefix[i] is None else prefix[i] & masks[i]
+    for i in reversed(range(n)):
+        suffix[i] = (
+            masks[i] if suffix[i + 1] is None else masks[i] & suffix[i + 1]
+        )
+
+    result = []
+    for i in range(n):
+        left, right = prefix[i], suffix[i + 1]
+        if left is None or right is None:
+            result.append(right if left is None else left)
+        else:
+            result.append(left & right)
+    return result
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+
+class FilteredView:
+    """
+    Filtered view of the dashboard data: the base dataframe along with the
+    selected rows, instead of a filtered copy of every column.
+
+    Charts gather only the columns they read through `project`, so a chart
+    over one column of a wide dataframe does not pay for copying the other
+    columns. Projections are cached on the view, charts reading the same
+    columns share a single gather.
+
+    Parameters
+    ----------
+    data: cudf.DataFrame, dask_cudf.DataFrame or pandas.DataFrame
+        base dataframe, or the lazily filtered dataframe for dask_cudf
+    selection: boolean mask or integer row ids array, optional
+        selected rows of data, None when every row is selected
+    """
+
+    def __init__(self, data, selection=None):
+        self.data = data
+        self.selection = selection
+        self._projections = {}
+
+    @property
+    def columns(self):
+        return self.data.columns
+
+    def __len__(self):
+        if self.selection is None:
+            return len(self.data)
+        if self.selection.dtype == bool:
+            return int(self.selection.sum())
+        return len(self.selection)
+
+    def project(self, columns=None):
+        """
+        gather the selected rows of `columns`
+
+        Parameters
+        ----------
+        columns: list of str, optional
+            columns to gather, all the columns if None
+
+        Returns
+        -------
+        dataframe of the same type as the base data
+        """
+        key = None if columns is None else tuple(columns)
+        if key not in self._projections:
+            frame = self.data if columns is None else self.data[list(columns)]
+            if self.selection is not None:
+                if self.selection.dtype == bool:
+                    frame = frame[self.selection]
+                else:
+                    frame = frame.take(self.selection)
+            self._projections[key] = frame
+        return self._projections[key]
+
+    def materialize(self):
+        """
+        filtered copy of the whole dataframe
+        """
+        return self.project(None)
@@ -3,6 +3,18 @@
 
 from .gpu_histogram import (
     calc_value_counts,
+    calc_bincount,
+    calc_bin_ids,
+    calc_bin_values,
+    calc_bincount_from_bin_ids,
     calc_groupby,
+    calc_groupby_states,
+    merge_groupby_states,
+    finalize_groupby_states,
+    calc_sketch_groupby_states,
+    merge_sketch_groupby_states,
+    finalize_sketch_groupby_states,
+    calc_dense_groupby,
     aggregated_column_unique,
 )
+from .fused_aggregation import calc_fused_bincount, stack_bin_ids
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import warnings
+
+import cupy as cp
+import numba
+import numpy as np
+from numba import cuda
+from numba.core.errors import NumbaPerformanceWarning
+
+
+@numba.njit
+def _fused_bincount_cpu(bin_ids, offsets, mask, use_mask, out):
+    """
+    CPU kernel: one pass over the rows, incrementing the bin of every chart
+    of each selected row.
+    """
+    for row in range(bin_ids.shape[0]):
+        if use_mask and not mask[row]:
+            continue
+        for k in range(bin_ids.shape[1]):
+            out[offsets[k] + bin_ids[row, k]] += 1
+
+
+@cuda.jit
+def _fused_bincount_gpu(bin_ids, offsets, mask, use_mask, out):
+    """
+    CUDA kernel: each thread reads the bin ids of one row, contiguous in
+    memory, and increments the bin of every chart.
+    """
+    row = cuda.grid(1)
+    if row < bin_ids.shape[0] and (not use_mask or mask[row]):
+        for k in range(bin_ids.shape[1]):
+            cuda.atomic.add(out, offsets[k] + bin_ids[row, k], 1)
+
+
+def stack_bin_ids(bin_ids):
+    """
+    description:
+        stack the bin id columns of K charts into one row-major array, so a
+        single scan reads the K bin ids of a row together
+    input:
+        - bin_ids: list of cupy or numpy arrays (see calc_bin_ids)
+    output:
+        (n_rows, K) array, of the widest dtype of the inputs
+    """
+    xp = cp.get_array_module(bin_ids[0])
+    return xp.ascontiguousarray(xp.stack(bin_ids, axis=1))
+
+
+def calc_fused_bincount(stacked_bin_ids, n_bins, selection=None, pool=None):
+    """
+    description:
+        dense histograms of K charts in a single pass over the selected
+        rows, with a numba CPU kernel for numpy arrays and a numba CUDA
+        kernel for cupy arrays
+    input:
+        - stacked_bin_ids: (n_rows, K) output of stack_bin_ids
+        - n_bins: list of the K numbers of bins
+        - selection: boolean mask or row ids of the selected rows, None for
+          every row
+        - pool: BufferPool the counts buffer is taken from, optional
+    output:
+        list of K numpy frequency arrays, of length n_bins[k]
+    """
+    xp = cp.get_array_module(stacked_bin_ids)
+    if selection is not None and selection.dtype != bool:
+        # row ids, gather the selected rows
+        stacked_bin_ids = stacked_bin_ids[selection]
+        selection = None
+    use_mask = selection is not None
+    mask = selection if use_mask else xp.zeros(1, dtype=bool)
+    # one extra bin per chart for the null rows
+    sizes = np.asarray(n_bins, dtype=np.int64) + 1
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    if pool is None:
+        out = xp.zeros(int(sizes.sum()), dtype=np.int64)
+    else:
+        out = pool.acquire(int(sizes.sum()), np.int64, xp, fill=0)
+    n_rows = stacked_bin_ids.shape[0]
+
+    if xp is cp:
+        threads_per_block = 256
+        blocks_per_grid = (
+            n_rows + (threads_per_block - 1)
+        ) // threads_per_block
+        if blocks_per_grid > 0:
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    "ignore",
+                    category=NumbaPerformanceWarning,
+                    message="Grid size.*result in GPU under-utilization",
+                )
+                _fused_bincount_gpu[blocks_per_grid, threads_per_block](
+                    stacked_bin_ids, cp.asarray(offsets), mask, use_mask, out
+                )
+        counts = cp.asnumpy(out)
+    else:
+        _fused_bincount_cpu(stacked_bin_ids, offsets, mask, use_mask, out)
+        counts = out.copy() if pool is not None else out
+    if pool is not None:
+        pool.release(out)
+
+    return [
+        counts[offset : offset + size - 1]
+        for offset, size in zip(offsets, sizes)
+    ]
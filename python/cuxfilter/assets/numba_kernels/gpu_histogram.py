@@ -2,10 +2,16 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import cudf
+import cupy as cp
+import cupyx
+import dask
 import dask_cudf
-import gc
+import numpy as np
+import pandas as pd
 from typing import Type
 
+from .. import datetime as dt
+from ..aggregate_states import AGGREGATE_STATES, aggregate_state, is_sketch
 from ...charts.core.core_chart import BaseChart
 
 
@@ -53,59 +59,589 @@ def calc_value_counts(a_gpu, stride, min_value, custom_binning=False):
     return (val_index, val_count.to_numpy())
 
 
+def _datetime_units(value, dtype):
+    """
+    value of the datetime scalar or timedelta `value` in the integer time
+    units of the datetime `dtype`
+    """
+    unit = np.datetime_data(dtype)[0]
+    if isinstance(value, np.timedelta64) or hasattr(value, "to_timedelta64"):
+        return np.timedelta64(value) / np.timedelta64(1, unit)
+    return int(np.datetime64(value, unit).astype("int64"))
+
+
+def _scratch(pool, size, dtype, xp):
+    """
+    row sized scratch array, taken from the BufferPool `pool` if any
+    """
+    if pool is None:
+        return xp.empty(size, dtype=dtype)
+    return pool.acquire(size, dtype, xp)
+
+
+def _release(pool, *buffers):
+    if pool is not None:
+        for buffer in buffers:
+            pool.release(buffer)
+
+
+def _bincount(a, stride, min_value, n_bins, pool=None):
+    """
+    counts of the values of `a` in `n_bins` fixed-width bins, computed with
+    cupy for gpu data and numpy otherwise, the bin ids are computed in
+    place in scratch arrays of `pool`
+    """
+    xp = cp if isinstance(a, (cudf.Series, cp.ndarray)) else np
+    if hasattr(a, "dropna"):
+        # cudf or pandas Series, cudf only drops NaN once they are nulls
+        if isinstance(a, cudf.Series) and a.dtype.kind == "f":
+            a = a.nans_to_nulls()
+        a = a.dropna()
+        if a.dtype.kind == "M":
+            a = a.astype("int64")
+        a = a.values if xp is cp else a.to_numpy()
+    elif a.dtype.kind == "M":
+        # numpy only, NaT views as the minimum int64
+        a = a[~np.isnat(a)].view("int64")
+    elif a.dtype.kind == "f":
+        a = a[~xp.isnan(a)]
+    scratch = _scratch(pool, len(a), np.float64, xp)
+    bin_ids = _scratch(pool, len(a), np.int64, xp)
+    xp.subtract(a, min_value, out=scratch)
+    xp.divide(scratch, stride, out=scratch)
+    xp.rint(scratch, out=scratch)
+    xp.clip(scratch, 0, n_bins - 1, out=scratch)
+    bin_ids[...] = scratch
+    counts = xp.bincount(bin_ids, minlength=n_bins)
+    _release(pool, scratch, bin_ids)
+    return cp.asnumpy(counts) if xp is cp else counts
+
+
+def _calendar_bincount(a, bin_by, min_value, n_bins):
+    """
+    counts of the values of `a` in `n_bins` calendar periods from the period
+    of min_value
+    """
+    bin_ids = calc_bin_ids(a, bin_by, min_value, n_bins)
+    # the extra bin counts the null rows
+    counts = cp.get_array_module(bin_ids).bincount(
+        bin_ids, minlength=n_bins + 1
+    )[:n_bins]
+    return cp.asnumpy(counts)
+
+
+def calc_bin_values(dtype, stride, min_value, n_bins):
+    """
+    description:
+        centers of the fixed-width bins of calc_bincount, or the starts of
+        the calendar periods for a calendar unit stride
+    input:
+        - dtype: dtype of the binned column
+        - stride: bin width, or one of cuxfilter.assets.datetime.
+          CALENDAR_UNITS for datetime columns
+        - min_value: min value of the column, center of the first bin
+        - n_bins: number of bins
+    output:
+        ndarray of length n_bins, datetime64 for datetime columns
+    """
+    if stride in dt.CALENDAR_UNITS:
+        return dt.calendar_bin_starts(
+            dt.calendar_bin_id(min_value, stride, dtype), n_bins, stride, dtype
+        )
+    if dtype.kind == "M":
+        return (
+            _datetime_units(min_value, dtype)
+            + np.rint(
+                np.arange(n_bins) * _datetime_units(stride, dtype)
+            ).astype("int64")
+        ).astype(dtype)
+    return np.arange(n_bins) * stride + min_value
+
+
+def calc_bincount(a_gpu, stride, min_value, n_bins, pool=None):
+    """
+    description:
+        fixed-width histogram by direct addressing: the values are rounded
+        to their bin ids, clipped to [0, n_bins - 1], and counted with a
+        single bincount. Unlike calc_value_counts the output has a fixed
+        length, empty bins included
+    input:
+        - a_gpu: cudf.Series, dask_cudf.Series, pandas.Series, cupy or
+          numpy array -> 1-column only
+        - stride: bin width
+        - min_value: min value of the column, center of the first bin
+        - n_bins: number of bins
+        - pool: BufferPool the scratch arrays are taken from, optional
+    output:
+        bin_values(ndarray), frequencies(ndarray), both of length n_bins
+    """
+    dtype = a_gpu.dtype
+    bin_values = calc_bin_values(dtype, stride, min_value, n_bins)
+    if stride in dt.CALENDAR_UNITS:
+        if isinstance(a_gpu, dask_cudf.Series):
+            counts = sum(
+                dask.compute(
+                    *[
+                        dask.delayed(_calendar_bincount)(
+                            part, stride, min_value, n_bins
+                        )
+                        for part in a_gpu.to_delayed()
+                    ]
+                )
+            )
+        else:
+            counts = _calendar_bincount(a_gpu, stride, min_value, n_bins)
+        return (bin_values, counts)
+    if dtype.kind == "M":
+        min_value = _datetime_units(min_value, dtype)
+        stride = _datetime_units(stride, dtype)
+
+    if isinstance(a_gpu, dask_cudf.Series):
+        counts = sum(
+            dask.compute(
+                *[
+                    dask.delayed(_bincount)(
+                        part, stride, min_value, n_bins, pool
+                    )
+                    for part in a_gpu.to_delayed()
+                ]
+            )
+        )
+    else:
+        counts = _bincount(a_gpu, stride, min_value, n_bins, pool)
+
+    return (bin_values, counts)
+
+
+def calc_bin_ids(a_gpu, stride, min_value, n_bins):
+    """
+    description:
+        fixed-width bin id of every row, the bins of calc_bincount. Null
+        rows get the id n_bins
+    input:
+        - a_gpu: cudf.Series or pandas.Series -> 1-column only
+        - stride: bin width, or one of cuxfilter.assets.datetime.
+          CALENDAR_UNITS for datetime columns
+        - min_value: min value of the column, center of the first bin
+        - n_bins: number of bins
+    output:
+        int16 (int32 for more than 32766 bins) cupy array for cudf,
+        numpy array for pandas
+    """
+    if stride in dt.CALENDAR_UNITS:
+        # calendar periods since the period of min_value
+        bin_ids = (
+            dt.calendar_bin_ids(a_gpu, stride)
+            - dt.calendar_bin_id(min_value, stride, a_gpu.dtype)
+        ).clip(0, n_bins - 1)
+    else:
+        if a_gpu.dtype.kind == "M":
+            min_value = _datetime_units(min_value, a_gpu.dtype)
+            stride = _datetime_units(stride, a_gpu.dtype)
+            a_gpu = a_gpu.astype("int64")
+        bin_ids = ((a_gpu - min_value) / stride).round().clip(0, n_bins - 1)
+    if isinstance(bin_ids, cudf.Series):
+        bin_ids = bin_ids.nans_to_nulls()
+    bin_ids = bin_ids.fillna(n_bins).astype(
+        np.int16 if n_bins < np.iinfo(np.int16).max else np.int32
+    )
+    if isinstance(bin_ids, cudf.Series):
+        return bin_ids.values
+    return bin_ids.to_numpy()
+
+
+def calc_bincount_from_bin_ids(
+    bin_ids, dtype, stride, min_value, n_bins, selection=None
+):
+    """
+    description:
+        fixed-width histogram of the selected rows from their precomputed
+        bin ids, a single gather and bincount
+    input:
+        - bin_ids: output of calc_bin_ids
+        - dtype: dtype of the binned column
+        - stride: bin width
+        - min_value: min value of the column, center of the first bin
+        - n_bins: number of bins
+        - selection: boolean mask or row ids of the selected rows, None
+          for every row
+    output:
+        bin_values(ndarray), frequencies(ndarray), both of length n_bins
+    """
+    if selection is not None:
+        bin_ids = bin_ids[selection]
+    xp = cp if isinstance(bin_ids, cp.ndarray) else np
+    # the extra bin counts the null rows
+    counts = xp.bincount(bin_ids, minlength=n_bins + 1)[:n_bins]
+    return (
+        calc_bin_values(dtype, stride, min_value, n_bins),
+        cp.asnumpy(counts) if xp is cp else counts,
+    )
+
+
+def calc_groupby_states(df, x, agg):
+    """
+    description:
+        aggregate states (see cuxfilter.assets.aggregate_states) of every
+        group of a cudf or pandas frame, one groupby for all the aggregated
+        columns
+    input:
+        - df
+        - x: group key column
+        - agg: dict column -> aggregate function, with a mergeable state
+    output:
+        dataframe with the x column and the `{column}_{field}` columns of
+        the states
+    """
+    states = {
+        column: AGGREGATE_STATES[agg_fn] for column, agg_fn in agg.items()
+    }
+    partials = df.groupby(x, sort=False).agg(
+        {
+            column: list(state.groupby_fns.values())
+            for column, state in states.items()
+        }
+    )
+    partials.columns = [f"{column}_{fn}" for column, fn in partials.columns]
+    for column, state in states.items():
+        state.from_groupby(partials, column)
+    return partials.reset_index()
+
+
+def merge_groupby_states(partials, x, agg):
+    """
+    description:
+        merge the group states of several chunks, computed by
+        calc_groupby_states, with a single groupby over their concatenation
+    input:
+        - partials: list of group state frames
+        - x: group key column
+        - agg: dict column -> aggregate function
+    output:
+        group state frame of the union of the chunks, sorted by x
+    """
+    states = {
+        column: AGGREGATE_STATES[agg_fn] for column, agg_fn in agg.items()
+    }
+    concat = (
+        cudf.concat if isinstance(partials[0], cudf.DataFrame) else pd.concat
+    )
+    partials = concat(partials, ignore_index=True)
+    for column, state in states.items():
+        state.merge_groups(partials, x, column)
+    return (
+        partials.groupby(x, sort=True)
+        .agg(
+            {
+                f"{column}_{field}": merge_fn
+                for column, state in states.items()
+                for field, merge_fn in state.merge_fns.items()
+            }
+        )
+        .reset_index()
+    )
+
+
+def finalize_groupby_states(combined, x, agg):
+    """
+    description:
+        read the aggregates of every group from a group state frame
+    input:
+        - combined: group state frame
+        - x: group key column
+        - agg: dict column -> aggregate function
+    output:
+        dataframe with the x column and one column per aggregate
+    """
+    result = combined[[x]].copy()
+    for column, agg_fn in agg.items():
+        result[column] = AGGREGATE_STATES[agg_fn].finalize_groups(
+            combined, column
+        )
+    return result
+
+
+def _factorize(keys):
+    """
+    group id of every key of a cudf or pandas Series (cupy or numpy array),
+    and the keys of the groups, as a Series
+    """
+    codes, uniques = keys.factorize()
+    return codes, uniques.to_series().reset_index(drop=True)
+
+
+def calc_sketch_groupby_states(df, x, agg):
+    """
+    description:
+        sketch states (see cuxfilter.assets.aggregate_states.is_sketch)
+        of every group of a cudf or pandas frame, one batched update of the
+        sketches of all the groups per aggregated column
+    input:
+        - df
+        - x: group key column, without nulls
+        - agg: dict column -> approximate aggregate function
+    output:
+        (keys of the groups, dict column -> state of the groups)
+    """
+    codes, keys = _factorize(df[x])
+    return keys, {
+        column: aggregate_state(agg_fn).from_groups(
+            df[column], codes, len(keys)
+        )
+        for column, agg_fn in agg.items()
+    }
+
+
+def merge_sketch_groupby_states(partials):
+    """
+    description:
+        merge the sketch states of several chunks, computed by
+        calc_sketch_groupby_states, after aligning their groups
+    input:
+        - partials: list of (keys, states)
+    output:
+        (keys of the groups, dict column -> state of the groups) of the
+        union of the chunks
+    """
+    all_keys = [keys for keys, _ in partials]
+    concat = cudf.concat if isinstance(all_keys[0], cudf.Series) else pd.concat
+    codes, keys = _factorize(concat(all_keys, ignore_index=True))
+    merged = {}
+    start = 0
+    for part_keys, states in partials:
+        part_codes = codes[start : start + len(part_keys)]
+        start += len(part_keys)
+        for column, state in states.items():
+            state = state.reindex(part_codes, len(keys))
+            merged[column] = (
+                merged[column].merge(state) if column in merged else state
+            )
+    return keys, merged
+
+
+def finalize_sketch_groupby_states(keys, states, x):
+    """
+    description:
+        read the approximate aggregates of every group from its sketch
+        states
+    input:
+        - keys: keys of the groups
+        - states: dict column -> state of the groups
+        - x: group key column
+    output:
+        dataframe with the x column and one column per aggregate, sorted
+        by x
+    """
+    frame = cudf.DataFrame if isinstance(keys, cudf.Series) else pd.DataFrame
+    result = frame({x: keys})
+    for column, state in states.items():
+        result[column] = state.finalize_sketch()
+    return result.sort_values(x).reset_index(drop=True)
+
+
 def calc_groupby(chart: Type[BaseChart], data, agg=None):
     """
     description:
-        main function to calculate histograms
+        main function to calculate histograms. For dask_cudf, every
+        partition is reduced to the aggregate states of its groups (see
+        cuxfilter.assets.aggregate_states) in one groupby over all the
+        aggregated columns, and the states are merged after a single
+        compute
     input:
         - chart
         - data
+        - agg: dict column -> aggregate function, default
+          {chart.y: chart.aggregate_fn}
     output:
-        frequencies(ndarray), bin_edge_values(ndarray)
+        dataframe with the x column and one column per aggregate, sorted
+        by x
     """
-    temp_df = data[[chart.x]].dropna(subset=[chart.x])
-
     if agg is None:
-        temp_df[chart.y] = data.dropna(subset=[chart.x])[chart.y]
+        agg = {chart.y: chart.aggregate_fn}
+    columns = [chart.x] + [column for column in agg if column != chart.x]
+    temp_df = data[columns].dropna(subset=[chart.x])
+
+    sketch_agg = {
+        column: agg_fn for column, agg_fn in agg.items() if is_sketch(agg_fn)
+    }
+    if sketch_agg:
+        # approximate aggregates, the groupbys cannot build their sketches
         if isinstance(temp_df, dask_cudf.DataFrame):
-            groupby_res = getattr(
-                temp_df.groupby(by=[chart.x], sort=True), chart.aggregate_fn
-            )()
-            groupby_res = groupby_res.reset_index().compute()
-        else:
-            groupby_res = temp_df.groupby(
-                by=[chart.x], sort=True, as_index=False
-            ).agg({chart.y: chart.aggregate_fn})
-    else:
-        for key, agg_fn in agg.items():
-            temp_df[key] = data[key]
-        if isinstance(data, dask_cudf.DataFrame):
-            groupby_res = None
-            for key, agg_fn in agg.items():
-                groupby_res_temp = getattr(
-                    temp_df[[chart.x, key]].groupby(chart.x, sort=True), agg_fn
-                )()
-                if groupby_res is None:
-                    groupby_res = groupby_res_temp.reset_index().compute()
-                else:
-                    groupby_res_temp = groupby_res_temp.reset_index().compute()
-                    groupby_res = groupby_res.merge(
-                        groupby_res_temp, on=chart.x
+            partials = dask.compute(
+                *[
+                    dask.delayed(calc_sketch_groupby_states)(
+                        part, chart.x, sketch_agg
                     )
-                del groupby_res_temp
-                gc.collect()
-            groupby_res = groupby_res
+                    for part in temp_df.to_delayed()
+                ]
+            )
         else:
-            groupby_res = temp_df.groupby(
-                by=[chart.x], sort=True, as_index=False
-            ).agg(agg)
+            partials = [
+                calc_sketch_groupby_states(temp_df, chart.x, sketch_agg)
+            ]
+        groupby_res = finalize_sketch_groupby_states(
+            *merge_sketch_groupby_states(partials), chart.x
+        )
+        exact_agg = {
+            column: agg_fn
+            for column, agg_fn in agg.items()
+            if column not in sketch_agg
+        }
+        if exact_agg:
+            groupby_res = calc_groupby(chart, data, exact_agg).merge(
+                groupby_res, on=chart.x
+            )
+        return (
+            groupby_res[[chart.x] + list(agg)]
+            .sort_values(chart.x)
+            .reset_index(drop=True)
+        )
 
-    del temp_df
-    gc.collect()
+    if isinstance(temp_df, dask_cudf.DataFrame):
+        if all(agg_fn in AGGREGATE_STATES for agg_fn in agg.values()):
+            groupby_res = finalize_groupby_states(
+                merge_groupby_states(
+                    dask.compute(
+                        *[
+                            dask.delayed(calc_groupby_states)(
+                                part, chart.x, agg
+                            )
+                            for part in temp_df.to_delayed()
+                        ]
+                    ),
+                    chart.x,
+                    agg,
+                ),
+                chart.x,
+                agg,
+            )
+        else:
+            groupby_res = (
+                temp_df.groupby(chart.x, sort=True)
+                .agg(agg)
+                .reset_index()
+                .compute()
+            )
+    else:
+        groupby_res = temp_df.groupby(
+            by=[chart.x], sort=True, as_index=False
+        ).agg(agg)
 
     return groupby_res
 
 
+def _to_array(series, dtype, na_value):
+    """
+    values of a cudf or pandas Series as a cupy or numpy array of `dtype`,
+    nulls replaced by `na_value`
+    """
+    if isinstance(series, cudf.Series):
+        return series.astype(dtype).to_cupy(na_value=na_value)
+    return series.to_numpy(dtype=dtype, na_value=na_value)
+
+
+def _dense_key_ids(x, keys, out, invalid):
+    """
+    write the position of every value of `x` in the dense key domain `keys`
+    to `out`, and whether it is null to `invalid`. Categorical columns use
+    their dictionary codes
+    """
+    if isinstance(x.dtype, (cudf.CategoricalDtype, pd.CategoricalDtype)):
+        ids, offset, null = _to_array(x.cat.codes, np.int64, -1), 0, -1
+    else:
+        null = np.iinfo(np.int64).min
+        ids, offset = _to_array(x, np.int64, null), int(keys[0])
+    xp = cp.get_array_module(ids)
+    xp.subtract(ids, offset, out=out)
+    xp.equal(ids, null, out=invalid)
+
+
+def calc_dense_groupby(chart: Type[BaseChart], data, keys, pool=None):
+    """
+    description:
+        groupby of chart.y by chart.x for a dense key domain, by direct
+        addressing: every row is scattered into a fixed-length array at the
+        position of its key, without sorting or hashing the keys. Empty keys
+        keep their position, with a count of 0 and a null value for the
+        other aggregates
+    input:
+        - chart
+        - data: cudf.DataFrame or pandas.DataFrame
+        - keys: ndarray, every key of the domain, consecutive integers or
+          the categories of a categorical column
+        - pool: BufferPool the row sized scratch arrays are taken from,
+          optional
+    output:
+        dataframe with the x column (keys) and the y column, for the
+        aggregate functions count, sum, min, max, mean, var and std, only
+        count for a non-numeric y
+    """
+    agg_fn = chart.aggregate_fn
+    x, y = data[chart.x], data[chart.y]
+    numeric = getattr(y.dtype, "kind", None) in ("i", "u", "f", "b")
+    if not numeric and agg_fn != "count":
+        raise TypeError(f"{agg_fn} of the non-numeric column {chart.y}")
+    xp = cp if isinstance(x, cudf.Series) else np
+    n_rows, n_keys = len(x), len(keys)
+    ids = _scratch(pool, n_rows, np.int64, xp)
+    invalid = _scratch(pool, n_rows, np.bool_, xp)
+    missing = _scratch(pool, n_rows, np.bool_, xp)
+    scratch = [ids, invalid, missing]
+    _dense_key_ids(x, keys, ids, invalid)
+    if numeric:
+        values = _to_array(y, np.float64, np.nan)
+        xp.isnan(values, out=missing)
+    else:
+        # count of a string, datetime or categorical y, only its nulls matter
+        missing[...] = _to_array(y.isna(), np.bool_, True)
+    xp.logical_or(invalid, missing, out=invalid)
+    # rows with a null key or value are counted in the extra slot n_keys,
+    # dropped from the result, instead of compacting the arrays
+    xp.copyto(ids, n_keys, where=invalid)
+
+    def bincount(weights=None):
+        return xp.bincount(ids, weights=weights, minlength=n_keys + 1)[:n_keys]
+
+    count = bincount()
+    if agg_fn == "count":
+        result = count
+    elif agg_fn in ("min", "max"):
+        result = xp.full(n_keys + 1, np.inf if agg_fn == "min" else -np.inf)
+        if xp is cp:
+            getattr(cupyx, f"scatter_{agg_fn}")(result, ids, values)
+        else:
+            # the NaN values all land in the dropped slot
+            with np.errstate(invalid="ignore"):
+                getattr(np, f"{agg_fn}imum").at(result, ids, values)
+        result = result[:n_keys]
+        result[count == 0] = np.nan
+    else:
+        total = bincount(values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = total / count
+            if agg_fn == "sum":
+                result = total
+            elif agg_fn == "mean":
+                result = mean
+            else:
+                # second pass over the deviations from the key means
+                deviations = _scratch(pool, n_rows, np.float64, xp)
+                scratch.append(deviations)
+                xp.take(xp.append(mean, 0.0), ids, out=deviations)
+                xp.subtract(values, deviations, out=deviations)
+                xp.square(deviations, out=deviations)
+                m2 = bincount(deviations)
+                result = xp.where(count > 1, m2 / (count - 1), np.nan)
+                if agg_fn == "std":
+                    result = xp.sqrt(result)
+    _release(pool, *scratch)
+    if agg_fn == "sum" and data[chart.y].dtype.kind in "iu":
+        result = result.astype(data[chart.y].dtype)
+
+    frame = cudf.DataFrame if xp is cp else pd.DataFrame
+    return frame({chart.x: keys, chart.y: result})
+
+
 def aggregated_column_unique(chart: Type[BaseChart], data):
     """
     description:
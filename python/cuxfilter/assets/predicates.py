@@ -0,0 +1,248 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Filter predicate IR.
+
+Charts describe their active filter as a small tree of predicates instead
+of a DataFrame.query string with `@` local variables, so the dashboard can
+evaluate it directly as vectorized column operations, without re-parsing
+it on every interaction, and reuse the result while the predicate stays
+unchanged. Bounds and values are held by the nodes, so charts sharing a
+column cannot overwrite each other's variables.
+"""
+
+import numpy as np
+import pandas as pd
+from abc import ABC, abstractmethod
+from functools import reduce
+
+from .cudf_utils import to_mask_array
+
+
+def _column(df, column):
+    """
+    return the column as a numpy array for pandas frames with numpy
+    dtypes, skipping the index alignment of Series operations, and as a
+    Series otherwise
+    """
+    series = df[column]
+    if isinstance(series, pd.Series) and isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    return series
+
+
+def _and(left, right):
+    # masks resolved through a sorted index are arrays, convert the Series
+    # operand when both kinds are mixed
+    if hasattr(left, "isin") != hasattr(right, "isin"):
+        left, right = to_mask_array(left), to_mask_array(right)
+    return left & right
+
+
+def _point_in_polygon(x, y, geometry):
+    """
+    numpy ray casting point in polygon test, matching the cuda kernel used
+    for cudf frames
+    """
+    polygon = np.asarray(geometry, dtype=np.float64).reshape(-1, 2)
+    inside = np.zeros(len(x), dtype=bool)
+    if len(polygon) < 3:
+        return inside
+    x_j, y_j = polygon[-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for x_i, y_i in polygon:
+            crosses = (y_i > y) != (y_j > y)
+            x_intersection = x_i + (y - y_i) * (x_j - x_i) / (y_j - y_i)
+            inside ^= crosses & (x < x_intersection)
+            x_j, y_j = x_i, y_i
+    return inside
+
+
+class Predicate(ABC):
+    """
+    Base class of the predicate nodes.
+    """
+
+    columns = ()
+
+    @abstractmethod
+    def _key(self):
+        """
+        tuple identifying the node, used for equality and repr
+        """
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._key() == other._key()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __repr__(self):
+        return f"{type(self).__name__}{self._key()!r}"
+
+    @abstractmethod
+    def evaluate(self, df, range_mask=None):
+        """
+        evaluate the predicate on df
+
+        Parameters
+        ----------
+        df: cudf.DataFrame, dask_cudf.DataFrame or pandas.DataFrame
+        range_mask: callable(column, lo, hi), optional
+            resolves Range nodes through a sorted index, returns None to
+            fall back to the column comparison
+
+        Returns
+        -------
+        boolean Series or array of the rows passing the predicate
+        """
+
+
+class Range(Predicate):
+    """
+    lo <= column <= hi
+    """
+
+    def __init__(self, column, lo, hi):
+        self.column = column
+        self.lo = lo
+        self.hi = hi
+        self.columns = (column,)
+
+    def _key(self):
+        return (self.column, self.lo, self.hi)
+
+    def evaluate(self, df, range_mask=None):
+        if range_mask is not None:
+            mask = range_mask(self.column, self.lo, self.hi)
+            if mask is not None:
+                return mask
+        values = _column(df, self.column)
+        return (values >= self.lo) & (values <= self.hi)
+
+
+class Equals(Predicate):
+    """
+    column == value
+    """
+
+    def __init__(self, column, value):
+        self.column = column
+        self.value = value
+        self.columns = (column,)
+
+    def _key(self):
+        return (self.column, self.value)
+
+    def evaluate(self, df, range_mask=None):
+        return _column(df, self.column) == self.value
+
+
+class In(Predicate):
+    """
+    column in values, or column not in values with negate=True
+    """
+
+    def __init__(self, column, values, negate=False):
+        self.column = column
+        self.values = tuple(values)
+        self.negate = negate
+        self.columns = (column,)
+
+    def _key(self):
+        return (self.column, self.values, self.negate)
+
+    def evaluate(self, df, range_mask=None):
+        values = _column(df, self.column)
+        if isinstance(values, np.ndarray):
+            mask = np.isin(values, self.values)
+        else:
+            mask = values.isin(list(self.values))
+        return ~mask if self.negate else mask
+
+
+class Mask(Predicate):
+    """
+    precomputed boolean Series/array of the selected rows, compared by
+    identity
+    """
+
+    def __init__(self, mask):
+        self.mask = mask
+
+    def _key(self):
+        return (id(self.mask),)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.mask is other.mask
+
+    def evaluate(self, df, range_mask=None):
+        return self.mask
+
+
+class Polygon(Predicate):
+    """
+    (x, y) inside the polygon described by geometry, a list of (x, y)
+    vertices. A mask already computed by the chart for the geometry can be
+    passed to avoid evaluating the polygon twice.
+    """
+
+    def __init__(self, x, y, geometry, mask=None):
+        self.x = x
+        self.y = y
+        self.geometry = np.asarray(geometry, dtype=np.float64)
+        self.mask = mask
+        self.columns = (x, y)
+
+    def _key(self):
+        return (self.x, self.y, self.geometry.tobytes())
+
+    def evaluate(self, df, range_mask=None):
+        if self.mask is not None:
+            return self.mask
+        if isinstance(df, pd.DataFrame):
+            return _point_in_polygon(
+                df[self.x].to_numpy(dtype=np.float64),
+                df[self.y].to_numpy(dtype=np.float64),
+                self.geometry,
+            )
+        # imported here, charts import this module
+        from ..charts.core.non_aggregate.utils import point_in_polygon
+
+        args = (self.x, self.y, self.geometry)
+        if hasattr(df, "map_partitions"):
+            return df.map_partitions(point_in_polygon, *args)
+        return point_in_polygon(df, *args)
+
+
+class And(Predicate):
+    """
+    conjunction of predicates
+    """
+
+    def __init__(self, *predicates):
+        self.predicates = predicates
+        self.columns = tuple(
+            column for predicate in predicates for column in predicate.columns
+        )
+
+    def _key(self):
+        return tuple((type(p), p._key()) for p in self.predicates)
+
+    def __eq__(self, other):
+        return (
+            type(self) is type(other)
+            and len(self.predicates) == len(other.predicates)
+            and all(a == b for a, b in zip(self.predicates, other.predicates))
+        )
+
+    def evaluate(self, df, range_mask=None):
+        return reduce(
+            _and, (p.evaluate(df, range_mask) for p in self.predicates)
+        )
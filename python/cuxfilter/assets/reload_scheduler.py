@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+
+import panel as pn
+
+
+class ReloadScheduler:
+    """
+    Coalesces the reload requests of a dashboard.
+
+    Every chart/widget callback requests a reload instead of running one.
+    A request marks the filter state dirty, and at most one reload runs per
+    `interval` milliseconds, reading the latest filter state when it runs,
+    so a burst of events (e.g. dragging a range slider) collapses into the
+    reloads of its latest states.
+
+    The first request after an idle period reloads immediately, the
+    following ones are deferred to the end of the interval, on the event
+    loop of the bokeh document, so that the chart models and the filter
+    state are only updated from the document's thread. Without a document
+    there is no event loop to defer to, and deferred reloads run
+    synchronously.
+
+    Parameters
+    ----------
+    reload_fn: callable
+        reloads the charts with the current filter state
+    interval: float, default 0
+        minimum interval in milliseconds between two reloads, 0 reloads
+        synchronously on every request
+    """
+
+    def __init__(self, reload_fn, interval=0):
+        self.reload_fn = reload_fn
+        self.interval = interval
+        self.events_received = 0
+        self.reloads_executed = 0
+        self._dirty = False
+        self._pending = False
+        self._running = False
+        self._last_reload = None
+        self._timer = None
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self):
+        """
+        dictionary of the number of reload requests received and the number
+        of reloads executed
+        """
+        return {
+            "events_received": self.events_received,
+            "reloads_executed": self.reloads_executed,
+        }
+
+    def _delay(self):
+        if self.interval <= 0 or self._last_reload is None:
+            return 0
+        elapsed = (time.monotonic() - self._last_reload) * 1000
+        return max(0, self.interval - elapsed)
+
+    def _schedule(self, delay):
+        doc = pn.state.curdoc
+        if doc is None:
+            self.flush()
+        elif doc.session_context is not None:
+            doc.add_timeout_callback(self.flush, delay)
+        else:
+            # notebook comms, panel runs the callback on the kernel's
+            # event loop
+            self._timer = pn.state.add_periodic_callback(
+                self.flush, period=max(1, int(delay)), count=1
+            )
+
+    def _next(self, force=False):
+        """
+        with the lock held, decide what to do with a dirty state: returns
+        "run", or the delay in milliseconds to schedule a flush at, or None
+        when a flush is already pending or a reload is running
+        """
+        if not self._dirty or self._pending or self._running:
+            return None
+        delay = 0 if force else self._delay()
+        if delay > 0:
+            self._pending = True
+            return delay
+        self._running = True
+        return "run"
+
+    def request(self):
+        """
+        request a reload of the charts with the latest filter state
+        """
+        with self._lock:
+            self.events_received += 1
+            self._dirty = True
+            action = self._next()
+        self._dispatch(action)
+
+    def flush(self):
+        """
+        run the deferred reload, if the state is still dirty
+        """
+        with self._lock:
+            self._pending = False
+            self._timer = None
+            action = self._next(force=True)
+        self._dispatch(action)
+
+    def _dispatch(self, action):
+        if action == "run":
+            self._run()
+        elif action is not None:
+            self._schedule(action)
+
+    def _run(self):
+        try:
+            with self._lock:
+                self._dirty = False
+                self._last_reload = time.monotonic()
+                self.reloads_executed += 1
+            self.reload_fn()
+        finally:
+            with self._lock:
+                self._running = False
+                # requests received while reloading
+                action = self._next()
+        self._dispatch(action)
+
+    def cancel(self):
+        """
+        drop the pending requests
+        """
+        with self._lock:
+            self._dirty = False
+            self._pending = False
+            if self._timer is not None:
+                self._timer.stop()
+                self._timer = None
@@ -0,0 +1,276 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Rollup pyramid of a datetime column: the number of rows, and the count,
+sum, min and max of value columns, per minute, per hour and per day.
+
+The minute level is built with one groupby of the rows on their minute,
+the hour and day levels are reduced from the level below, so the rows are
+read once. A zoom window on the datetime axis is then answered from the
+coarsest level that still splits it into enough bins, by slicing the
+sorted period ids of that level, without touching the rows.
+"""
+
+import cudf
+import dask_cudf
+import numpy as np
+import pandas as pd
+
+from . import datetime as dt
+
+# finest first, with the number of periods of the level below per period
+ROLLUP_LEVELS = ("minute", "hour", "day")
+_PERIODS_PER = {"hour": 60, "day": 24}
+
+ROLLUP_AGGREGATES = ("count", "sum", "min", "max", "mean")
+
+_ID_COLUMN = "__cuxfilter_rollup_id"
+_ROWS_COLUMN = "__cuxfilter_rollup_rows"
+
+
+class Rollup:
+    """
+    Aggregates of the non-empty periods of one level, host arrays sorted by
+    period id.
+
+    Parameters
+    ----------
+    ids: numpy int64 array
+        calendar period ids, see datetime.calendar_bin_ids
+    rows: numpy int64 array
+        number of rows of every period
+    columns: dict
+        column -> {"count", "sum", "min", "max"} -> numpy array of the
+        non-null values of every period
+    """
+
+    def __init__(self, ids, rows, columns):
+        self.ids = ids
+        self.rows = rows
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.ids)
+
+    def coarsen(self, factor):
+        """
+        rollup of the periods grouping `factor` consecutive periods of self
+        """
+        ids = self.ids // factor
+        if len(ids) == 0:
+            return type(self)(ids, self.rows, self.columns)
+        # first period of every group, the ids are sorted
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+
+        def reduce(ufunc, values):
+            return ufunc.reduceat(values, starts)
+
+        return type(self)(
+            ids[starts],
+            reduce(np.add, self.rows),
+            {
+                column: {
+                    "count": reduce(np.add, values["count"]),
+                    "sum": reduce(np.add, values["sum"]),
+                    # fmin / fmax skip the NaN of periods without values
+                    "min": reduce(np.fmin, values["min"]),
+                    "max": reduce(np.fmax, values["max"]),
+                }
+                for column, values in self.columns.items()
+            },
+        )
+
+    def window(self, first, n_periods, aggregate_fn="count", column=None):
+        """
+        dense aggregate of the periods first, ..., first + n_periods - 1,
+        0 (count, sum) or NaN (min, max, mean) for the empty periods
+
+        Parameters
+        ----------
+        first: int
+            calendar period id
+        n_periods: int
+        aggregate_fn: str, default "count"
+            one of ROLLUP_AGGREGATES
+        column: str, optional
+            value column, the number of rows is counted if None
+        """
+        lo, hi = np.searchsorted(self.ids, [first, first + n_periods])
+        if column is None:
+            values = self.rows[lo:hi]
+        elif aggregate_fn == "mean":
+            values = self.columns[column]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = values["sum"][lo:hi] / values["count"][lo:hi]
+        else:
+            values = self.columns[column][aggregate_fn][lo:hi]
+        empty = 0 if aggregate_fn in ("count", "sum") else np.nan
+        result = np.full(
+            n_periods,
+            empty,
+            dtype=values.dtype if empty == 0 else np.float64,
+        )
+        result[self.ids[lo:hi] - first] = values
+        return result
+
+
+def _to_host(result):
+    if isinstance(result, (dask_cudf.DataFrame, dask_cudf.Series)):
+        result = result.compute()
+    if isinstance(result, (cudf.DataFrame, cudf.Series)):
+        result = result.to_pandas()
+    return result
+
+
+class RollupPyramid:
+    """
+    Minute, hour and day rollups of a datetime column, built by
+    `from_data`.
+
+    Parameters
+    ----------
+    levels: dict
+        level of ROLLUP_LEVELS -> Rollup
+    dtype: datetime dtype of the column
+    """
+
+    def __init__(self, levels, dtype):
+        self.levels = levels
+        self.dtype = dtype
+
+    @classmethod
+    def from_data(cls, data, x, columns=()):
+        """
+        Roll up the rows of `data` on their minute, hour and day.
+
+        Parameters
+        ----------
+        data: cudf.DataFrame, dask_cudf.DataFrame or pandas.DataFrame
+        x: str
+            datetime column, the rows with a null x are left out
+        columns: list of str, optional
+            value columns aggregated along with the number of rows
+        """
+        columns = list(columns)
+        frame = data[[x, *columns]]
+        frame = frame[frame[x].notna()]
+        frame = frame[columns].assign(
+            **{
+                _ID_COLUMN: dt.calendar_bin_ids(frame[x], "minute"),
+                _ROWS_COLUMN: 1,
+            }
+        )
+        grouped = _to_host(
+            frame.groupby(_ID_COLUMN).agg(
+                {
+                    _ROWS_COLUMN: ["sum"],
+                    **{
+                        column: ["count", "sum", "min", "max"]
+                        for column in columns
+                    },
+                }
+            )
+        ).sort_index()
+        rollup = Rollup(
+            grouped.index.to_numpy(dtype=np.int64),
+            grouped[(_ROWS_COLUMN, "sum")].to_numpy(dtype=np.int64),
+            {
+                column: {
+                    fn: grouped[(column, fn)].to_numpy(
+                        dtype=np.int64 if fn == "count" else np.float64,
+                        na_value=0 if fn == "count" else np.nan,
+                    )
+                    for fn in ("count", "sum", "min", "max")
+                }
+                for column in columns
+            },
+        )
+        levels = {}
+        for level in ROLLUP_LEVELS:
+            if level in _PERIODS_PER:
+                rollup = rollup.coarsen(_PERIODS_PER[level])
+            levels[level] = rollup
+        return cls(levels, data[x].dtype)
+
+    def period_range(self, lo, hi, level):
+        """
+        first period id and number of periods of `level` overlapping
+        lo <= x <= hi
+        """
+        first = dt.calendar_bin_id(lo, level, self.dtype)
+        return first, dt.calendar_bin_id(hi, level, self.dtype) - first + 1
+
+    def level_for(self, lo, hi, data_points):
+        """
+        coarsest level splitting lo <= x <= hi into at least `data_points`
+        periods, the finest level for shorter windows
+        """
+        for level in reversed(ROLLUP_LEVELS):
+            if self.period_range(lo, hi, level)[1] >= data_points:
+                return level
+        return ROLLUP_LEVELS[0]
+
+    def covers(self, lo, hi, level):
+        """
+        whether the rows of lo <= x <= hi are exactly the rows of whole
+        periods of `level`, so that a range filter on x is answered by the
+        rollup of that level
+        """
+        ids = self.levels[level].ids
+        if len(ids) == 0:
+            return True
+        first, n_periods = self.period_range(lo, hi, level)
+        snapped = dt.snap_to_calendar((lo, hi), level, self.dtype)
+        # the bounds at the resolution of the column
+        lo, hi = (
+            pd.Timestamp(
+                pd.Timestamp(bound).to_datetime64().astype(self.dtype)
+            )
+            for bound in (lo, hi)
+        )
+        # bounds outside of the rolled up periods do not split any period
+        return (first < ids[0] or snapped[0] == lo) and (
+            first + n_periods - 1 > ids[-1] or snapped[1] == hi
+        )
+
+    def aggregate(
+        self, lo, hi, level, aggregate_fn="count", column=None, ranges=()
+    ):
+        """
+        Aggregate of the periods of `level` overlapping lo <= x <= hi.
+
+        Parameters
+        ----------
+        lo, hi: datetime-like bounds of the window
+        level: str
+            one of ROLLUP_LEVELS
+        aggregate_fn: str, default "count"
+            one of ROLLUP_AGGREGATES
+        column: str, optional
+            value column, the number of rows is counted if None
+        ranges: list of (lo, hi), optional
+            range filters on x covered by the level (see covers), the
+            periods outside of any of them are empty
+
+        Returns
+        -------
+        (the n_periods + 1 period boundaries, numpy datetime64 array of
+        `dtype`, the aggregates, numpy array of length n_periods)
+        """
+        first, n_periods = self.period_range(lo, hi, level)
+        values = self.levels[level].window(
+            first, n_periods, aggregate_fn, column
+        )
+        ids = np.arange(first, first + n_periods)
+        for range_lo, range_hi in ranges:
+            range_first, range_n_periods = self.period_range(
+                range_lo, range_hi, level
+            )
+            values[
+                (ids < range_first) | (ids >= range_first + range_n_periods)
+            ] = 0 if aggregate_fn in ("count", "sum") else np.nan
+        return (
+            dt.calendar_bin_starts(first, n_periods + 1, level, self.dtype),
+            values,
+        )
@@ -0,0 +1,326 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Row sample of the dashboard data, and the estimators of the chart
+aggregates over the whole data from the sampled rows.
+
+Every row is kept independently with an inclusion probability p (Poisson
+sampling), the same for every row of a uniform sample and set per stratum
+of a stratified sample, so that the rare strata are represented. A sampled
+row stands for w = 1 / p rows of the data, the estimates are the
+Horvitz-Thompson estimates: sum(w) rows, sum(w * value) for a sum, and
+their ratio for a mean. Their variance is estimated by
+sum(w * (w - 1) * value ** 2), and the confidence intervals use the normal
+approximation.
+"""
+
+from statistics import NormalDist
+
+import cudf
+import cupy as cp
+import dask_cudf
+import numpy as np
+
+# column of the sample holding the weight w of every sampled row
+WEIGHT_COLUMN = "__cuxfilter_sample_weight"
+
+
+def _z_score(confidence):
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def _sample_partition(
+    df, fractions, default_fraction, stratify_by, seed, partition_info=None
+):
+    """
+    rows of one partition kept with their inclusion probability, with the
+    weight column
+    """
+    if partition_info is not None:
+        # independent draws for every dask partition
+        seed = seed + partition_info["number"]
+    xp = cp if isinstance(df, cudf.DataFrame) else np
+    if stratify_by is None:
+        fraction = xp.full(len(df), default_fraction)
+    else:
+        fraction = (
+            df[stratify_by]
+            .map(fractions)
+            .astype("float64")
+            .fillna(default_fraction)
+        )
+        fraction = (
+            fraction.values
+            if isinstance(fraction, cudf.Series)
+            else fraction.to_numpy()
+        )
+    keep = xp.random.RandomState(seed).random_sample(len(df)) < fraction
+    return df[keep].assign(**{WEIGHT_COLUMN: 1 / fraction[keep]})
+
+
+class RowSample:
+    """
+    Uniform or stratified row sample of a dataframe, built by
+    `from_data`.
+
+    Parameters
+    ----------
+    data: cudf.DataFrame or pandas.DataFrame
+        sampled rows, with the WEIGHT_COLUMN column
+    size: int
+        requested number of rows
+    stratify_by: str, optional
+        column the sample is stratified by
+    seed: int
+    """
+
+    def __init__(self, data, size, stratify_by=None, seed=0):
+        self.data = data
+        self.size = size
+        self.stratify_by = stratify_by
+        self.seed = seed
+
+    def __len__(self):
+        return len(self.data)
+
+    @classmethod
+    def from_data(cls, data, size, stratify_by=None, seed=0, min_rows=100):
+        """
+        Sample about `size` rows of `data`.
+
+        Parameters
+        ----------
+        data: cudf.DataFrame, dask_cudf.DataFrame or pandas.DataFrame
+        size: int
+            expected number of sampled rows
+        stratify_by: str, optional
+            column whose values define the strata. Every stratum is sampled
+            at the rate of the whole data, but keeps at least about
+            `min_rows` rows, or all of its rows if it has fewer, so the
+            aggregates of rare values are estimated from enough rows
+        seed: int, default 0
+        min_rows: int, default 100
+
+        Returns
+        -------
+        RowSample, holding in-memory data for dask_cudf.DataFrame
+        """
+        n_rows = len(data)
+        default_fraction = min(1.0, size / n_rows) if n_rows > 0 else 1.0
+        fractions = None
+        if stratify_by is not None:
+            counts = data[stratify_by].value_counts()
+            if isinstance(counts, dask_cudf.Series):
+                counts = counts.compute()
+            if isinstance(counts, cudf.Series):
+                counts = counts.to_pandas()
+            fractions = {
+                key: min(1.0, max(default_fraction, min_rows / count))
+                for key, count in counts.items()
+            }
+        args = (fractions, default_fraction, stratify_by, seed)
+        if isinstance(data, dask_cudf.DataFrame):
+            sample = data.map_partitions(
+                _sample_partition,
+                *args,
+                meta=data._meta.assign(**{WEIGHT_COLUMN: np.float64()}),
+            ).compute()
+        else:
+            sample = _sample_partition(data, *args)
+        return cls(sample, size, stratify_by=stratify_by, seed=seed)
+
+    def matches(self, size, stratify_by=None, seed=0):
+        """
+        whether the sample was built with these parameters
+        """
+        return (self.size, self.stratify_by, self.seed) == (
+            size,
+            stratify_by,
+            seed,
+        )
+
+
+def sample_weights(view):
+    """
+    weights of the selected rows of a FilteredView of the sample
+    """
+    return view.project([WEIGHT_COLUMN])[WEIGHT_COLUMN]
+
+
+def _interval(estimate, variance, confidence):
+    half_width = _z_score(confidence) * variance**0.5
+    return estimate - half_width, estimate + half_width
+
+
+def estimate_aggregate(values, weights, aggregate_fn, confidence=0.95):
+    """
+    estimate of an aggregate of the whole data from the sampled values
+
+    Parameters
+    ----------
+    values: cudf.Series or pandas.Series
+    weights: cudf.Series or pandas.Series
+        weights of the sampled rows, aligned with values
+    aggregate_fn: str
+        one of ESTIMATED_AGGREGATES
+    confidence: float, default 0.95
+
+    Returns
+    -------
+    estimate, (lower, upper) bounds of the confidence interval, NaN for
+    min, max, var and std
+    """
+    valid = values.notna()
+    values, weights = values[valid], weights[valid]
+    variance = np.nan
+    if aggregate_fn == "count":
+        estimate = float(weights.sum())
+        variance = float((weights * (weights - 1)).sum())
+    elif aggregate_fn == "sum":
+        estimate = float((weights * values).sum())
+        variance = float((weights * (weights - 1) * values**2).sum())
+    elif aggregate_fn in ("mean", "var", "std"):
+        total = float(weights.sum())
+        if total == 0:
+            return np.nan, (np.nan, np.nan)
+        estimate = float((weights * values).sum()) / total
+        if aggregate_fn == "mean":
+            # linearized variance of the ratio estimate
+            variance = (
+                float(
+                    (weights * (weights - 1) * (values - estimate) ** 2).sum()
+                )
+                / total**2
+            )
+        else:
+            estimate = (
+                float((weights * (values - estimate) ** 2).sum()) / (total - 1)
+                if total > 1
+                else np.nan
+            )
+            if aggregate_fn == "std":
+                estimate = estimate**0.5
+    else:
+        # the extremes of the sample bound the extremes of the data
+        estimate = getattr(values, aggregate_fn)()
+        return estimate, (np.nan, np.nan)
+    return estimate, _interval(estimate, variance, confidence)
+
+
+def estimate_groups(keys, values, weights, aggregate_fn, confidence=0.95):
+    """
+    estimate of an aggregate for every group of the whole data, from the
+    sampled rows
+
+    Parameters
+    ----------
+    keys: cudf.Series or pandas.Series
+        group key of the sampled rows, rows with a null key are dropped
+    values: cudf.Series or pandas.Series
+    weights: cudf.Series or pandas.Series
+    aggregate_fn: str
+        one of ESTIMATED_AGGREGATES
+    confidence: float, default 0.95
+
+    Returns
+    -------
+    dataframe with the keys and the estimates, and the dataframe of the
+    keys and the lower and upper bounds of the confidence intervals, both
+    sorted by key
+    """
+    valid = keys.notna() & values.notna()
+    w = weights[valid]
+    df = type(keys.to_frame())(
+        {
+            "key": keys[valid],
+            "w": w,
+            "w2": w * (w - 1),
+            "v": values[valid].astype("float64"),
+        }
+    )
+    df["wv"] = df["w"] * df["v"]
+    if aggregate_fn in ("mean", "var", "std"):
+        grouped = df.groupby("key", sort=False)
+        # residuals to the estimated mean of the group
+        mean = grouped["wv"].transform("sum") / grouped["w"].transform("sum")
+        df["v"] = df["v"] - mean
+    df["w2v2"] = df["w2"] * df["v"] ** 2
+    df["wv2"] = df["w"] * df["v"] ** 2
+    grouped = df.groupby("key", sort=True)
+    variance = None
+    if aggregate_fn in ("min", "max"):
+        # the extremes of the sample bound the extremes of the data
+        estimate = grouped["v"].agg(aggregate_fn)
+    else:
+        sums = grouped[["w", "w2", "wv", "w2v2", "wv2"]].sum()
+        if aggregate_fn == "count":
+            estimate, variance = sums["w"], sums["w2"]
+        elif aggregate_fn == "sum":
+            estimate, variance = sums["wv"], sums["w2v2"]
+        elif aggregate_fn == "mean":
+            # linearized variance of the ratio estimate
+            estimate = sums["wv"] / sums["w"]
+            variance = sums["w2v2"] / sums["w"] ** 2
+        else:
+            estimate = (sums["wv2"] / (sums["w"] - 1)).where(sums["w"] > 1)
+            if aggregate_fn == "std":
+                estimate = estimate**0.5
+    if variance is None:
+        lower = upper = estimate * np.nan
+    else:
+        lower, upper = _interval(estimate, variance, confidence)
+    frame = type(df)
+    group_keys = estimate.index.to_series().reset_index(drop=True)
+    result = frame(
+        {
+            keys.name: group_keys,
+            values.name: estimate.reset_index(drop=True),
+        }
+    )
+    intervals = frame(
+        {
+            keys.name: group_keys,
+            "lower": lower.reset_index(drop=True),
+            "upper": upper.reset_index(drop=True),
+        }
+    )
+    return result, intervals
+
+
+def estimate_bincount(bin_ids, weights, n_bins, confidence=0.95):
+    """
+    estimate of the fixed-width histogram of the whole data from the bin
+    ids of the sampled rows
+
+    Parameters
+    ----------
+    bin_ids: cupy or numpy array, output of calc_bin_ids
+    weights: cudf.Series or pandas.Series
+    n_bins: int
+    confidence: float, default 0.95
+
+    Returns
+    -------
+    estimated counts, (lower, upper) bounds of the confidence intervals,
+    numpy arrays of length n_bins
+    """
+    weights = (
+        weights.values
+        if isinstance(weights, cudf.Series)
+        else weights.to_numpy()
+    )
+    xp = cp.get_array_module(bin_ids)
+    # the extra bin holds the null rows
+    counts = xp.bincount(bin_ids, weights=weights, minlength=n_bins + 1)
+    variance = xp.bincount(
+        bin_ids, weights=weights * (weights - 1), minlength=n_bins + 1
+    )
+    counts, variance = (
+        cp.asnumpy(counts[:n_bins]),
+        cp.asnumpy(variance[:n_bins]),
+    )
+    return counts, _interval(counts, variance, confidence)
+
+
+ESTIMATED_AGGREGATES = ("count", "sum", "mean", "min", "max", "var", "std")
@@ -0,0 +1,321 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Mergeable sketches of the approximate aggregates.
+
+HyperLogLog estimates the number of distinct values from the maximum
+number of leading zeros of the value hashes in 2 ** precision registers,
+with a relative standard error of about 1.04 / sqrt(2 ** precision).
+t-digest estimates quantiles from weighted centroids of the sorted values,
+small at the tails and large around the median (merging t-digest, k1 scale
+function), so that extreme quantiles stay accurate.
+
+Both hold the sketches of `n_groups` groups at once. A chunk of rows is
+added in one batched pass, given the group id of every row (every row in
+group 0 by default), and the sketches of two chunks merge group by group.
+The sketches of chunks with different groups are first aligned with
+reindex.
+"""
+
+import cudf
+import cupy as cp
+import cupyx
+import numpy as np
+import pandas as pd
+
+
+def _hash64(values):
+    """
+    64-bit hash of the values of a cudf or pandas Series, as a cupy or
+    numpy uint64 array
+    """
+    if isinstance(values, cudf.Series):
+        return values.hash_values(method="xxhash64").values
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def _leading_zeros(x, xp):
+    """
+    number of leading zero bits of every value of a non-zero uint64 array,
+    by binary search over the bit positions
+    """
+    count = xp.zeros(x.shape, dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        small = x < np.uint64(1 << (64 - shift))
+        count += small.astype(np.uint8) * np.uint8(shift)
+        x = xp.where(small, x << np.uint64(shift), x)
+    return count
+
+
+def _to_host_float(values):
+    """
+    values of a cudf or pandas Series as a float64 numpy array
+    """
+    if isinstance(values, cudf.Series):
+        values = values.astype("float64").to_pandas()
+    return values.to_numpy(dtype=np.float64)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct count sketches of `n_groups` groups.
+
+    Parameters
+    ----------
+    registers: numpy or cupy array of shape (n_groups, 2 ** precision)
+    precision: int
+    """
+
+    def __init__(self, registers, precision):
+        self.registers = registers
+        self.precision = precision
+
+    @property
+    def n_groups(self):
+        return self.registers.shape[0]
+
+    @classmethod
+    def from_values(cls, values, group_ids=None, n_groups=1, precision=12):
+        """
+        Sketches of a chunk of values, one hash and one scatter-max of all
+        the rows.
+
+        Parameters
+        ----------
+        values: cudf.Series or pandas.Series, without nulls
+        group_ids: cupy or numpy int array, optional
+            group of every value, all the values are in group 0 if None
+        n_groups: int, default 1
+        precision: int, default 12
+        """
+        hashes = _hash64(values)
+        xp = cp.get_array_module(hashes)
+        n_registers = 1 << precision
+        index = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+        # the bit after the index bits caps the rank at 64 - precision + 1
+        # and keeps the shifted hash non-zero
+        rank = (
+            _leading_zeros(
+                (hashes << np.uint64(precision))
+                | np.uint64(1 << (precision - 1)),
+                xp,
+            )
+            + 1
+        )
+        if group_ids is not None:
+            index = xp.asarray(group_ids, dtype=np.int64) * n_registers + index
+        # cupyx.scatter_max does not support uint8
+        registers = xp.zeros(
+            n_groups * n_registers, dtype=np.uint8 if xp is np else np.int32
+        )
+        if xp is cp:
+            cupyx.scatter_max(registers, index, rank.astype(np.int32))
+        else:
+            np.maximum.at(registers, index, rank)
+        return cls(registers.reshape(n_groups, n_registers), precision)
+
+    def merge(self, other):
+        """
+        sketches of the union of the values of self and other
+        """
+        xp = cp.get_array_module(self.registers)
+        return type(self)(
+            xp.maximum(self.registers, xp.asarray(other.registers)),
+            self.precision,
+        )
+
+    def reindex(self, codes, n_groups):
+        """
+        sketches moved to the groups `codes` of `n_groups` groups, the
+        other groups are empty
+        """
+        xp = cp.get_array_module(self.registers)
+        registers = xp.zeros(
+            (n_groups, self.registers.shape[1]), dtype=self.registers.dtype
+        )
+        registers[xp.asarray(codes)] = self.registers
+        return type(self)(registers, self.precision)
+
+    def estimate(self):
+        """
+        estimated number of distinct values of every group, numpy array
+        """
+        registers = cp.asnumpy(self.registers).astype(np.float64)
+        n_registers = registers.shape[1]
+        alpha = 0.7213 / (1 + 1.079 / n_registers)
+        estimate = alpha * n_registers**2 / np.sum(np.exp2(-registers), axis=1)
+        zeros = np.sum(registers == 0, axis=1)
+        # linear counting for small cardinalities
+        with np.errstate(divide="ignore"):
+            small = n_registers * np.log(n_registers / zeros)
+        return np.where(
+            (estimate <= 2.5 * n_registers) & (zeros > 0), small, estimate
+        )
+
+
+def _k_scale(q, compression):
+    return compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+
+
+def _compress(groups, means, weights, n_groups, compression):
+    """
+    merge the centroids whose center falls in the same unit of the k scale
+    of their group, returns the centroids sorted by group and mean
+    """
+    order = np.lexsort((means, groups))
+    groups, means, weights = groups[order], means[order], weights[order]
+    totals = np.bincount(groups, weights=weights, minlength=n_groups)
+    group_starts = np.concatenate(([0.0], np.cumsum(totals)[:-1]))
+    centers = np.cumsum(weights) - weights / 2 - group_starts[groups]
+    q = np.clip(centers / np.maximum(totals[groups], 1e-300), 0, 1)
+    units = np.floor(_k_scale(q, compression)).astype(np.int64)
+    new = np.ones(len(groups), dtype=bool)
+    new[1:] = (groups[1:] != groups[:-1]) | (units[1:] != units[:-1])
+    cluster = np.cumsum(new) - 1
+    merged_weights = np.bincount(cluster, weights=weights)
+    merged_means = np.bincount(cluster, weights=weights * means)
+    return groups[new], merged_means / merged_weights, merged_weights
+
+
+class TDigest:
+    """
+    t-digest quantile sketches of `n_groups` groups: centroids (group, mean,
+    weight) sorted by group and mean, and the exact min and max of every
+    group.
+
+    Parameters
+    ----------
+    groups, means, weights: numpy arrays of the centroids
+    mins, maxs: numpy arrays of length n_groups
+    compression: float
+        about compression / 2 centroids are kept per group
+    """
+
+    def __init__(self, groups, means, weights, mins, maxs, compression):
+        self.groups = groups
+        self.means = means
+        self.weights = weights
+        self.mins = mins
+        self.maxs = maxs
+        self.compression = compression
+
+    @property
+    def n_groups(self):
+        return len(self.mins)
+
+    @classmethod
+    def from_values(cls, values, group_ids=None, n_groups=1, compression=200):
+        """
+        Sketches of a chunk of values, one sort of all the rows.
+
+        Parameters
+        ----------
+        values: cudf.Series or pandas.Series, without nulls
+        group_ids: cupy or numpy int array, optional
+            group of every value, all the values are in group 0 if None
+        n_groups: int, default 1
+        compression: float, default 200
+        """
+        values = _to_host_float(values)
+        groups = (
+            np.zeros(len(values), dtype=np.int64)
+            if group_ids is None
+            else cp.asnumpy(group_ids).astype(np.int64)
+        )
+        mins = np.full(n_groups, np.inf)
+        maxs = np.full(n_groups, -np.inf)
+        np.minimum.at(mins, groups, values)
+        np.maximum.at(maxs, groups, values)
+        return cls(
+            *_compress(
+                groups, values, np.ones(len(values)), n_groups, compression
+            ),
+            mins,
+            maxs,
+            compression,
+        )
+
+    def merge(self, other):
+        """
+        sketches of the union of the values of self and other
+        """
+        return type(self)(
+            *_compress(
+                np.concatenate((self.groups, other.groups)),
+                np.concatenate((self.means, other.means)),
+                np.concatenate((self.weights, other.weights)),
+                self.n_groups,
+                self.compression,
+            ),
+            np.minimum(self.mins, other.mins),
+            np.maximum(self.maxs, other.maxs),
+            self.compression,
+        )
+
+    def reindex(self, codes, n_groups):
+        """
+        sketches moved to the groups `codes` of `n_groups` groups, the
+        other groups are empty
+        """
+        codes = cp.asnumpy(codes)
+        mins = np.full(n_groups, np.inf)
+        maxs = np.full(n_groups, -np.inf)
+        mins[codes], maxs[codes] = self.mins, self.maxs
+        return type(self)(
+            *_compress(
+                codes[self.groups],
+                self.means,
+                self.weights,
+                n_groups,
+                self.compression,
+            ),
+            mins,
+            maxs,
+            self.compression,
+        )
+
+    def quantile(self, q):
+        """
+        estimated q-quantile of every group, NaN for empty groups, numpy
+        array
+        """
+        result = np.full(self.n_groups, np.nan)
+        sizes = np.bincount(self.groups, minlength=self.n_groups)
+        present = np.flatnonzero(sizes)
+        if len(present) == 0:
+            return result
+        sizes = sizes[present]
+        # the knots of every group, interpolated between: the exact min,
+        # the centroid centers and the exact max, at their cumulative
+        # weight over all the groups so the knots are sorted
+        cumulative = np.cumsum(self.weights)
+        ends = cumulative[np.cumsum(sizes) - 1]
+        totals = np.bincount(
+            self.groups, weights=self.weights, minlength=self.n_groups
+        )[present]
+        starts = ends - totals
+        first = np.cumsum(sizes + 2) - sizes - 2
+        last = first + sizes + 1
+        centers = (
+            np.arange(len(self.means))
+            + 1
+            + 2 * np.repeat(np.arange(len(present)), sizes)
+        )
+        positions = np.empty(len(self.means) + 2 * len(present))
+        values = np.empty_like(positions)
+        positions[first], values[first] = starts, self.mins[present]
+        positions[centers] = cumulative - self.weights / 2
+        values[centers] = self.means
+        positions[last], values[last] = ends, self.maxs[present]
+        targets = starts + q * totals
+        right = np.clip(
+            np.searchsorted(positions, targets, side="right"),
+            first + 1,
+            last,
+        )
+        left = right - 1
+        result[present] = values[left] + (targets - positions[left]) * (
+            values[right] - values[left]
+        ) / (positions[right] - positions[left])
+        return result
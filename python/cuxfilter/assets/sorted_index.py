@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import cupy as cp
+import numpy as np
+
+from ..charts.constants import CUDF_DATETIME_TYPES
+
+
+class SortedIndex:
+    """
+    Sorted index of a single column: the argsort of the column along with
+    the sorted values, so that an inclusive range predicate
+    `lo <= column <= hi` resolves to two binary searches.
+
+    Datetime columns are indexed on their int64 epoch view, in the unit of
+    the column.
+
+    Parameters
+    ----------
+    values: cupy.ndarray or numpy.ndarray
+        column values, without nulls
+    dtype: dtype, optional
+        dtype of the original column, used to convert range bounds for
+        datetime columns
+    """
+
+    def __init__(self, values, dtype=None):
+        self.xp = cp.get_array_module(values)
+        self.dtype = dtype if dtype is not None else values.dtype
+        self.order = self.xp.argsort(values, kind="stable")
+        self.sorted_values = values[self.order]
+
+    @classmethod
+    def from_series(cls, series):
+        """
+        build a SortedIndex from a cudf/pandas Series, returns None if the
+        series contains nulls
+        """
+        if series.isna().any():
+            return None
+        dtype = series.dtype
+        if dtype in CUDF_DATETIME_TYPES:
+            series = series.astype("int64")
+        return cls(series.values, dtype=dtype)
+
+    def __len__(self):
+        return len(self.order)
+
+    def to_key(self, value):
+        """
+        convert a range bound to the key space of the index
+        """
+        if self.dtype in CUDF_DATETIME_TYPES:
+            unit = np.datetime_data(np.dtype(self.dtype))[0]
+            return int(np.datetime64(value, unit).astype("int64"))
+        return value
+
+    def positions(self, lo, hi):
+        """
+        return the (start, stop) slice of the sorted order holding the rows
+        with lo <= value <= hi
+        """
+        start = self.xp.searchsorted(
+            self.sorted_values, self.to_key(lo), side="left"
+        )
+        stop = self.xp.searchsorted(
+            self.sorted_values, self.to_key(hi), side="right"
+        )
+        start, stop = int(start), int(stop)
+        return start, max(start, stop)
+
+    def range_mask(self, lo, hi):
+        """
+        boolean mask of the rows with lo <= value <= hi
+        """
+        return RangeSelection(self).update(lo, hi).copy()
+
+
+class RangeSelection:
+    """
+    Incrementally maintained boolean mask of a range predicate over a
+    SortedIndex.
+
+    Moving the bounds only flips the rows between the old and the new
+    bounds in the sorted order, so dragging a slider handle costs
+    O(delta) instead of O(n).
+
+    Parameters
+    ----------
+    index: SortedIndex
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.mask = index.xp.zeros(len(index), dtype=bool)
+        self.start = 0
+        self.stop = 0
+
+    def _set(self, start, stop, value):
+        if start < stop:
+            self.mask[self.index.order[start:stop]] = value
+
+    def update(self, lo, hi):
+        """
+        move the selection to lo <= value <= hi and return the updated
+        mask. The mask is owned by the RangeSelection and is modified in
+        place by the next update.
+        """
+        start, stop = self.index.positions(lo, hi)
+        # rows leaving the selection, on either side
+        self._set(self.start, min(self.stop, start), False)
+        self._set(max(self.start, stop), self.stop, False)
+        # rows entering the selection, on either side
+        self._set(start, min(stop, self.start), True)
+        self._set(max(start, self.stop), stop, True)
+        self.start, self.stop = start, stop
+        return self.mask
@@ -16,6 +16,9 @@ def bar(
     title="",
     autoscaling=True,
     unselected_alpha=0.1,
+    top_n=None,
+    bin_by=None,
+    rollups=False,
     **library_specific_params,
 ):
     """
@@ -33,6 +36,8 @@ def bar(
     add_interaction: {True, False},  default True
 
     aggregate_fn: {'count', 'mean'},  default 'count'
+        or an approximate aggregate: 'approx_nunique', 'approx_median', or
+        'approx_quantile_<q>', e.g. 'approx_quantile_0.9'
 
     step_size: int,  default None
 
@@ -49,6 +54,24 @@ def bar(
 
     unselected_alpha: float, default 0.1
 
+    top_n: int, default None
+        only for bars with a `y` column: keep the top_n largest groups
+        of the unfiltered data and fold the rest into an "other" bar,
+        selecting it filters the rows outside of the top_n groups
+
+    bin_by: {'minute', 'hour', 'day', 'week', 'month'}, default None
+        only for datetime x columns: one bar per calendar period, weeks
+        starting on Monday, instead of the step_size / data_points bins.
+        Box selections snap to the period boundaries
+
+    rollups: {True, False}, default False
+        only for histograms of datetime x columns: roll the rows up per
+        minute, hour and day when the chart is initiated, and rebin the
+        histogram when zooming in, from the coarsest rollup giving at
+        least `data_points` bins (or the number of bins of the chart).
+        The rows are only read again while filters on other columns are
+        active
+
     **library_specific_params:
         additional library specific keyword arguments to be passed to
         the function, a list of all the supported arguments can be found by
@@ -64,6 +87,11 @@ def bar(
     """
 
     if y is not None:
+        if rollups:
+            raise ArgumentError(
+                "rollups are only supported for histograms, `y` should not",
+                " be provided when rollups is True",
+            )
         plot = Bar(
             x=x,
             y=y,
@@ -75,6 +103,8 @@ def bar(
             title=title,
             autoscaling=autoscaling,
             unselected_alpha=unselected_alpha,
+            top_n=top_n,
+            bin_by=bin_by,
             **library_specific_params,
         )
         plot.chart_type = "bar"
@@ -84,6 +114,11 @@ def bar(
                 "`y` should be provided when aggregate_fn is provided",
                 " else a histogram is plotted",
             )
+        if top_n is not None:
+            raise ArgumentError(
+                "`y` should be provided when top_n is provided",
+                " else a histogram is plotted",
+            )
         plot = Histogram(
             x=x,
             data_points=data_points,
@@ -93,6 +128,8 @@ def bar(
             title=title,
             autoscaling=autoscaling,
             unselected_alpha=unselected_alpha,
+            bin_by=bin_by,
+            rollups=rollups,
             **library_specific_params,
         )
         plot.chart_type = "histogram"
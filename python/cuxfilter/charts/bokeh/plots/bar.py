@@ -2,13 +2,54 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import holoviews as hv
+import numpy as np
 import param
 import pandas as pd
 from cuxfilter.charts.core.aggregate import BaseAggregateChart
-from cuxfilter.assets.numba_kernels import calc_groupby
+from cuxfilter.assets.aggregate_states import AGGREGATE_STATES, aggregate
+from cuxfilter.assets.numba_kernels import (
+    calc_dense_groupby,
+    calc_groupby,
+    calc_groupby_states,
+    finalize_groupby_states,
+    merge_groupby_states,
+)
+from cuxfilter.assets.predicates import In
+from cuxfilter.assets.row_sample import (
+    ESTIMATED_AGGREGATES,
+    estimate_groups,
+    sample_weights,
+)
 import panel as pn
 import cudf
 
+# label of the bar folding the groups outside of the top_n
+OTHER_LABEL = "other"
+
+
+def _to_list(values):
+    """
+    values of a cudf or pandas Series as a list of python scalars
+    """
+    if isinstance(values, cudf.Series):
+        values = values.to_pandas()
+    return values.tolist()
+
+
+def _bar_labels(keys):
+    """
+    distinct labels of the bars of `keys`, in order, followed by the label
+    of the bar folding the other groups, which no key label can take
+    """
+    labels = []
+    for key in keys + [OTHER_LABEL]:
+        label = str(key)
+        # keys like 1 and "1", or a key "other", would share a label
+        while label in labels:
+            label += "*"
+        labels.append(label)
+    return labels
+
 
 class InteractiveBar(param.Parameterized):
     x = param.String("x", doc="x axis column name")
@@ -93,14 +134,48 @@ class InteractiveBar(param.Parameterized):
 
 
 class Bar(BaseAggregateChart):
+    use_dense_keys = True
+    # x values of the top_n bars, fixed when the chart is generated
+    top_keys = None
+    # labels of the top_n bars and of the other bar, see _bar_labels
+    bar_labels = None
+    # labels of the bars selected while top_keys is set
+    selected_labels = None
+
+    def __init__(self, *args, top_n=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if top_n is not None and self.bin_by is not None:
+            raise ValueError("top_n is not supported with bin_by")
+        self.top_n = top_n
+
     def generate_chart(self, **kwargs):
         """
         generate chart for the x and y columns, and apply aggregate function
         """
+        self.top_keys = None
+        self.bar_labels = None
+        self.selected_labels = None
+        source_df = self.calculate_source()
+        if self.top_n is not None and len(source_df) > self.top_n:
+            # partial selection of the largest groups of the unfiltered data
+            self.top_keys = _to_list(
+                source_df.nlargest(self.top_n, self.y)[self.x]
+            )
+            self.bar_labels = _bar_labels(self.top_keys)
+            source_df = self.calculate_source()
+        if (
+            self.aggregate_fn == "count"
+            and isinstance(self.y, str)
+            and self.y != self.x
+        ):
+            self.selectivity_histogram = (
+                source_df[self.x].to_numpy(),
+                source_df[self.y].to_numpy(),
+            )
         self.chart = InteractiveBar(
             x=self.x,
             y=[self.y] if isinstance(self.y, str) else self.y,
-            source_df=self.calculate_source(),
+            source_df=source_df,
             library_specific_params=self.library_specific_params,
             unselected_alpha=self.unselected_alpha,
             title=self.title,
@@ -117,8 +192,176 @@ class Bar(BaseAggregateChart):
         Output:
             cudf.DataFrame
         """
-        data = self.source if data is None else data
-        return calc_groupby(self, data)
+        data = self._bin_x(self.source if data is None else data)
+        if self.top_keys is not None:
+            return self._fold_other(data)
+        if self.dense_keys is not None:
+            result = calc_dense_groupby(
+                self, data, self.dense_keys, pool=self.buffer_pool
+            )
+        else:
+            result = calc_groupby(self, data)
+        return self._x_from_bins(result)
+
+    def _fold_other(self, data):
+        """
+        Description:
+            aggregate of the groups of top_keys, in their order, and of
+            every other row, folded into a single "other" bar. Only the
+            rows of the top_n groups are grouped
+        -------------------------------------------
+        Input:
+            data = the aggregated cudf.DataFrame
+        -------------------------------------------
+        Output:
+            cudf.DataFrame or pandas.DataFrame with the top_n bars and the
+            other bar, x holding the bar_labels
+        """
+        x = data[self.x]
+        in_top = x.isin(self.top_keys)
+        result = calc_groupby(self, data[in_top])
+        top = result.set_index(self.x)[self.y].reindex(self.top_keys)
+        if self.aggregate_fn in ("count", "sum"):
+            top = top.fillna(0)
+        other = aggregate(
+            data[self.y][x.notnull() & ~in_top], self.aggregate_fn
+        )
+        return type(result)(
+            {
+                self.x: self.bar_labels,
+                self.y: np.append(
+                    top.astype("float64").to_numpy(na_value=np.nan),
+                    other,
+                ),
+            }
+        )
+
+    def get_box_select_callback(self, dashboard_cls):
+        if self.top_keys is None:
+            return super().get_box_select_callback(dashboard_cls)
+
+        def cb(bounds, x_selection, y_selection):
+            self.box_selected_range, self.selected_indices = None, None
+            self.selected_labels = (
+                list(x_selection) if isinstance(x_selection, list) else None
+            )
+            self.compute_query_dict(
+                dashboard_cls._query_str_dict,
+                dashboard_cls._query_local_variables_dict,
+            )
+            dashboard_cls._reload_charts()
+
+        return cb
+
+    def compute_query_dict(self, query_str_dict, query_local_variables_dict):
+        """
+        Description:
+            with top_n bars, the selected bars translate into an IN
+            predicate over their keys, or into a NOT IN predicate over the
+            unselected top keys when the other bar is selected
+        -------------------------------------------
+        Input:
+        query_dict = reference to dashboard.__cls__.query_dict
+        -------------------------------------------
+
+        Ouput:
+        """
+        if self.top_keys is None:
+            return super().compute_query_dict(
+                query_str_dict, query_local_variables_dict
+            )
+        labels = self.selected_labels or []
+        if len(labels) == 0:
+            query_str_dict.pop(self.name, None)
+            self.query_predicate = None
+            return
+        # the selection is keyed on the original key values of the bars
+        keys = [
+            key
+            for key, label in zip(self.top_keys, self.bar_labels)
+            if label in labels
+        ]
+        if self.bar_labels[-1] in labels:
+            excluded = [
+                key
+                for key, label in zip(self.top_keys, self.bar_labels)
+                if label not in labels
+            ]
+            query_str_dict[self.name] = f"{self.x} not in {excluded!r}"
+            self.query_predicate = In(self.x, excluded, negate=True)
+        else:
+            query_str_dict[self.name] = f"{self.x} in {keys!r}"
+            self.query_predicate = In(self.x, keys)
+
+    def compute_reload(self, data):
+        return self.calculate_source(self._gather_columns(data))
+
+    @property
+    def progressive(self):
+        # the other bar of top_n is not mergeable across chunks
+        return self.top_keys is None and self.aggregate_fn in AGGREGATE_STATES
+
+    @property
+    def _agg(self):
+        return {self.y: self.aggregate_fn}
+
+    def compute_partial(self, data):
+        data = self._bin_x(self._gather_columns(data))
+        columns = [self.x] + [col for col in self._agg if col != self.x]
+        return calc_groupby_states(
+            data[columns].dropna(subset=[self.x]), self.x, self._agg
+        )
+
+    def merge_partials(self, partial, other):
+        return merge_groupby_states([partial, other], self.x, self._agg)
+
+    def result_from_partial(self, partial):
+        result = finalize_groupby_states(partial, self.x, self._agg)
+        return self._x_from_bins(
+            self._dense_result(
+                result.sort_values(self.x).reset_index(drop=True)
+            )
+        )
+
+    @property
+    def approximate(self):
+        return (
+            self.top_keys is None and self.aggregate_fn in ESTIMATED_AGGREGATES
+        )
+
+    def compute_estimate(self, data, confidence):
+        columns = self._bin_x(self._gather_columns(data))
+        result, intervals = estimate_groups(
+            columns[self.x],
+            columns[self.y],
+            sample_weights(data),
+            self.aggregate_fn,
+            confidence,
+        )
+        return (
+            self._x_from_bins(self._dense_result(result)),
+            self._x_from_bins(intervals),
+        )
+
+    def _dense_result(self, result):
+        """
+        groupby result sorted by x, reindexed onto dense_keys when set, with
+        the same layout as calc_dense_groupby: a bar for every key
+        """
+        if self.dense_keys is None:
+            return result
+        values = result.set_index(self.x)[self.y].reindex(self.dense_keys)
+        if self.aggregate_fn in ("count", "sum"):
+            values = values.fillna(0).astype(result[self.y].dtype)
+        return type(result)(
+            {
+                self.x: self.dense_keys,
+                self.y: values.reset_index(drop=True),
+            }
+        )
+
+    def apply_reload(self, result):
+        self.chart.update_data(result)
 
     def reload_chart(self, data):
         """
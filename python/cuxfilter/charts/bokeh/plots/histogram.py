@@ -2,9 +2,22 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import holoviews as hv
+import pandas as pd
 import param
+from cuxfilter.charts.constants import CUDF_DATETIME_TYPES
 from cuxfilter.charts.core.aggregate import BaseAggregateChart
-from cuxfilter.assets.numba_kernels import calc_value_counts
+from cuxfilter.assets import datetime as dt
+from cuxfilter.assets.filtered_view import FilteredView
+from cuxfilter.assets.numba_kernels import (
+    calc_bin_ids,
+    calc_bin_values,
+    calc_bincount,
+    calc_bincount_from_bin_ids,
+    calc_value_counts,
+)
+from cuxfilter.assets.predicates import Range
+from cuxfilter.assets.rollups import RollupPyramid
+from cuxfilter.assets.row_sample import estimate_bincount, sample_weights
 import panel as pn
 
 
@@ -18,6 +31,11 @@ class InteractiveHistogram(param.Parameterized):
         class_=hv.streams.PlotReset,
         default=hv.streams.PlotReset(resetting=False),
     )
+    range_stream = param.ClassSelector(
+        class_=hv.streams.RangeX,
+        default=None,
+        doc="x range of the plot, set when zooming rebins the histogram",
+    )
     tools = param.List(
         default=[
             "pan",
@@ -53,6 +71,9 @@ class InteractiveHistogram(param.Parameterized):
     def add_reset_callback(self, callback_fn):
         self.reset_stream = hv.streams.PlotReset(subscribers=[callback_fn])
 
+    def add_range_callback(self, callback_fn):
+        self.range_stream = hv.streams.RangeX(subscribers=[callback_fn])
+
     def update_data(self, data):
         self.source_df = data
 
@@ -67,13 +88,13 @@ class InteractiveHistogram(param.Parameterized):
         return self.histogram().opts(alpha=self.unselected_alpha)
 
     def view(self):
+        streams = [self.box_stream, self.reset_stream]
+        if self.range_stream is not None:
+            streams.append(self.range_stream)
         return (
             (
                 self.get_base_chart()
-                * hv.DynamicMap(
-                    self.histogram,
-                    streams=[self.box_stream, self.reset_stream],
-                ).opts(
+                * hv.DynamicMap(self.histogram, streams=streams).opts(
                     tools=self.tools,
                     responsive=True,
                     active_tools=["xbox_select"],
@@ -92,13 +113,55 @@ class Histogram(BaseAggregateChart):
     Description:
     """
 
+    use_bin_ids = True
+    # RollupPyramid of the x column, when the chart is built with rollups
+    rollup_pyramid = None
+    # (lo, hi) x range the chart is zoomed into, None when zoomed out
+    zoom_range = None
+    # dashboard the zoom window is rebinned from, set with the range
+    # callback
+    _zoom_dashboard = None
+
+    def __init__(self, *args, rollups=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rollups = rollups
+
+    def initiate_chart(self, dashboard_cls):
+        """
+        Description:
+            build the rollup pyramid of a datetime x column when the chart
+            is built with rollups, before generating the chart
+        -------------------------------------------
+        Input:
+            dashboard_cls = current dashboard class reference
+        """
+        self.zoom_range = None
+        self.rollup_pyramid = None
+        if self.rollups:
+            if self.y is not None or self.aggregate_fn != "count":
+                # the rollups only keep the row counts of every period
+                raise ValueError(
+                    "rollups are only supported for count histograms, got "
+                    f"y={self.y!r} and aggregate_fn={self.aggregate_fn!r}"
+                )
+            data = dashboard_cls._cuxfilter_df.data
+            if data[self.x].dtype not in CUDF_DATETIME_TYPES:
+                raise TypeError(
+                    "rollups are only supported for datetime x columns, "
+                    f"{self.x} is of type {data[self.x].dtype}"
+                )
+            self.rollup_pyramid = RollupPyramid.from_data(data, self.x)
+        super().initiate_chart(dashboard_cls)
+
     def generate_chart(self, **kwargs):
         """
         returns a histogram chart
         """
+        source_df = self.calculate_source()
+        self.selectivity_histogram = source_df
         self.chart = InteractiveHistogram(
             x=self.x,
-            source_df=self.calculate_source(),
+            source_df=self._chart_source(source_df),
             unselected_alpha=self.unselected_alpha,
             library_specific_params=self.library_specific_params,
             title=self.title,
@@ -115,7 +178,18 @@ class Histogram(BaseAggregateChart):
         Output:
             cudf.DataFrame
         """
+        if data is None and self.bin_ids is not None:
+            return self._bincount_from_bin_ids()
         data = self.source if data is None else data
+        if self.n_bins is not None:
+            # fixed-width bins, dense counts including the empty bins
+            return calc_bincount(
+                data[self.x],
+                self.stride,
+                self.min_value,
+                self.n_bins,
+                pool=self.buffer_pool,
+            )
         return calc_value_counts(
             data[self.x],
             self.stride,
@@ -123,11 +197,195 @@ class Histogram(BaseAggregateChart):
             self.custom_binning,
         )
 
+    def _bincount_from_bin_ids(self, selection=None):
+        return calc_bincount_from_bin_ids(
+            self.bin_ids,
+            self.x_dtype,
+            self.stride,
+            self.min_value,
+            self.n_bins,
+            selection,
+        )
+
+    def result_from_counts(self, counts):
+        """
+        reload result from the bin counts of the filtered rows, computed by
+        the dashboard data tiles
+        """
+        return (
+            calc_bin_values(
+                self.x_dtype, self.stride, self.min_value, self.n_bins
+            ),
+            counts,
+        )
+
+    def compute_reload(self, data):
+        if self.zoom_range is not None:
+            # apply_reload rebins the zoom window instead
+            return None
+        if (
+            self.bin_ids is not None
+            and isinstance(data, FilteredView)
+            and data.data is self.source
+        ):
+            # rows of the base data, count the cached bin ids directly
+            return self._bincount_from_bin_ids(data.selection)
+        return self.calculate_source(self._gather_columns(data))
+
+    @property
+    def progressive(self):
+        # fixed-width bins, the counts of the chunks add up. While zoomed,
+        # the zoom window is rebinned once per reload, not per chunk
+        return self.n_bins is not None and self.zoom_range is None
+
+    def compute_partial(self, data):
+        return self.compute_reload(data)[1]
+
+    def merge_partials(self, partial, other):
+        return partial + other
+
+    def result_from_partial(self, partial):
+        return self.result_from_counts(partial)
+
+    @property
+    def approximate(self):
+        return self.n_bins is not None and self.zoom_range is None
+
+    def compute_estimate(self, data, confidence):
+        counts, interval = estimate_bincount(
+            calc_bin_ids(
+                self._gather_columns(data)[self.x],
+                self.stride,
+                self.min_value,
+                self.n_bins,
+            ),
+            sample_weights(data),
+            self.n_bins,
+            confidence,
+        )
+        return self.result_from_counts(counts), interval
+
+    def _chart_source(self, result):
+        """
+        calendar bins are drawn between the boundaries of their periods,
+        the n_bins + 1 period starts
+        """
+        if self.bin_by is None:
+            return result
+        return (
+            calc_bin_values(
+                self.x_dtype, self.stride, self.min_value, self.n_bins + 1
+            ),
+            result[1],
+        )
+
+    def apply_reload(self, result):
+        if self.zoom_range is not None:
+            # the chart shows the bins of the zoom window, rebin them for
+            # the new filters
+            self.chart.update_data(self._compute_zoom())
+            return
+        self.chart.update_data(self._chart_source(result))
+
+    def _covered_ranges(self, dashboard_cls, level):
+        """
+        (lo, hi) bounds of the active filters the histogram depends on,
+        None unless they are all range filters on x covered by the rollup
+        of `level`
+        """
+        ranges = []
+        for name in dashboard_cls._query_str_dict:
+            if name == self.name and self.ignore_own_filter:
+                continue
+            predicate = dashboard_cls._query_predicate(name)
+            if not (
+                isinstance(predicate, Range)
+                and predicate.column == self.x
+                and self.rollup_pyramid.covers(
+                    predicate.lo, predicate.hi, level
+                )
+            ):
+                return None
+            ranges.append((predicate.lo, predicate.hi))
+        return ranges
+
+    def compute_zoom(self, dashboard_cls):
+        """
+        Description:
+            counts of the zoom window, binned by the coarsest rollup level
+            giving at least data_points bins. The rows are only read when
+            filters on other columns, or range filters on x splitting the
+            periods of that level, are active
+        -------------------------------------------
+        Input:
+            dashboard_cls = current dashboard class reference
+        -------------------------------------------
+
+        Ouput:
+            (n_bins + 1 bin boundaries, counts)
+        """
+        lo, hi = self.zoom_range
+        level = self.rollup_pyramid.level_for(
+            lo,
+            hi,
+            self.data_points
+            or self.n_bins
+            or len(self.selectivity_histogram[1]),
+        )
+        ranges = self._covered_ranges(dashboard_cls, level)
+        if ranges is not None:
+            return self.rollup_pyramid.aggregate(lo, hi, level, ranges=ranges)
+        first, n_bins = self.rollup_pyramid.period_range(lo, hi, level)
+        edges = dt.calendar_bin_starts(first, n_bins + 1, level, self.x_dtype)
+        x = self._gather_columns(
+            dashboard_cls._filtered_view(
+                self.name if self.ignore_own_filter else None
+            )
+        )[self.x]
+        x = x[(x >= edges[0]) & (x < edges[-1])]
+        return edges, calc_bincount(x, level, edges[0], n_bins)[1]
+
+    def _compute_zoom(self):
+        return self.compute_zoom(self._zoom_dashboard)
+
+    def get_range_callback(self, dashboard_cls):
+        self._zoom_dashboard = dashboard_cls
+
+        def cb(x_range):
+            if x_range is not None:
+                x_range = tuple(pd.Timestamp(value) for value in x_range)
+            if x_range is None or (
+                x_range[0] <= pd.Timestamp(self.min_value)
+                and x_range[1] >= pd.Timestamp(self.max_value)
+            ):
+                # zoomed out to the whole x range, back to the chart bins
+                if self.zoom_range is not None:
+                    self.zoom_range = None
+                    self.apply_reload(
+                        self.compute_reload(
+                            dashboard_cls._filtered_view(
+                                self.name if self.ignore_own_filter else None
+                            )
+                        )
+                    )
+                return
+            self.zoom_range = x_range
+            self.chart.update_data(self._compute_zoom())
+
+        return cb
+
+    def add_events(self, dashboard_cls):
+        super().add_events(dashboard_cls)
+        if self.rollup_pyramid is not None:
+            self.chart.add_range_callback(
+                self.get_range_callback(dashboard_cls)
+            )
+
     def reload_chart(self, data):
         """
         reload chart with new data
         """
-        self.chart.update_data(self.calculate_source(data))
+        self.apply_reload(self.calculate_source(data))
 
     def view(self, width=800, height=400):
         return pn.panel(
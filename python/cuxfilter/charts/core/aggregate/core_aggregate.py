@@ -1,7 +1,10 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import cudf
+import dask_cudf
 import numpy as np
+import pandas as pd
 from typing import Union
 from bokeh.models import DatetimeTickFormatter
 import holoviews as hv
@@ -9,7 +12,10 @@ from ..core_chart import BaseChart
 from ...constants import (
     CUDF_DATETIME_TYPES,
 )
+from ....assets import datetime as dt
+from ....assets.aggregate_states import AGGREGATE_STATES
 from ....assets.cudf_utils import get_min_max
+from ....assets.predicates import Mask, Range
 
 
 class BaseAggregateChart(BaseChart):
@@ -19,9 +25,27 @@ class BaseAggregateChart(BaseChart):
     use_data_tiles = True
     stride = None
     data_points: Union[int, None] = None
+    # number of fixed-width bins of width stride, None if x is not binned
+    n_bins: Union[int, None] = None
+    # charts setting use_bin_ids get the bin ids of every row of x, cached
+    # by the dashboard, in bin_ids
+    use_bin_ids = False
+    bin_ids = None
+    # charts setting use_dense_keys get, in dense_keys, every key of x when
+    # x is a small-range integer or a categorical column, to aggregate by
+    # direct addressing
+    use_dense_keys = False
+    dense_keys = None
+    max_dense_keys = 2**16
+    # calendar period of the bins of a datetime x column, one of
+    # cuxfilter.assets.datetime.CALENDAR_UNITS, used as the stride
+    bin_by = None
     _x_dtype = float
     box_stream = hv.streams.SelectionXY()
     reset_stream = hv.streams.PlotReset()
+    # (bin values, counts) of the unfiltered data, recorded by the charts
+    # aggregating counts, used to estimate the selectivity of the filters
+    selectivity_histogram = None
 
     @property
     def name(self):
@@ -48,17 +72,11 @@ class BaseAggregateChart(BaseChart):
 
     @property
     def custom_binning(self):
-        return self._stride is not None or self._data_points is not None
-
-    def _transformed_source_data(self, property):
-        """
-        this fixes a bug introduced with panel 0.11, where bokeh CDS
-        x-axis datetime is converted to float, and the only way to
-        convert it back to datetime is using datetime64[ms]
-        """
-        if self.x_dtype in CUDF_DATETIME_TYPES:
-            return self.source.data[property].astype("datetime64[ms]")
-        return self.source.data[property]
+        return (
+            self._stride is not None
+            or self._data_points is not None
+            or self.bin_by is not None
+        )
 
     def __init__(
         self,
@@ -74,6 +92,7 @@ class BaseAggregateChart(BaseChart):
         x_axis_tick_formatter=None,
         y_axis_tick_formatter=None,
         unselected_alpha=0.1,
+        bin_by=None,
         **library_specific_params,
     ):
         """
@@ -94,6 +113,8 @@ class BaseAggregateChart(BaseChart):
             y_label_map
             x_axis_tick_formatter
             y_axis_tick_formatter
+            unselected_alpha
+            bin_by
             **library_specific_params
         -------------------------------------------
 
@@ -112,20 +133,70 @@ class BaseAggregateChart(BaseChart):
         self.x_axis_tick_formatter = x_axis_tick_formatter
         self.y_axis_tick_formatter = y_axis_tick_formatter
         self.unselected_alpha = unselected_alpha
+        if bin_by is not None and bin_by not in dt.CALENDAR_UNITS:
+            raise ValueError(
+                f"bin_by must be one of {dt.CALENDAR_UNITS}, not {bin_by!r}"
+            )
+        self.bin_by = bin_by
         self.library_specific_params = library_specific_params
 
-    def _compute_array_all_bins(self, source_x, update_data_x, update_data_y):
+    def _bin_x(self, data):
+        """
+        Description:
+            data with the x column replaced by the calendar period ids of
+            its dates when bin_by is set (see
+            cuxfilter.assets.datetime.calendar_bin_ids)
+        """
+        if self.bin_by is None:
+            return data
+        return data.assign(
+            **{self.x: dt.calendar_bin_ids(data[self.x], self.bin_by)}
+        )
+
+    def _x_from_bins(self, result):
         """
-        source_x: current_source_x, np.array()
-        update_data_x: updated_data_x, np.array()
-        update_data_y: updated_data_x, np.array()
+        Description:
+            result of an aggregation of _bin_x data, with the calendar
+            period ids of the x column replaced by the period starts
+        """
+        if self.bin_by is None or len(result) == 0:
+            return result
+        ids = result[self.x].to_numpy().astype("int64")
+        first = int(ids.min())
+        result = result.copy()
+        result[self.x] = dt.calendar_bin_starts(
+            first, int(ids.max()) - first + 1, self.bin_by, self.x_dtype
+        )[ids - first]
+        return result
+
+    def estimate_selectivity(self, predicate):
+        """
+        Description:
+            estimated fraction of the rows passing a Range predicate on the
+            x column, from the bin counts of the unfiltered data
+        -------------------------------------------
+        Input:
+            predicate = cuxfilter.assets.predicates.Predicate
+        -------------------------------------------
+
+        Ouput:
+            float between 0 and 1, None if no estimate is available
         """
-        if self.x_dtype in CUDF_DATETIME_TYPES:
-            source_x = source_x.astype("datetime64[ms]")
-        result_array = np.zeros(shape=source_x.shape)
-        indices = [np.where(x_ == source_x)[0][0] for x_ in update_data_x]
-        np.put(result_array, indices, update_data_y)
-        return result_array
+        if (
+            self.selectivity_histogram is None
+            or not isinstance(predicate, Range)
+            or predicate.column != self.x
+        ):
+            return None
+        bins, counts = self.selectivity_histogram
+        total = counts.sum()
+        if total == 0 or bins.dtype.kind not in "biufM":
+            return None
+        lo, hi = predicate.lo, predicate.hi
+        if bins.dtype.kind == "M":
+            lo, hi = np.datetime64(lo), np.datetime64(hi)
+        in_range = (bins >= lo) & (bins <= hi)
+        return float(counts[in_range].sum() / total)
 
     def compute_min_max(self, dashboard_cls):
         self.min_value, self.max_value = get_min_max(
@@ -133,6 +204,10 @@ class BaseAggregateChart(BaseChart):
         )
 
     def compute_stride(self):
+        if self.bin_by is not None:
+            # calendar periods, binned by integer truncation of the dates
+            self.stride = self.bin_by
+            return
         self.stride_type = self._xaxis_stride_type_transform(self.stride_type)
 
         if self.stride_type is int and self.max_value < 1:
@@ -145,6 +220,76 @@ class BaseAggregateChart(BaseChart):
             )
             self.stride = stride
 
+    def compute_n_bins(self):
+        """
+        Description:
+            number of fixed-width bins of width `stride` centered on
+            min_value, min_value + stride, ..., max_value
+        -------------------------------------------
+
+        Ouput:
+            int, None if the x column is not binned by stride
+        """
+        if not (self.custom_binning and self.stride) or getattr(
+            self.x_dtype, "kind", None
+        ) not in ("i", "u", "f", "M"):
+            return None
+        if self.bin_by is not None:
+            return (
+                dt.calendar_bin_id(self.max_value, self.bin_by, self.x_dtype)
+                - dt.calendar_bin_id(self.min_value, self.bin_by, self.x_dtype)
+                + 1
+            )
+        return (
+            int(np.rint((self.max_value - self.min_value) / self.stride)) + 1
+        )
+
+    def compute_dense_keys(self, dashboard_cls):
+        """
+        Description:
+            dense key domain of the x column: the categories of a
+            categorical column, or every integer between min_value and
+            max_value when there are at most max_dense_keys of them
+        -------------------------------------------
+
+        Ouput:
+            ndarray, None if x is not dense, the data is a
+            dask_cudf.DataFrame, the aggregate function has no direct
+            address implementation or, except for counts, y is not
+            numeric. The calendar period ids of the _bin_x column when
+            bin_by is set
+        """
+        data = dashboard_cls._cuxfilter_df.data
+        if (
+            isinstance(data, dask_cudf.DataFrame)
+            or self.aggregate_fn not in AGGREGATE_STATES
+        ):
+            return None
+        if self.aggregate_fn != "count" and (
+            self.y is None
+            or getattr(data[self.y].dtype, "kind", None)
+            not in ("i", "u", "f", "b")
+        ):
+            return None
+        if self.bin_by is not None:
+            if self.n_bins is None or self.n_bins > self.max_dense_keys:
+                return None
+            first = dt.calendar_bin_id(
+                self.min_value, self.bin_by, self.x_dtype
+            )
+            return np.arange(first, first + self.n_bins, dtype="int64")
+        dtype = data[self.x].dtype
+        if isinstance(dtype, (cudf.CategoricalDtype, pd.CategoricalDtype)):
+            return dtype.categories.to_numpy()
+        if getattr(dtype, "kind", None) not in ("i", "u", "b") or pd.isna(
+            self.min_value
+        ):
+            return None
+        min_value, max_value = int(self.min_value), int(self.max_value)
+        if max_value - min_value + 1 > self.max_dense_keys:
+            return None
+        return np.arange(min_value, max_value + 1).astype(dtype)
+
     def initiate_chart(self, dashboard_cls):
         """
         Description:
@@ -158,6 +303,12 @@ class BaseAggregateChart(BaseChart):
 
         """
         self.x_dtype = dashboard_cls._cuxfilter_df.data[self.x].dtype
+        self.buffer_pool = dashboard_cls._buffer_pool
+        if self.bin_by is not None and self.x_dtype not in CUDF_DATETIME_TYPES:
+            raise TypeError(
+                f"bin_by is only supported for datetime x columns, {self.x} "
+                f"is of type {self.x_dtype}"
+            )
         # reset data_point to input _data_points
         self.data_points = self._data_points
         # reset stride to input _stride
@@ -173,6 +324,15 @@ class BaseAggregateChart(BaseChart):
                 self.x_axis_tick_formatter = DatetimeTickFormatter()
             if self.x_dtype != "object":
                 self.compute_stride()
+        self.n_bins = self.compute_n_bins()
+        self.bin_ids = None
+        if self.use_bin_ids and self.n_bins is not None:
+            self.bin_ids = dashboard_cls._get_bin_ids(
+                self.x, self.stride, self.min_value, self.n_bins
+            )
+        self.dense_keys = None
+        if self.use_dense_keys:
+            self.dense_keys = self.compute_dense_keys(dashboard_cls)
 
         self.source = dashboard_cls._cuxfilter_df.data
         self.generate_chart()
@@ -191,16 +351,27 @@ class BaseAggregateChart(BaseChart):
         def cb(bounds, x_selection, y_selection):
             self.box_selected_range, self.selected_indices = None, None
             if isinstance(x_selection, tuple):
+                if self.bin_by is not None:
+                    # the brush snaps to the calendar periods of the bins
+                    x_selection = dt.snap_to_calendar(
+                        x_selection, self.bin_by, self.x_dtype
+                    )
                 self.box_selected_range = {
                     self.x + "_min": x_selection[0],
                     self.x + "_max": x_selection[1],
                 }
             elif isinstance(x_selection, list):
-                self.selected_indices = (
-                    dashboard_cls._cuxfilter_df.data[self.x]
-                    .isin(x_selection)
-                    .reset_index()
-                )[[self.x]]
+                x = dashboard_cls._cuxfilter_df.data[self.x]
+                if self.bin_by is not None:
+                    # bars of calendar periods, labelled by their start
+                    x = dt.calendar_bin_ids(x, self.bin_by)
+                    x_selection = [
+                        dt.calendar_bin_id(value, self.bin_by, self.x_dtype)
+                        for value in x_selection
+                    ]
+                self.selected_indices = (x.isin(x_selection).reset_index())[
+                    [self.x]
+                ]
 
             if self.box_selected_range or self.selected_indices is not None:
                 self.compute_query_dict(
@@ -232,11 +403,18 @@ class BaseAggregateChart(BaseChart):
                 f"@{self.x}_min<={self.x}<=@{self.x}_max"
             )
             query_local_variables_dict.update(self.box_selected_range)
+            self.query_predicate = Range(
+                self.x,
+                self.box_selected_range[self.x + "_min"],
+                self.box_selected_range[self.x + "_max"],
+            )
         else:
             if self.selected_indices is not None:
                 query_str_dict[self.name] = self.selected_indices
+                self.query_predicate = Mask(self.selected_indices)
             else:
                 query_str_dict.pop(self.name, None)
+                self.query_predicate = None
 
             query_local_variables_dict.pop(self.x + "_min", None)
             query_local_variables_dict.pop(self.x + "_max", None)
@@ -10,6 +10,7 @@ from ..core_chart import BaseChart
 from ....assets.numba_kernels import calc_groupby
 from ....assets import geo_json_mapper
 from ....assets.cudf_utils import get_min_max
+from ....assets.predicates import Equals, In
 from ...constants import CUXF_NAN_COLOR
 
 np.seterr(divide="ignore", invalid="ignore")
@@ -20,6 +21,10 @@ class BaseChoropleth(BaseChart):
     geo_mapper: Dict[str, str] = {}
     use_data_tiles = True
     source = None
+    # the selected regions are highlighted by the map itself, so the
+    # choropleth is always aggregated over the data filtered by the
+    # other charts
+    ignore_own_filter = True
 
     @property
     def name(self):
@@ -161,6 +166,12 @@ class BaseChoropleth(BaseChart):
     def get_dashboard_view(self):
         return pn.panel(self.chart.view(), sizing_mode="stretch_both")
 
+    @property
+    def data_columns(self):
+        return [self.x] + [
+            column for column in self.aggregate_dict if column != self.x
+        ]
+
     def calculate_source(self, data):
         """
         Description:
@@ -176,6 +187,14 @@ class BaseChoropleth(BaseChart):
             calc_groupby(self, data, agg=self.aggregate_dict)
         )
 
+    def compute_reload(self, data):
+        return calc_groupby(
+            self, self._gather_columns(data), agg=self.aggregate_dict
+        )
+
+    def apply_reload(self, result):
+        self.format_source_data(result)
+
     def get_selection_callback(self, dashboard_cls):
         """
         Description: generate callback for choropleth selection event
@@ -189,10 +208,7 @@ class BaseChoropleth(BaseChart):
 
         def selection_callback(old, new):
             self.compute_query_dict(dashboard_cls._query_str_dict)
-            if old != new and not new:
-                dashboard_cls._reload_charts()
-            else:
-                dashboard_cls._reload_charts(ignore_cols=[self.name])
+            dashboard_cls._reload_charts()
 
         return selection_callback
 
@@ -210,11 +226,14 @@ class BaseChoropleth(BaseChart):
         list_of_indices = self.get_selected_indices()
         if len(list_of_indices) == 0 or list_of_indices == [""]:
             query_str_dict.pop(self.name, None)
+            self.query_predicate = None
         elif len(list_of_indices) == 1:
             query_str_dict[self.name] = f"{self.x}=={list_of_indices[0]}"
+            self.query_predicate = Equals(self.x, list_of_indices[0])
         else:
             indices_string = ",".join(map(str, list_of_indices))
             query_str_dict[self.name] = f"{self.x} in ({indices_string})"
+            self.query_predicate = In(self.x, list_of_indices)
 
     def add_events(self, dashboard_cls):
         """
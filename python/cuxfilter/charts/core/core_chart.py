@@ -11,6 +11,7 @@ from panel.config import panel_extension
 from typing import Dict, Literal
 
 from ...assets import datetime as dt
+from ...assets.filtered_view import FilteredView
 
 
 class BaseChart:
@@ -33,6 +34,26 @@ class BaseChart:
     x_label_map = None
     y_label_map = None
     _initialized = False
+    # crossfilter semantics: reload the chart with the data filtered by all
+    # active filters except its own
+    ignore_own_filter = False
+    # predicate IR of the active filter, set by compute_query_dict along
+    # with the query_str_dict entry (cuxfilter.assets.predicates)
+    query_predicate = None
+    # (lower, upper) bounds of the confidence intervals of the displayed
+    # result while it is an estimate from the dashboard sample, None once
+    # the exact result is displayed
+    confidence_interval = None
+    # charts setting progressive implement compute_partial, merge_partials
+    # and result_from_partial, and are reloaded chunk by chunk of the
+    # filtered rows when the dashboard has a progressive_chunk_size
+    progressive = False
+    # charts setting approximate implement compute_estimate, and are first
+    # rendered from the row sample of the dashboard when it has one
+    approximate = False
+    # BufferPool of the dashboard, the scratch arrays of the aggregations
+    # are taken from it (cuxfilter.assets.buffer_pool)
+    buffer_pool = None
     # widget=False can only be rendered the main layout
     is_widget = False
     title = ""
@@ -219,6 +240,92 @@ class BaseChart:
         print("base calc source function, to over-ridden by delegated classes")
         return -1
 
+    @property
+    def data_columns(self):
+        """
+        Columns of the dashboard data read by reload_chart, gathered from
+        the filtered rows before reloading the chart. None gathers every
+        column.
+        """
+        columns = []
+        for value in (self.x, self.y, getattr(self, "aggregate_col", None)):
+            for column in value if isinstance(value, list) else [value]:
+                if isinstance(column, str) and column not in columns:
+                    columns.append(column)
+        return columns if len(columns) > 0 else None
+
+    def _gather_columns(self, data):
+        """
+        gather data_columns from a FilteredView, other data is returned as is
+        """
+        if isinstance(data, FilteredView):
+            return data.project(self.data_columns)
+        return data
+
+    def compute_reload(self, data):
+        """
+        Computation half of a reload: aggregate the filtered data without
+        touching the chart models, and return the result to pass to
+        apply_reload. Charts without a separate aggregation step return the
+        gathered data.
+        """
+        return self._gather_columns(data)
+
+    def apply_reload(self, result):
+        """
+        Model update half of a reload: push the result of compute_reload to
+        the chart.
+        """
+        return self.reload_chart(result)
+
+    def reload(self, data):
+        """
+        Entry point used by the dashboard to reload the chart with the
+        current filtered data.
+        """
+        return self.apply_reload(self.compute_reload(data))
+
+    def compute_partial(self, data):
+        """
+        Mergeable partial aggregate of a chunk of the filtered rows, a
+        FilteredView, for progressive reloads.
+        """
+        # print('function to be overridden by progressive charts')
+        return -1
+
+    def merge_partials(self, partial, other):
+        """
+        Partial aggregate of the union of the chunks of two partials.
+        """
+        # print('function to be overridden by progressive charts')
+        return -1
+
+    def result_from_partial(self, partial):
+        """
+        Reload result, to pass to apply_reload, from the partial aggregate
+        of the chunks seen so far.
+        """
+        # print('function to be overridden by progressive charts')
+        return -1
+
+    def compute_estimate(self, data, confidence):
+        """
+        Estimate of the reload result over the whole data, from a
+        FilteredView of the dashboard sample (see
+        cuxfilter.assets.row_sample), and the (lower, upper) bounds of its
+        confidence intervals at the `confidence` level.
+        """
+        # print('function to be overridden by approximate charts')
+        return -1
+
+    def apply_estimate(self, estimate):
+        """
+        Push the result of compute_estimate to the chart, and keep its
+        confidence intervals in `confidence_interval`.
+        """
+        result, self.confidence_interval = estimate
+        self.apply_reload(result)
+
     def format_source_data(self, source_dict):
         """"""
         # print('function to be overridden by library specific extensions')
@@ -6,6 +6,7 @@ import holoviews as hv
 import logging
 import dask_cudf
 from panel.config import panel_extension
+from ...assets.filtered_view import FilteredView
 
 css = """
 .dataframe table{
@@ -115,6 +116,11 @@ class ViewDataFrame:
     def get_dashboard_view(self):
         return pn.panel(self.chart, sizing_mode="stretch_both")
 
+    def reload(self, data):
+        if isinstance(data, FilteredView):
+            data = data.project(self.columns)
+        return self.reload_chart(data)
+
     def reload_chart(self, data):
         if isinstance(data, dask_cudf.DataFrame):
             if self.force_computation:
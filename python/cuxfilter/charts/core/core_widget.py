@@ -25,6 +25,12 @@ class BaseWidget:
     label_map: Dict[str, str] = None
     use_data_tiles = False
     _initialized = False
+    # crossfilter semantics: reload the chart with the data filtered by all
+    # active filters except its own
+    ignore_own_filter = False
+    # predicate IR of the active filter, set by compute_query_dict along
+    # with the query_str_dict entry (cuxfilter.assets.predicates)
+    query_predicate = None
     # widget is a chart type that can be rendered in a sidebar or main layout
     is_widget = True
 
@@ -129,6 +135,11 @@ class BaseWidget:
         # with other charts
         return -1
 
+    def reload(self, data):
+        # widgets do not read the filtered data, the FilteredView is passed
+        # through without gathering any column
+        return self.reload_chart(data)
+
     def apply_theme(self, theme):
         """
         apply thematic changes to the chart based on the theme
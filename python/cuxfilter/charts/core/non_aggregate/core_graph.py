@@ -10,6 +10,8 @@ import panel as pn
 
 from .utils import point_in_polygon
 from ..core_chart import BaseChart
+from ....assets.cudf_utils import cancel_futures
+from ....assets.predicates import And, Mask, Polygon, Range
 
 from ...constants import CUXF_DEFAULT_COLOR_PALETTE
 
@@ -19,6 +21,7 @@ class BaseGraph(BaseChart):
     x_range: Tuple = None
     y_range: Tuple = None
     selected_indices: cudf.Series = None
+    selected_geometry = None
     box_selected_range = None
     use_data_tiles = False
     default_palette = CUXF_DEFAULT_COLOR_PALETTE
@@ -250,12 +253,40 @@ class BaseGraph(BaseChart):
         """
         self.format_source_data(cuxfilter_df)
 
+    def compute_reload(self, data):
+        """
+        Filter the graph with the current filtered nodes, expanding the
+        graph's own selection to the neighboring nodes and edges when the
+        inspect neighbors tool is active.
+        """
+        data = self._gather_columns(data)
+        edges = None
+        if self.selection_active and self.inspect_neighbors._active:
+            data, edges = self.query_graph(data, self.nodes, self.edges)
+        return data, edges
+
+    def apply_reload(self, result):
+        data, edges = result
+        return self.reload_chart(data=data, edges=edges)
+
+    @property
+    def data_columns(self):
+        # the edges, and the nodes of the neighbor expansion, are read from
+        # self.edges and self.nodes
+        return self.node_columns
+
     @property
     def concat(self):
         if self.df_type == dask_cudf.DataFrame:
             return dask_cudf.concat
         return cudf.concat
 
+    @property
+    def selection_active(self):
+        return bool(self.box_selected_range) or (
+            self.selected_indices is not None
+        )
+
     def query_graph(self, node_ids, nodes, edges):
         edges_ = self.concat(
             [
@@ -301,23 +332,13 @@ class BaseGraph(BaseChart):
                 self.node_y + "_max": self.y_range[1],
             }
 
-            edges = None
-
             self.compute_query_dict(
                 dashboard_cls._query_str_dict,
                 dashboard_cls._query_local_variables_dict,
             )
-
-            nodes = dashboard_cls._query(dashboard_cls._generate_query_str())
-
-            if self.inspect_neighbors._active:
-                nodes, edges = self.query_graph(nodes, self.nodes, self.edges)
-
-            # reload all charts with new queried data (cudf.DataFrame only)
-            dashboard_cls._reload_charts(data=nodes, ignore_cols=[self.name])
-            # reload graph chart separately as it has an extra edges argument
-            self.reload_chart(data=nodes, edges=edges)
-            del nodes, edges
+            # reload all charts with new queried data, the graph expands
+            # its own selection to the neighboring nodes in reload_chart
+            dashboard_cls._reload_charts()
 
         return cb
 
@@ -333,8 +354,12 @@ class BaseGraph(BaseChart):
             )
 
             args = (self.node_x, self.node_y, geometry)
+            self.selected_geometry = geometry
 
             if isinstance(self.nodes, dask_cudf.DataFrame):
+                if self.selected_indices is not None:
+                    # drop the computation of the replaced selection
+                    cancel_futures(self.selected_indices)
                 self.selected_indices = (
                     self.nodes.assign(
                         **{
@@ -356,20 +381,9 @@ class BaseGraph(BaseChart):
                 dashboard_cls._query_str_dict,
                 dashboard_cls._query_local_variables_dict,
             )
-
-            nodes = dashboard_cls._query(dashboard_cls._generate_query_str())
-            edges = None
-
-            if self.inspect_neighbors._active:
-                # node_ids = nodes[self.node_id]
-                nodes, edges = self.query_graph(nodes, self.nodes, self.edges)
-
-            # reload all charts with new queried data (cudf.DataFrame only)
-            dashboard_cls._reload_charts(data=nodes, ignore_cols=[self.name])
-
-            # reload graph chart separately as it has an extra edges argument
-            self.reload_chart(data=nodes, edges=edges)
-            del nodes, edges
+            # reload all charts with new queried data, the graph expands
+            # its own selection to the neighboring nodes in reload_chart
+            dashboard_cls._reload_charts()
 
         return cb
 
@@ -396,11 +410,26 @@ class BaseGraph(BaseChart):
                 self.node_y + "_max": self.y_range[1],
             }
             query_local_variables_dict.update(temp_local_dict)
+            self.query_predicate = And(
+                Range(self.node_x, *self.x_range),
+                Range(self.node_y, *self.y_range),
+            )
         else:
             if self.selected_indices is not None:
                 query_str_dict[self.name] = self.selected_indices
+                self.query_predicate = (
+                    Mask(self.selected_indices)
+                    if self.selected_geometry is None
+                    else Polygon(
+                        self.node_x,
+                        self.node_y,
+                        self.selected_geometry,
+                        mask=self.selected_indices,
+                    )
+                )
             else:
                 query_str_dict.pop(self.name, None)
+                self.query_predicate = None
 
             for key in [
                 self.node_x + "_min",
@@ -9,6 +9,8 @@ import panel as pn
 
 from .utils import point_in_polygon
 from ..core_chart import BaseChart
+from ....assets.cudf_utils import cancel_futures
+from ....assets.predicates import And, Mask, Polygon, Range
 
 
 class BaseNonAggregate(BaseChart):
@@ -24,6 +26,7 @@ class BaseNonAggregate(BaseChart):
     x_range: Tuple = None
     y_range: Tuple = None
     selected_indices: cudf.Series = None
+    selected_geometry = None
     box_selected_range = None
     aggregate_col = None
     use_data_tiles = False
@@ -126,8 +129,12 @@ class BaseNonAggregate(BaseChart):
             )
 
             args = (self.x, self.y, geometry)
+            self.selected_geometry = geometry
 
             if isinstance(self.source, dask_cudf.DataFrame):
+                if self.selected_indices is not None:
+                    # drop the computation of the replaced selection
+                    cancel_futures(self.selected_indices)
                 self.selected_indices = (
                     self.source.assign(
                         **{
@@ -170,11 +177,31 @@ class BaseNonAggregate(BaseChart):
                 + f" and @{self.y}_min<={self.y}<=@{self.y}_max"
             )
             query_local_variables_dict.update(self.box_selected_range)
+            bounds = self.box_selected_range
+            self.query_predicate = And(
+                Range(
+                    self.x, bounds[self.x + "_min"], bounds[self.x + "_max"]
+                ),
+                Range(
+                    self.y, bounds[self.y + "_min"], bounds[self.y + "_max"]
+                ),
+            )
         else:
             if self.selected_indices is not None:
                 query_str_dict[self.name] = self.selected_indices
+                self.query_predicate = (
+                    Mask(self.selected_indices)
+                    if self.selected_geometry is None
+                    else Polygon(
+                        self.x,
+                        self.y,
+                        self.selected_geometry,
+                        mask=self.selected_indices,
+                    )
+                )
             else:
                 query_str_dict.pop(self.name, None)
+                self.query_predicate = None
 
             for key in [
                 self.x + "_min",
@@ -8,6 +8,7 @@ from typing import Tuple
 import panel as pn
 
 from ..core_chart import BaseChart
+from ....assets.predicates import Range
 
 
 class BaseStackedLine(BaseChart):
@@ -214,8 +215,10 @@ class BaseStackedLine(BaseChart):
                 self.x + "_max": self.x_range[1],
             }
             query_local_variables_dict.update(temp_local_dict)
+            self.query_predicate = Range(self.x, *self.x_range)
         else:
             query_str_dict.pop(self.name, None)
+            self.query_predicate = None
             for key in [self.x + "_min", self.x + "_max"]:
                 query_local_variables_dict.pop(key, None)
 
@@ -47,7 +47,9 @@ def choropleth(
     color_aggregate_fn: {'count', 'mean', 'sum', 'min', 'max', 'std'},
     default "count"
         aggregate function to be applied on the color column
-        while performing groupby aggregation by `column x`
+        while performing groupby aggregation by `column x`, or an
+        approximate aggregate: 'approx_nunique', 'approx_median', or
+        'approx_quantile_<q>', e.g. 'approx_quantile_0.9'
 
     color_factor: float, default 1
         factor to be multiplied to each value of color column before mapping
@@ -56,7 +58,8 @@ def choropleth(
     elevation_aggregate_fn: {'count', 'mean', 'sum', 'min', 'max', 'std'},
     default "count"
         aggregate function to be applied on the elevation column
-        while performing groupby aggregation by `column x`
+        while performing groupby aggregation by `column x`, or an
+        approximate aggregate as for color_aggregate_fn
 
     elevation_factor: float, default 1
         factor to be multiplied to each value of elevation column before
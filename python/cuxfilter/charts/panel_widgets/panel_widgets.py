@@ -56,6 +56,7 @@ def range_slider(
 def date_range_slider(
     x,
     data_points=None,
+    bin_by=None,
     **params,
 ):
     """
@@ -76,6 +77,10 @@ def date_range_slider(
 
     step_size: np.timedelta64, default np.timedelta64(days=1)
 
+    bin_by: {'minute', 'hour', 'day', 'week', 'month'}, default None
+        snap the selected range to whole calendar periods, weeks starting
+        on Monday
+
     **params:
         additional arguments to be passed to the function. See panel widgets
         documentation for more info,
@@ -87,6 +92,7 @@ def date_range_slider(
         data_points,
         step_size=None,
         step_size_type=CUDF_TIMEDELTA_TYPE,
+        bin_by=bin_by,
         **params,
     )
     plot.chart_type = "date_range_slider"
@@ -251,6 +257,9 @@ def number(
         e.g: "(x+y)/2" will result in number value = (df.x + df.y)/2
 
     aggregate_fn: {'count', 'mean', 'min', 'max','sum', 'std'}, default 'count'
+        or an approximate aggregate: 'approx_nunique', 'approx_median', or
+        'approx_quantile_<q>', e.g. 'approx_quantile_0.9', computed from
+        mergeable sketches of the values
 
     title: str,
         chart title
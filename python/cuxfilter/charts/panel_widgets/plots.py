@@ -1,13 +1,23 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import ast
 import datetime
 from ..core import BaseWidget
 from ..core.aggregate import BaseNumberChart
 from ..constants import (
     CUDF_DATETIME_TYPES,
 )
+from ...assets import datetime as dt
+from ...assets.aggregate_states import aggregate, aggregate_state
 from ...assets.cudf_utils import get_min_max
+from ...assets.predicates import Equals, In, Mask, Range
+from ...assets.filtered_view import FilteredView
+from ...assets.row_sample import (
+    ESTIMATED_AGGREGATES,
+    estimate_aggregate,
+    sample_weights,
+)
 from bokeh.models import ColumnDataSource
 import cudf
 import pandas as pd
@@ -17,6 +27,9 @@ import uuid
 
 
 class RangeSlider(BaseWidget):
+    # dragging the slider reloads the other charts from the data tiles
+    use_data_tiles = True
+
     def compute_stride(self):
         if self.stride_type is int and self.max_value < 1:
             self.stride_type = float
@@ -61,9 +74,15 @@ class RangeSlider(BaseWidget):
                 dashboard_cls._query_str_dict,
                 dashboard_cls._query_local_variables_dict,
             )
-            dashboard_cls._reload_charts()
+            dashboard_cls._reload_charts(released=False)
 
         self.chart.param.watch(widget_callback, ["value"], onlychanged=False)
+        # dashboards with exact_reload="release" reload the exact
+        # results once the slider is released
+        self.chart.param.watch(
+            lambda event: dashboard_cls._release_reload(),
+            ["value_throttled"],
+        )
 
     def compute_query_dict(self, query_str_dict, query_local_variables_dict):
         """
@@ -81,13 +100,32 @@ class RangeSlider(BaseWidget):
             query_str_dict[self.name] = query
             query_local_variables_dict[self.x + "_min"] = min_temp
             query_local_variables_dict[self.x + "_max"] = max_temp
+            self.query_predicate = Range(self.x, min_temp, max_temp)
         else:
             query_str_dict.pop(self.name, None)
+            self.query_predicate = None
             query_local_variables_dict.pop(self.x + "_min", None)
             query_local_variables_dict.pop(self.x + "_max", None)
 
 
 class DateRangeSlider(BaseWidget):
+    use_data_tiles = True
+    # calendar period the selected range snaps to, one of
+    # cuxfilter.assets.datetime.CALENDAR_UNITS
+    bin_by = None
+    # calendar period ids of every row when bin_by is set, the bins of the
+    # data tiles of the slider
+    bin_ids = None
+    n_bins = None
+
+    def __init__(self, *args, bin_by=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if bin_by is not None and bin_by not in dt.CALENDAR_UNITS:
+            raise ValueError(
+                f"bin_by must be one of {dt.CALENDAR_UNITS}, not {bin_by!r}"
+            )
+        self.bin_by = bin_by
+
     @property
     def x_dtype(self):
         if isinstance(self.source, ColumnDataSource):
@@ -125,6 +163,15 @@ class DateRangeSlider(BaseWidget):
             )
             del _series
         self.compute_stride()
+        if self.bin_by is not None:
+            self.n_bins = (
+                dt.calendar_bin_id(self.max_value, self.bin_by, self.x_dtype)
+                - dt.calendar_bin_id(self.min_value, self.bin_by, self.x_dtype)
+                + 1
+            )
+            self.bin_ids = dashboard_cls._get_bin_ids(
+                self.x, self.bin_by, self.min_value, self.n_bins
+            )
         self.generate_widget()
         self.add_events(dashboard_cls)
 
@@ -151,10 +198,16 @@ class DateRangeSlider(BaseWidget):
                 dashboard_cls._query_str_dict,
                 dashboard_cls._query_local_variables_dict,
             )
-            dashboard_cls._reload_charts()
+            dashboard_cls._reload_charts(released=False)
 
         # add callback to filter_Widget on value change
         self.chart.param.watch(widget_callback, ["value"], onlychanged=False)
+        # dashboards with exact_reload="release" reload the exact
+        # results once the slider is released
+        self.chart.param.watch(
+            lambda event: dashboard_cls._release_reload(),
+            ["value_throttled"],
+        )
 
     def compute_query_dict(self, query_str_dict, query_local_variables_dict):
         """
@@ -167,16 +220,24 @@ class DateRangeSlider(BaseWidget):
             reference to dashboard.__cls__.query_dict
         """
         if self.chart.value != (self.chart.start, self.chart.end):
-            min_temp, max_temp = (
-                datetime.datetime.fromordinal(x.toordinal())
-                for x in self.chart.value
-            )
+            if self.bin_by is not None:
+                # whole calendar periods, the bins of the data tiles
+                min_temp, max_temp = dt.snap_to_calendar(
+                    self.chart.value, self.bin_by, self.x_dtype
+                )
+            else:
+                min_temp, max_temp = (
+                    datetime.datetime.fromordinal(x.toordinal())
+                    for x in self.chart.value
+                )
             query = f"@{self.x}_min<={self.x}<=@{self.x}_max"
             query_str_dict[self.name] = query
             query_local_variables_dict[self.x + "_min"] = min_temp
             query_local_variables_dict[self.x + "_max"] = max_temp
+            self.query_predicate = Range(self.x, min_temp, max_temp)
         else:
             query_str_dict.pop(self.name, None)
+            self.query_predicate = None
             query_local_variables_dict.pop(self.x + "_min", None)
             query_local_variables_dict.pop(self.x + "_max", None)
 
@@ -230,10 +291,16 @@ class IntSlider(BaseWidget):
                 dashboard_cls._query_str_dict,
                 dashboard_cls._query_local_variables_dict,
             )
-            dashboard_cls._reload_charts()
+            dashboard_cls._reload_charts(released=False)
 
         # add callback to filter_Widget on value change
         self.chart.param.watch(widget_callback, ["value"], onlychanged=False)
+        # dashboards with exact_reload="release" reload the exact
+        # results once the slider is released
+        self.chart.param.watch(
+            lambda event: dashboard_cls._release_reload(),
+            ["value_throttled"],
+        )
         # self.add_reset_event(dashboard_cls)
 
     def compute_query_dict(self, query_str_dict, query_local_variables_dict):
@@ -250,8 +317,10 @@ class IntSlider(BaseWidget):
             query = f"{self.x} == @{self.x}_value"
             query_str_dict[self.name] = query
             query_local_variables_dict[self.x + "_value"] = self.chart.value
+            self.query_predicate = Equals(self.x, self.chart.value)
         else:
             query_str_dict.pop(self.name, None)
+            self.query_predicate = None
             query_local_variables_dict.pop(self.x + "_value", None)
 
 
@@ -303,10 +372,16 @@ class FloatSlider(BaseWidget):
                 dashboard_cls._query_str_dict,
                 dashboard_cls._query_local_variables_dict,
             )
-            dashboard_cls._reload_charts()
+            dashboard_cls._reload_charts(released=False)
 
         # add callback to filter_Widget on value change
         self.chart.param.watch(widget_callback, ["value"], onlychanged=False)
+        # dashboards with exact_reload="release" reload the exact
+        # results once the slider is released
+        self.chart.param.watch(
+            lambda event: dashboard_cls._release_reload(),
+            ["value_throttled"],
+        )
         # self.add_reset_event(dashboard_cls)
 
     def compute_query_dict(self, query_str_dict, query_local_variables_dict):
@@ -323,8 +398,10 @@ class FloatSlider(BaseWidget):
             query = f"{self.x} == @{self.x}_value"
             query_str_dict[self.name] = query
             query_local_variables_dict[self.x + "_value"] = self.chart.value
+            self.query_predicate = Equals(self.x, self.chart.value)
         else:
             query_str_dict.pop(self.name, None)
+            self.query_predicate = None
             query_local_variables_dict.pop(self.x + "_value", None)
 
 
@@ -403,6 +480,7 @@ class MultiChoice(BaseWidget):
         """
         if len(self.chart.value) == 0:
             query_str_dict.pop(self.name, None)
+            self.query_predicate = None
         else:
 
             def filter_source(s: cudf.Series, v: list):
@@ -419,6 +497,10 @@ class MultiChoice(BaseWidget):
                 query_str_dict[self.name] = filter_source(
                     self.source, self.chart.value
                 )
+            if self.source.dtype != "object":
+                self.query_predicate = In(self.x, self.chart.value)
+            elif self.name in query_str_dict:
+                self.query_predicate = Mask(query_str_dict[self.name])
 
     def apply_theme(self, theme):
         """
@@ -445,6 +527,38 @@ class MultiChoice(BaseWidget):
             ]
 
 
+def _expression_columns(expression, columns):
+    """
+    columns of `columns` read by a NumberChart expression, as data.<column>
+    or data["<column>"], None if it reads the data in any other way
+    """
+    tree = ast.parse(expression, mode="eval")
+    n_reads = sum(
+        isinstance(node, ast.Name) and node.id == "data"
+        for node in ast.walk(tree)
+    )
+    found = []
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, (ast.Attribute, ast.Subscript))
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "data"
+        ):
+            continue
+        if isinstance(node, ast.Attribute):
+            column = node.attr
+        else:
+            column = getattr(node.slice, "value", None)
+        if not isinstance(column, str) or column not in columns:
+            return None
+        n_reads -= 1
+        if column not in found:
+            found.append(column)
+    if n_reads > 0 or len(found) == 0:
+        return None
+    return found
+
+
 class DataSizeIndicator(BaseNumberChart):
     """
     Description:
@@ -461,17 +575,47 @@ class DataSizeIndicator(BaseNumberChart):
         return f"{self.chart_type}_{self.title}"
 
     def get_df_size(self, df):
+        if isinstance(df, FilteredView):
+            return len(df)
         if isinstance(df, dask_cudf.DataFrame):
             return df.shape[0].compute()
         return df.shape[0]
 
+    def compute_reload(self, data):
+        # only the number of selected rows is read, no column is gathered
+        return self.get_df_size(data)
+
+    @property
+    def progressive(self):
+        return True
+
+    def compute_partial(self, data):
+        return self.get_df_size(data)
+
+    def merge_partials(self, partial, other):
+        return partial + other
+
+    def result_from_partial(self, partial):
+        return partial
+
+    @property
+    def approximate(self):
+        return True
+
+    def compute_estimate(self, data, confidence):
+        weights = sample_weights(data)
+        # estimated number of rows, the sum of the weights
+        return estimate_aggregate(weights, weights, "count", confidence)
+
+    def apply_reload(self, result):
+        self.chart[0].value = int(result)
+        self.chart[1].value = int((self.chart[0].value / self.max_value) * 100)
+
     def reload_chart(self, data):
         """
         reload chart
         """
-        source_dict = {"X": list([1]), "Y": list([self.get_df_size(data)])}
-        self.chart[0].value = int(source_dict["Y"][0])
-        self.chart[1].value = int((self.chart[0].value / self.max_value) * 100)
+        self.apply_reload(self.get_df_size(data))
 
     def generate_chart(self, data):
         """
@@ -519,11 +663,17 @@ class NumberChart(BaseNumberChart):
     """
 
     expression = ""
+    # columns read by the expression, set by generate_chart
+    _expression_columns = None
 
     @property
     def name(self):
         return f"{self.expression}_{self.chart_type}_{self.title}"
 
+    @property
+    def data_columns(self):
+        return self._expression_columns
+
     def reload_chart(self, data):
         """
         calculate source
@@ -533,7 +683,45 @@ class NumberChart(BaseNumberChart):
             data: cudf.DataFrame
             patch_update: bool, default False
         """
-        self.chart.value = getattr(eval(self.expression), self.aggregate_fn)()
+        self.chart.value = aggregate(eval(self.expression), self.aggregate_fn)
+
+    def compute_reload(self, data):
+        # data is referenced by the expression
+        data = self._gather_columns(data)
+        return aggregate(eval(self.expression), self.aggregate_fn)
+
+    @property
+    def progressive(self):
+        # exact and approximate aggregates with a mergeable state
+        return aggregate_state(self.aggregate_fn) is not None
+
+    def compute_partial(self, data):
+        # data is referenced by the expression
+        data = self._gather_columns(data)
+        return aggregate_state(self.aggregate_fn).from_values(
+            eval(self.expression)
+        )
+
+    def merge_partials(self, partial, other):
+        return partial.merge(other)
+
+    def result_from_partial(self, partial):
+        return partial.finalize()
+
+    @property
+    def approximate(self):
+        return self.aggregate_fn in ESTIMATED_AGGREGATES
+
+    def compute_estimate(self, data, confidence):
+        weights = sample_weights(data)
+        # data is referenced by the expression
+        data = self._gather_columns(data)
+        return estimate_aggregate(
+            eval(self.expression), weights, self.aggregate_fn, confidence
+        )
+
+    def apply_reload(self, result):
+        self.chart.value = result
 
     def generate_chart(self, data):
         """
@@ -544,10 +732,13 @@ class NumberChart(BaseNumberChart):
             # with eval
             for i in data.columns:
                 self.expression = self.expression.replace(i, f"data.{i}")
+        self._expression_columns = _expression_columns(
+            self.expression, data.columns
+        )
 
         self.chart = pn.layout.Card(
             pn.indicators.Number(
-                value=int(getattr(eval(self.expression), self.aggregate_fn)()),
+                value=int(aggregate(eval(self.expression), self.aggregate_fn)),
                 format=self.format,
                 default_color=self.default_color,
                 colors=self.colors,
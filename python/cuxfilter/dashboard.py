@@ -4,22 +4,44 @@
 from typing import Dict, Union
 import bokeh.embed.util as u
 import cudf
+import cupy as cp
 import dask_cudf
+import numpy as np
+import pandas as pd
 import panel as pn
 from panel.io.server import get_server
 from bokeh.embed import server_document
+import functools
+import operator
 import os
+import re
 import urllib
 import warnings
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from cuxfilter.charts.core import BaseChart, BaseWidget, ViewDataFrame
 from cuxfilter.layouts import single_feature
 from cuxfilter.charts.panel_widgets import data_size_indicator
 from cuxfilter.assets import get_open_port, cudf_utils
+from cuxfilter.assets.numba_kernels import (
+    calc_bin_ids,
+    calc_fused_bincount,
+    stack_bin_ids,
+)
+from cuxfilter.assets.data_tiles import DataTiles
+from cuxfilter.assets.buffer_pool import BufferPool
+from cuxfilter.assets.filter_engine import FilterBitfield, exclusive_masks
+from cuxfilter.assets.predicates import And, Mask, Predicate, Range
+from cuxfilter.assets.filtered_view import FilteredView
+from cuxfilter.assets.reload_scheduler import ReloadScheduler
+from cuxfilter.assets.sorted_index import SortedIndex, RangeSelection
 from cuxfilter.themes import default
 
 DEFAULT_NOTEBOOK_URL = "http://localhost:8888"
+# number of bins of the data tiles of brushed columns that are not binned
+# by their chart
+DATA_TILES_BINS = 256
 
 
 def _get_host(url):
@@ -66,6 +88,66 @@ def _check_if_duplicates(charts):
         )
 
 
+def _signature_changed(old, new):
+    # predicates and query strings compare by value, index masks by identity
+    if isinstance(old, (tuple, Predicate)) and isinstance(
+        new, (tuple, Predicate)
+    ):
+        return old != new
+    return old is not new
+
+
+def _counts_bins(chart):
+    # binned aggregate charts able to reload from the counts of their bins
+    return getattr(chart, "bin_ids", None) is not None and hasattr(
+        chart, "result_from_counts"
+    )
+
+
+def _tileable(chart):
+    # charts able to reload from data tile counts
+    return getattr(chart, "use_data_tiles", False) and _counts_bins(chart)
+
+
+def _precomputed_mask(predicate):
+    # masks precomputed over the rows of the whole data do not apply to the
+    # rows of the sample
+    if isinstance(predicate, And):
+        return any(_precomputed_mask(p) for p in predicate.predicates)
+    return (
+        isinstance(predicate, Mask)
+        or getattr(predicate, "mask", None) is not None
+    )
+
+
+def _filter_in_order(df, predicates):
+    """
+    rows of a partition passing every predicate. The predicates after the
+    first only read their own columns at the positions of the rows that
+    survived the previous ones, and the surviving rows are gathered once.
+    """
+    positions = None
+    for predicate in predicates:
+        rows = (
+            df
+            if positions is None
+            else df[list(predicate.columns)].take(positions)
+        )
+        selected = cudf_utils.to_mask_array(predicate.evaluate(rows))
+        selected = cp.get_array_module(selected).flatnonzero(selected)
+        positions = selected if positions is None else positions[selected]
+    return df if positions is None else df.take(positions)
+
+
+def _reads_data(chart):
+    # BaseWidget.reload_chart is a no-op, widgets not overriding it do not
+    # display the filtered data
+    return not (
+        isinstance(chart, BaseWidget)
+        and type(chart).reload_chart is BaseWidget.reload_chart
+    )
+
+
 class DashBoard:
     """
     A cuxfilter GPU DashBoard object.
@@ -109,6 +191,8 @@ class DashBoard:
     _charts: Dict[str, Union[BaseChart, BaseWidget, ViewDataFrame]]
     _query_str_dict: Dict[str, str]
     _query_local_variables_dict = {}
+    _filter_engine: FilterBitfield = None
+    _buffer_pool: BufferPool = None
     _dashboard = None
     _theme = None
     _notebook_url = DEFAULT_NOTEBOOK_URL
@@ -127,6 +211,14 @@ class DashBoard:
 
         :meta private:
         """
+        return self._merge_indices(self._query_str_dict)
+
+    def _merge_indices(self, query_dict):
+        """
+        merge all the index columns present in query_dict into a single
+        boolean `cudf.Series` or `dask_cudf.Series`, None if there are no
+        index columns.
+        """
         result = None
         df_module = (
             cudf
@@ -135,7 +227,7 @@ class DashBoard:
         )
         selected_indices = {
             key: value.reset_index(drop=True)
-            for (key, value) in self._query_str_dict.items()
+            for (key, value) in query_dict.items()
             if type(value)
             in [
                 cudf.DataFrame,
@@ -165,11 +257,53 @@ class DashBoard:
         data_size_widget=True,
         show_warnings=False,
         layout_array=None,
+        use_sorted_index=False,
+        reload_interval=0,
+        reload_workers=0,
+        data_tiles_memory_limit=None,
+        cumulative_data_tiles=False,
+        progressive_chunk_size=0,
+        sample_size=0,
+        sample_stratify_by=None,
+        sample_confidence=0.95,
+        exact_reload="ready",
     ):
         self._cuxfilter_df = dataframe
+        self._progressive_chunk_size = progressive_chunk_size
+        if exact_reload not in ("ready", "release"):
+            raise ValueError(
+                f"exact_reload must be one of 'ready' or 'release', got "
+                f"{exact_reload!r}"
+            )
+        self._exact_reload = exact_reload
+        self._sample_confidence = sample_confidence
+        # row sample rendered while an interaction is in flight
+        self._sample = (
+            dataframe.build_sample(sample_size, stratify_by=sample_stratify_by)
+            if sample_size > 0
+            else None
+        )
+        self._data_tiles_memory_limit = data_tiles_memory_limit
+        self._cumulative_data_tiles = cumulative_data_tiles
+        self._use_sorted_index = use_sorted_index
         self._charts = dict()
         self._sidebar = dict()
         self._query_str_dict = dict()
+        self._init_filter_engine()
+        self._reload_scheduler = ReloadScheduler(
+            self._execute_reload, interval=reload_interval
+        )
+        # bumped on every reload request, a reload running for an older
+        # generation has been superseded by a newer filter state
+        self._reload_generation = 0
+        self._last_reload_stats = {"recomputed": 0, "skipped": 0}
+        # chart aggregations are computed concurrently on a thread pool when
+        # reload_workers > 0, the chart models are updated by the caller
+        self._reload_workers = reload_workers
+        self._reload_executor = None
+        # aggregations of the last reload still computing on the executor,
+        # in a server session
+        self._pending_futures = []
 
         # check if charts and sidebar lists contain cuxfilter.charts with
         # duplicate names
@@ -277,6 +411,7 @@ class DashBoard:
 
     def _reinit_all_charts(self):
         self._query_str_dict = dict()
+        self._init_filter_engine()
 
         for chart in self.charts.values():
             chart.initiate_chart(self)
@@ -294,6 +429,514 @@ class DashBoard:
             self.queried_indices,
         )
 
+    def _init_filter_engine(self):
+        """
+        (Re)create the per-row filter bitfield for in-memory dataframes.
+        dask_cudf backed dashboards keep evaluating the combined query
+        string lazily instead.
+        """
+        self._filter_signatures = dict()
+        # chart name -> signatures of the filters its last reload read
+        self._chart_inputs = dict()
+        self._filter_engine = None
+        # column -> SortedIndex, built lazily when a column is first filtered
+        self._sorted_indexes = dict()
+        # (filter name, column) -> RangeSelection
+        self._range_selections = dict()
+        # (column, stride, min_value, n_bins) -> bin ids of every row
+        self._bin_ids = dict()
+        # chart names -> (bin ids, bin ids stacked for the fused scan)
+        self._stacked_bin_ids = dict()
+        # tiles of the chart being brushed, and the filters seen by the
+        # previous reload, used to detect the start of a brush
+        self._data_tiles = None
+        self._reload_filters = dict()
+        data = getattr(self._cuxfilter_df, "data", None)
+        # scratch arrays of the aggregations, reused across reloads
+        if self._buffer_pool is not None:
+            self._buffer_pool.clear()
+        self._buffer_pool = BufferPool()
+        if isinstance(data, cudf.DataFrame):
+            self._filter_engine = FilterBitfield(
+                len(data), xp=cp, pool=self._buffer_pool
+            )
+        elif isinstance(data, pd.DataFrame):
+            self._filter_engine = FilterBitfield(
+                len(data), xp=np, pool=self._buffer_pool
+            )
+
+    def _query_predicate(self, name):
+        """
+        Predicate emitted by the chart owning the filter `name`, None for
+        charts that only provide a query string or an index mask.
+        """
+        chart = {**self._charts, **self._sidebar}.get(name)
+        return getattr(chart, "query_predicate", None)
+
+    def _filter_signature(self, name, value):
+        """
+        Signature of a self._query_str_dict entry, used to detect which
+        filters changed since the last sync: the predicate emitted by the
+        chart, or the query string along with the values of the local
+        variables it references, or the index mask object itself.
+        """
+        predicate = self._query_predicate(name)
+        if predicate is not None:
+            return predicate
+        if isinstance(value, str):
+            return (value,) + tuple(
+                (key, self._query_local_variables_dict.get(key))
+                for key in re.findall(r"@(\w+)", value)
+            )
+        return value
+
+    def _filter_changed(self, name, value):
+        if name not in self._filter_signatures:
+            return True
+        return _signature_changed(
+            self._filter_signatures[name], self._filter_signature(name, value)
+        )
+
+    def _chart_input(self, chart):
+        """
+        Signatures of the filters the data of `chart` depends on: every
+        active filter, except its own for charts with
+        `ignore_own_filter=True`.
+        """
+        return {
+            name: self._filter_signature(name, value)
+            for name, value in self._query_str_dict.items()
+            if not (
+                name == chart.name
+                and getattr(chart, "ignore_own_filter", False)
+            )
+        }
+
+    def _chart_input_changed(self, chart, chart_input):
+        """
+        whether the filters `chart` depends on changed since its last reload
+        """
+        old = self._chart_inputs.get(chart.name)
+        if old is None or old.keys() != chart_input.keys():
+            return True
+        return any(
+            _signature_changed(old[name], chart_input[name])
+            for name in chart_input
+        )
+
+    def _get_bin_ids(self, column, stride, min_value, n_bins):
+        """
+        Fixed-width bin ids of every row of `column`, computed on first use
+        and shared by the charts binning the column the same way.
+
+        Returns None for dask_cudf dataframes, the rows of a lazily
+        filtered dataframe are not addressable.
+        """
+        if self._filter_engine is None:
+            return None
+        key = (column, stride, min_value, n_bins)
+        if key not in self._bin_ids:
+            self._bin_ids[key] = calc_bin_ids(
+                self._cuxfilter_df.data[column], stride, min_value, n_bins
+            )
+        return self._bin_ids[key]
+
+    def _get_sorted_index(self, column):
+        """
+        SortedIndex of `column`, built on first use. None for columns that
+        cannot be indexed (nulls present).
+        """
+        if column not in self._sorted_indexes:
+            self._sorted_indexes[column] = SortedIndex.from_series(
+                self._cuxfilter_df.data[column]
+            )
+        return self._sorted_indexes[column]
+
+    def _active_tile_chart(self):
+        """
+        The chart being brushed: the chart with `use_data_tiles` (aggregate
+        charts, range sliders) whose range filter is the only filter changed
+        since the previous reload, or whose data tiles are still valid. None
+        if there is no such chart.
+        """
+        filters = {
+            name: self._filter_signature(name, value)
+            for name, value in self._query_str_dict.items()
+        }
+        changed = [
+            name
+            for name in filters.keys() | self._reload_filters.keys()
+            if name not in filters
+            or name not in self._reload_filters
+            or _signature_changed(self._reload_filters[name], filters[name])
+        ]
+        tiles = self._data_tiles
+        if tiles is not None and changed in ([], [tiles.active]):
+            name = tiles.active
+        elif len(changed) == 1:
+            name = changed[0]
+        else:
+            return None
+        chart = self.charts.get(name)
+        predicate = getattr(chart, "query_predicate", None)
+        if (
+            not getattr(chart, "use_data_tiles", False)
+            or not isinstance(predicate, Range)
+            or predicate.column != chart.x
+        ):
+            return None
+        return chart
+
+    def _fused_results(self, charts, view, exclusive_views):
+        """
+        Reload results of the binned `charts` counting the rows of the same
+        FilteredView, computed together by calc_fused_bincount in a single
+        pass over the selected rows, as a dictionary chart name -> result.
+        """
+        if self._filter_engine is None:
+            return {}
+        groups = {}
+        for chart in charts:
+            chart_view = exclusive_views.get(chart.name, view)
+            if _counts_bins(chart) and chart_view.data is chart.source:
+                groups.setdefault(id(chart_view), (chart_view, []))[1].append(
+                    chart
+                )
+        results = {}
+        for chart_view, group in groups.values():
+            if len(group) < 2:
+                continue
+            counts = calc_fused_bincount(
+                self._get_stacked_bin_ids(group),
+                [chart.n_bins for chart in group],
+                chart_view.selection,
+                pool=self._buffer_pool,
+            )
+            for chart, chart_counts in zip(group, counts):
+                results[chart.name] = chart.result_from_counts(chart_counts)
+        return results
+
+    def _get_stacked_bin_ids(self, charts):
+        """
+        bin ids of `charts` stacked row-major by stack_bin_ids, cached for
+        the set of charts
+        """
+        key = tuple(chart.name for chart in charts)
+        bin_ids = [chart.bin_ids for chart in charts]
+        cached = self._stacked_bin_ids.get(key)
+        if cached is None or any(
+            a is not b for a, b in zip(cached[0], bin_ids)
+        ):
+            cached = self._stacked_bin_ids[key] = (
+                bin_ids,
+                stack_bin_ids(bin_ids),
+            )
+        return cached[1]
+
+    def _data_tile_results(self, charts):
+        """
+        Reload results of the `charts` served from the data tiles of the
+        chart being brushed, as a dictionary chart name -> result. The
+        tiles are built when the brushing starts, and dropped when another
+        filter changes or when they would exceed
+        `data_tiles_memory_limit`, the charts are then reloaded from the
+        filtered rows. The edge bins of a brush are counted through the
+        sorted index of the brushed column, the tiles are only built with
+        `use_sorted_index`.
+        """
+        if (
+            self._filter_engine is None
+            or not self._data_tiles_memory_limit
+            or not self._use_sorted_index
+        ):
+            return {}
+        active = self._active_tile_chart()
+        if active is None:
+            self._data_tiles = None
+            return {}
+        tiled = [
+            chart
+            for chart in charts
+            if chart is not active
+            and _tileable(chart)
+            # the tiles are built with the filters of the other charts
+            and not (
+                getattr(chart, "ignore_own_filter", False)
+                and chart.name in self._query_str_dict
+            )
+        ]
+        if len(tiled) == 0:
+            return {}
+        signature = {
+            name: self._filter_signature(name, value)
+            for name, value in self._query_str_dict.items()
+            if name != active.name
+        }
+        tiles = self._data_tiles
+        if (
+            tiles is None
+            or tiles.active != active.name
+            or tiles.signature.keys() != signature.keys()
+            or any(
+                _signature_changed(tiles.signature[name], signature[name])
+                for name in signature
+            )
+            or any(chart.name not in tiles.tiles for chart in tiled)
+        ):
+            tiles = self._data_tiles = self._build_data_tiles(
+                active, tiled, signature
+            )
+            if tiles is None:
+                return {}
+        predicate = active.query_predicate
+        return {
+            chart.name: chart.result_from_counts(
+                tiles.counts(chart.name, predicate.lo, predicate.hi)
+            )
+            for chart in tiled
+        }
+
+    def _tile_bins(self, chart):
+        """
+        (bin ids, number of bins) of the column brushed by `chart`: the bins
+        of binned aggregate charts, or DATA_TILES_BINS bins between the min
+        and max of the column for the other charts (e.g. range sliders).
+        (None, None) if the column cannot be binned.
+        """
+        if getattr(chart, "bin_ids", None) is not None:
+            return chart.bin_ids, chart.n_bins
+        data = self._cuxfilter_df.data
+        if data[chart.x].dtype.kind not in ("i", "u", "f", "M"):
+            return None, None
+        min_value, max_value = cudf_utils.get_min_max(data, chart.x)
+        if not max_value > min_value:
+            return None, None
+        stride = (max_value - min_value) / (DATA_TILES_BINS - 1)
+        return (
+            self._get_bin_ids(chart.x, stride, min_value, DATA_TILES_BINS),
+            DATA_TILES_BINS,
+        )
+
+    def _build_data_tiles(self, active, charts, signature):
+        bin_ids, n_bins = self._tile_bins(active)
+        tiled = {chart.name: (chart.bin_ids, chart.n_bins) for chart in charts}
+        if (
+            bin_ids is None
+            or DataTiles.nbytes(bin_ids, n_bins, tiled)
+            > self._data_tiles_memory_limit
+        ):
+            return None
+        index = self._get_sorted_index(active.x)
+        if index is None:
+            return None
+        self._sync_filters()
+        return DataTiles(
+            active.name,
+            bin_ids,
+            n_bins,
+            index,
+            self._filter_engine.selection(exclude=[active.name]),
+            tiled,
+            signature,
+            cumulative=self._cumulative_data_tiles,
+        )
+
+    def _range_mask(self, name, column, lo, hi):
+        """
+        Resolve `lo <= column <= hi` for the filter `name` through the
+        sorted index of the column, built on first use. Only the rows
+        between the previous and the new bounds of the filter are updated.
+
+        Returns None for columns that cannot be indexed (nulls present).
+        """
+        index = self._get_sorted_index(column)
+        if index is None:
+            return None
+        if (name, column) not in self._range_selections:
+            self._range_selections[(name, column)] = RangeSelection(index)
+        return self._range_selections[(name, column)].update(lo, hi)
+
+    def _compute_filter_mask(self, name, value):
+        """
+        Compute the positional boolean mask of the rows selected by a single
+        self._query_str_dict entry, from the chart predicate when available.
+        """
+        range_mask = (
+            functools.partial(self._range_mask, name)
+            if self._use_sorted_index
+            else None
+        )
+        predicate = self._query_predicate(name)
+        if predicate is not None:
+            value = predicate.evaluate(
+                self._cuxfilter_df.data, range_mask=range_mask
+            )
+        elif isinstance(value, str):
+            value = cudf_utils.query_mask(
+                self._cuxfilter_df.data,
+                value,
+                self._query_local_variables_dict,
+                range_mask=range_mask,
+            )
+        return cudf_utils.to_mask_array(value)
+
+    def _sync_filters(self):
+        """
+        Rewrite the filter bits of the charts whose entry in
+        self._query_str_dict changed since the last sync, and release the
+        bits of the filters that have been removed. Unchanged filters are
+        not re-evaluated.
+
+        Every filter is evaluated over the full columns, since its bit is
+        read by the all-but-own selections of the other charts, so unlike
+        the dask_cudf path of _filtered_data the filters are not ordered by
+        selectivity here.
+        """
+        engine = self._filter_engine
+        for name in engine.filters:
+            if name not in self._query_str_dict:
+                engine.remove_filter(name)
+                self._filter_signatures.pop(name, None)
+                for key in list(self._range_selections):
+                    if key[0] == name:
+                        self._range_selections.pop(key)
+        for name, value in self._query_str_dict.items():
+            if self._filter_changed(name, value):
+                engine.set_filter(name, self._compute_filter_mask(name, value))
+                self._filter_signatures[name] = self._filter_signature(
+                    name, value
+                )
+
+    def _filtered_data(self, exclude=None):
+        """
+        Return the dashboard data filtered by all active filters, except the
+        filters of the charts named in `exclude`.
+        """
+        if isinstance(exclude, str):
+            exclude = [exclude]
+        exclude = exclude or []
+        data = self._cuxfilter_df.data
+
+        if self._filter_engine is not None:
+            return self._filtered_view(exclude).materialize()
+
+        # index masks and opaque query strings are evaluated over the full
+        # dataframe, predicates are then applied in increasing order of
+        # estimated selectivity, each one only reading the rows that
+        # survived the previous ones
+        masks, predicates = [], []
+        for name, value in self._query_str_dict.items():
+            if name in exclude:
+                continue
+            predicate = self._query_predicate(name)
+            if (
+                isinstance(value, str)
+                and predicate is not None
+                and not _precomputed_mask(predicate)
+            ):
+                predicates.append((self._filter_selectivity(name), predicate))
+            else:
+                masks.append(self._filter_mask_series(name, value))
+        if len(masks) == 0 and len(predicates) == 0:
+            return data
+        if len(masks) > 0:
+            data = data[functools.reduce(operator.and_, masks)]
+        if len(predicates) > 0:
+            # one partition function, the dask optimizer merges chained
+            # filters into one predicate over all the rows
+            data = data.map_partitions(
+                _filter_in_order,
+                [
+                    predicate
+                    for _, predicate in sorted(
+                        predicates, key=lambda item: item[0]
+                    )
+                ],
+                meta=data._meta,
+            )
+        return cudf_utils.cull_empty_partitions(data)
+
+    def _filtered_view(self, exclude=None):
+        """
+        Return a FilteredView of the dashboard data filtered by all active
+        filters, except the filters of the charts named in `exclude`. For
+        in-memory dataframes the view holds the bitfield selection and no
+        column is copied until a chart gathers it.
+        """
+        if self._filter_engine is None:
+            return FilteredView(self._filtered_data(exclude))
+        if isinstance(exclude, str):
+            exclude = [exclude]
+        self._sync_filters()
+        return FilteredView(
+            self._cuxfilter_df.data, self._filter_engine.selection(exclude)
+        )
+
+    def _filter_selectivity(self, name):
+        """
+        Estimated fraction of the rows passing the filter `name`, from the
+        bin counts of the unfiltered data held by the chart owning it.
+        Filters without an estimate are assumed to select every row.
+        """
+        chart = {**self._charts, **self._sidebar}.get(name)
+        predicate = self._query_predicate(name)
+        estimate = None
+        if predicate is not None and hasattr(chart, "estimate_selectivity"):
+            estimate = chart.estimate_selectivity(predicate)
+        return 1.0 if estimate is None else estimate
+
+    def _filter_mask_series(self, name, value):
+        """
+        Lazy boolean Series of the rows selected by a single
+        self._query_str_dict entry, used for dask_cudf backed dashboards.
+        Index masks are aligned on the dataframe index.
+        """
+        predicate = self._query_predicate(name)
+        if isinstance(value, str) and predicate is not None:
+            return predicate.evaluate(self._cuxfilter_df.data)
+        if isinstance(value, str):
+            return cudf_utils.query_mask(
+                self._cuxfilter_df.data,
+                value,
+                self._query_local_variables_dict,
+            )
+        return self._merge_indices({name: value})
+
+    def _exclusive_views(self, names):
+        """
+        Return a dictionary of chart name -> FilteredView of the data
+        filtered by every active filter except the chart's own, for the
+        charts in `names` that have an active filter.
+
+        In-memory dataframes use the filter bitfield. For dask_cudf
+        dataframes all the exclusive masks are built from one prefix and
+        one suffix pass of ANDs over the per-filter masks, instead of one
+        query per chart.
+        """
+        names = [name for name in names if name in self._query_str_dict]
+        if len(names) == 0:
+            return {}
+        if self._filter_engine is not None:
+            return {name: self._filtered_view(exclude=name) for name in names}
+
+        data = self._cuxfilter_df.data
+        filter_names = list(self._query_str_dict.keys())
+        masks = exclusive_masks(
+            [
+                self._filter_mask_series(name, value)
+                for name, value in self._query_str_dict.items()
+            ]
+        )
+        result = {}
+        for name in names:
+            mask = masks[filter_names.index(name)]
+            result[name] = FilteredView(
+                data
+                if mask is None
+                else cudf_utils.cull_empty_partitions(data[mask])
+            )
+        return result
+
     def _generate_query_str(self, query_dict=None, ignore_chart=""):
         """
         Generate query string based on current crossfiltered state of
@@ -369,7 +1012,7 @@ class DashBoard:
             print("final query", self._generate_query_str())
             if self.queried_indices is not None:
                 print("polygon selected using lasso selection tool")
-            return self._query(self._generate_query_str())
+            return self._filtered_data()
         else:
             print("no querying done, returning original dataframe")
             return self._cuxfilter_df.data
@@ -596,26 +1239,458 @@ class DashBoard:
         """
         stop the bokeh server
         """
+        self._reload_scheduler.cancel()
+        if self._reload_executor is not None:
+            self._reload_executor.shutdown(wait=False, cancel_futures=True)
+            self._reload_executor = None
+        self._buffer_pool.clear()
         if self.server._stopped is False:
             self.server.stop()
             self.server._started = False
             self.server._stopped = True
             self.server._tornado.stop()
 
-    def _reload_charts(self, data=None, include_cols=[], ignore_cols=[]):
+    @property
+    def reload_stats(self):
+        """
+        Read-only property returning the number of reload requests received
+        from the charts and the number of reloads executed, as a dictionary.
+        """
+        return self._reload_scheduler.stats
+
+    @property
+    def last_reload_stats(self):
+        """
+        Read-only property returning the number of charts recomputed and the
+        number of charts skipped by the last reload, as a dictionary.
+        Charts are skipped when none of the filters their data depends on
+        changed since their last reload, and widgets not displaying the
+        filtered data are never recomputed.
+        """
+        return dict(self._last_reload_stats)
+
+    def _reload_charts(
+        self, data=None, include_cols=[], ignore_cols=[], released=True
+    ):
+        """
+        Request a reload of the charts with the current filter state.
+
+        Requests from the chart callbacks are coalesced by the reload
+        scheduler, running at most one reload per `reload_interval`
+        milliseconds with the latest filter state. Reloads with explicit
+        arguments run immediately.
+
+        With a sample, the approximate charts are first rendered from the
+        sample, and the exact reload is requested on the next tick of the
+        document, or only when the interaction is `released` for
+        `exact_reload="release"`.
+        """
+        self._reload_generation += 1
+        if data is None and len(include_cols) == 0 and len(ignore_cols) == 0:
+            if self._sample is None:
+                self._reload_scheduler.request()
+                return
+            self._sample_reload()
+            if released or self._exact_reload == "ready":
+                self._run_next_tick(self._reload_scheduler.request)
+        else:
+            self._execute_reload(data, include_cols, ignore_cols)
+
+    def _release_reload(self):
+        """
+        Called when a slider is released, requests the exact reload of
+        dashboards with `exact_reload="release"`.
+        """
+        if self._exact_reload == "release":
+            self._reload_charts()
+
+    def _run_next_tick(self, fn):
+        """
+        Run `fn` in a next tick callback of the bokeh document in a server
+        session, so the model updates made so far are sent to the browser
+        first, and right away otherwise.
+        """
+        doc = self._server_document()
+        if doc is None:
+            fn()
+        else:
+            doc.add_next_tick_callback(fn)
+
+    def _server_document(self):
+        """
+        bokeh document of the server session the dashboard is served in,
+        None outside of a server session
+        """
+        doc = pn.state.curdoc
+        if doc is None or doc.session_context is None:
+            return None
+        return doc
+
+    def _sample_mask(self, name, value):
+        """
+        Boolean mask of the rows of the sample selected by the filter
+        `name`, None if the filter can not be evaluated on the sample (index
+        masks and masks precomputed over the whole data).
+        """
+        if not isinstance(value, str):
+            return None
+        sample = self._sample.data
+        predicate = self._query_predicate(name)
+        if predicate is None:
+            return cudf_utils.query_mask(
+                sample, value, self._query_local_variables_dict
+            )
+        if _precomputed_mask(predicate):
+            return None
+        return predicate.evaluate(sample)
+
+    def _sample_view(self, exclude=()):
+        """
+        FilteredView of the sample filtered by all active filters, except
+        the filters of the charts named in `exclude`. None if a filter can
+        not be evaluated on the sample.
+        """
+        masks = []
+        for name, value in self._query_str_dict.items():
+            if name in exclude:
+                continue
+            mask = self._sample_mask(name, value)
+            if mask is None:
+                return None
+            masks.append(cudf_utils.to_mask_array(mask))
+        if len(masks) == 0:
+            return FilteredView(self._sample.data)
+        return FilteredView(
+            self._sample.data, functools.reduce(operator.and_, masks)
+        )
+
+    def _sample_reload(self):
+        """
+        Render the approximate charts from the sample, scaled up to the
+        whole data, with their confidence intervals. The next reload
+        recomputes their exact results.
+        """
+        views = {}
+        for chart in self.charts.values():
+            if not getattr(chart, "approximate", False):
+                continue
+            exclude = (
+                (chart.name,)
+                if getattr(chart, "ignore_own_filter", False)
+                else ()
+            )
+            if exclude not in views:
+                views[exclude] = self._sample_view(exclude)
+            if views[exclude] is None:
+                continue
+            chart.apply_estimate(
+                chart.compute_estimate(views[exclude], self._sample_confidence)
+            )
+            self._chart_inputs.pop(chart.name, None)
+
+    def _get_reload_executor(self):
+        """
+        thread pool computing the chart aggregations, created on first use
+        and shut down by `stop`. None if `reload_workers` is 0
+        """
+        if self._reload_workers and self._reload_executor is None:
+            self._reload_executor = ThreadPoolExecutor(
+                max_workers=self._reload_workers,
+                thread_name_prefix="cuxfilter-reload",
+            )
+        return self._reload_executor
+
+    def _superseded(self, generation):
+        """
+        whether a reload started for `generation` has been superseded by a
+        newer reload request
+        """
+        return generation != self._reload_generation
+
+    def _reload_chart(self, chart, view):
+        """
+        Reload a single chart on the calling thread.
+        """
+        if hasattr(chart, "compute_reload"):
+            chart.apply_reload(chart.compute_reload(view))
+        elif hasattr(chart, "reload"):
+            chart.reload(view)
+        else:
+            chart.reload_chart(view.materialize())
+
+    def _apply_when_done(self, doc, chart, future, generation, chart_input):
+        """
+        Apply `future`, the compute_reload of `chart` submitted to the
+        reload executor, in a next tick callback of the document once it is
+        computed. The result is dropped if a newer reload request arrived
+        meanwhile, the next reload recomputes the chart.
+        """
+
+        def apply():
+            if future.cancelled() or self._superseded(generation):
+                return
+            chart.apply_reload(future.result())
+            chart.confidence_interval = None
+            if chart_input is not None:
+                self._chart_inputs[chart.name] = chart_input
+
+        # add_next_tick_callback is the thread-safe entry to the document
+        future.add_done_callback(lambda _: doc.add_next_tick_callback(apply))
+
+    def _view_chunks(self, view):
+        """
+        Split a FilteredView into FilteredViews of consecutive chunks of
+        rows: the partitions of a dask_cudf dataframe, and chunks of
+        `progressive_chunk_size` rows of the base data of an in-memory
+        dataframe, selected by row ids.
+        """
+        data = view.data
+        if isinstance(data, dask_cudf.DataFrame):
+            for i in range(data.npartitions):
+                yield FilteredView(data.get_partition(i).compute())
+            return
+        xp = cp if isinstance(data, cudf.DataFrame) else np
+        selection = view.selection
+        if selection is not None and selection.dtype != bool:
+            # sorted row ids, split with a binary search per chunk
+            selection = xp.sort(selection)
+        for start in range(0, len(data), self._progressive_chunk_size):
+            stop = min(start + self._progressive_chunk_size, len(data))
+            if selection is None:
+                rows = xp.arange(start, stop)
+            elif selection.dtype == bool:
+                rows = xp.flatnonzero(selection[start:stop]) + start
+            else:
+                rows = selection[
+                    int(xp.searchsorted(selection, start)) : int(
+                        xp.searchsorted(selection, stop)
+                    )
+                ]
+            yield FilteredView(data, rows)
+
+    def _progressive_steps(
+        self, charts, view, exclusive_views, generation, chart_inputs
+    ):
+        """
+        Generator reloading the progressive `charts` chunk by chunk of their
+        filtered rows. Every step aggregates the next chunk of every view,
+        merges it into the partial aggregates of the previous chunks and
+        pushes the intermediate results to the charts, the last step pushes
+        the exact results. In a server session the steps run in separate
+        callbacks of the document, the remaining steps are dropped once a
+        newer reload request arrived between two of them.
+        """
+        groups = {}
+        for chart in charts:
+            chart_view = exclusive_views.get(chart.name, view)
+            groups.setdefault(id(chart_view), (chart_view, []))[1].append(
+                chart
+            )
+        chunks = [
+            (self._view_chunks(chart_view), group)
+            for chart_view, group in groups.values()
+        ]
+        partials = {}
+        while len(chunks) > 0:
+            remaining = []
+            for view_chunks, group in chunks:
+                chunk = next(view_chunks, None)
+                if chunk is None:
+                    continue
+                remaining.append((view_chunks, group))
+                for chart in group:
+                    partial = chart.compute_partial(chunk)
+                    if chart.name in partials:
+                        partial = chart.merge_partials(
+                            partials[chart.name], partial
+                        )
+                    partials[chart.name] = partial
+                    chart.apply_reload(chart.result_from_partial(partial))
+                    chart.confidence_interval = None
+            chunks = remaining
+            yield
+            if self._superseded(generation):
+                return
+        for chart in charts:
+            if chart.name not in partials:
+                # no rows to chunk, reloaded in one go
+                self._reload_chart(
+                    chart, exclusive_views.get(chart.name, view)
+                )
+                chart.confidence_interval = None
+            if chart.name in chart_inputs:
+                self._chart_inputs[chart.name] = chart_inputs[chart.name]
+
+    def _run_progressive(self, steps):
+        """
+        Run the steps of a progressive reload. In a server session every
+        step runs in its own callback of the bokeh document event loop, so
+        the intermediate results are sent to the browser and interaction
+        events are handled between two chunks. The steps run back to back
+        otherwise.
+        """
+        doc = self._server_document()
+        if doc is None:
+            for _ in steps:
+                pass
+            return
+
+        def step():
+            if next(steps, StopIteration) is not StopIteration:
+                doc.add_next_tick_callback(step)
+
+        step()
+
+    def _execute_reload(self, data=None, include_cols=[], ignore_cols=[]):
         """
         Reload charts with current self._cuxfilter_df.data state.
+
+        Charts receive a FilteredView and gather only the columns they
+        read. Charts with `ignore_own_filter=True` are reloaded with the
+        data filtered by every active filter except their own.
+
+        Charts are skipped when none of the filters their data depends on
+        changed since their last reload, see `last_reload_stats`.
+
+        With `reload_workers > 0` the `compute_reload` half of every chart
+        runs on the reload executor. In a server session the document
+        thread is released meanwhile, and every result is applied in a
+        callback of the document once computed, unless a newer reload
+        request arrived: the aggregations of the older reload that did not
+        start yet are cancelled, the results of the running ones dropped.
+        Outside of a server session the results are applied in chart order
+        on the calling thread.
+
+        With `progressive_chunk_size > 0` the progressive charts are
+        reloaded last, chunk by chunk, see `_progressive_steps`.
         """
-        if data is None:
-            # get current data as per the active queries
-            data = self._query(self._generate_query_str())
+        generation = self._reload_generation
+        for future in self._pending_futures:
+            future.cancel()
+        self._pending_futures = []
         if len(include_cols) == 0:
             include_cols = self.charts.keys()
+        charts = [
+            chart
+            for chart in self.charts.values()
+            if chart.name not in ignore_cols
+            and chart.name in include_cols
+            and hasattr(chart, "reload_chart")
+        ]
+        skipped = 0
+        chart_inputs = {}
+        if data is None:
+            # only recompute the charts whose input filters changed since
+            # their last reload
+            stale = []
+            for chart in charts:
+                chart_input = self._chart_input(chart)
+                if _reads_data(chart) and self._chart_input_changed(
+                    chart, chart_input
+                ):
+                    chart_inputs[chart.name] = chart_input
+                    stale.append(chart)
+                else:
+                    skipped += 1
+            charts = stale
+        else:
+            # explicitly passed data does not match the filter state, the
+            # next reload recomputes these charts
+            for chart in charts:
+                self._chart_inputs.pop(chart.name, None)
+            skipped = sum(1 for chart in charts if not _reads_data(chart))
+            charts = [chart for chart in charts if _reads_data(chart)]
+
+        precomputed = {}
+        exclusive_views = {}
+        if data is None:
+            precomputed = self._data_tile_results(charts)
+            self._reload_filters = {
+                name: self._filter_signature(name, value)
+                for name, value in self._query_str_dict.items()
+            }
+            scanned = [
+                chart for chart in charts if chart.name not in precomputed
+            ]
+            # get current data as per the active queries
+            view = self._filtered_view() if len(scanned) > 0 else None
+            exclusive_views = self._exclusive_views(
+                [
+                    chart.name
+                    for chart in scanned
+                    if getattr(chart, "ignore_own_filter", False)
+                ]
+            )
+            # binned histograms reading the same rows, counted in one scan
+            precomputed.update(
+                self._fused_results(scanned, view, exclusive_views)
+            )
+        elif isinstance(data, FilteredView):
+            view = data
+        else:
+            view = FilteredView(data)
+        # charts reloaded chunk by chunk after the other charts
+        progressive = []
+        if data is None and self._progressive_chunk_size > 0:
+            progressive = [
+                chart
+                for chart in charts
+                if chart.name not in precomputed
+                and getattr(chart, "progressive", False)
+            ]
+            charts = [chart for chart in charts if chart not in progressive]
+        # compute the chart aggregations concurrently
+        futures = {}
+        executor = self._get_reload_executor()
+        if executor is not None:
+            futures = {
+                chart.name: executor.submit(
+                    chart.compute_reload,
+                    exclusive_views.get(chart.name, view),
+                )
+                for chart in charts
+                if hasattr(chart, "compute_reload")
+                and chart.name not in precomputed
+            }
+        doc = self._server_document() if len(futures) > 0 else None
+        if doc is not None:
+            self._pending_futures = list(futures.values())
         # reloading charts as per current data state
-        for chart in self.charts.values():
-            if (
-                chart.name not in ignore_cols
-                and chart.name in include_cols
-                and hasattr(chart, "reload_chart")
-            ):
-                chart.reload_chart(data)
+        recomputed = 0
+        for chart in charts:
+            recomputed += 1
+            if chart.name in futures and doc is not None:
+                self._apply_when_done(
+                    doc,
+                    chart,
+                    futures[chart.name],
+                    generation,
+                    chart_inputs.get(chart.name),
+                )
+                continue
+            if chart.name in precomputed:
+                chart.apply_reload(precomputed[chart.name])
+            elif chart.name in futures:
+                chart.apply_reload(futures[chart.name].result())
+            else:
+                self._reload_chart(
+                    chart, exclusive_views.get(chart.name, view)
+                )
+            chart.confidence_interval = None
+            if chart.name in chart_inputs:
+                self._chart_inputs[chart.name] = chart_inputs[chart.name]
+        if len(progressive) > 0:
+            self._run_progressive(
+                self._progressive_steps(
+                    progressive,
+                    view,
+                    exclusive_views,
+                    generation,
+                    chart_inputs,
+                )
+            )
+            recomputed += len(progressive)
+        self._last_reload_stats = {
+            "recomputed": recomputed,
+            "skipped": skipped,
+        }
@@ -10,6 +10,7 @@ from cuxfilter.dashboard import DashBoard
 from cuxfilter.layouts import single_feature
 from cuxfilter.themes import default
 from cuxfilter.assets import notebook_assets
+from cuxfilter.assets.row_sample import RowSample
 
 
 def read_arrow(source):
@@ -28,6 +29,7 @@ class DataFrame:
     data: Type[cudf.DataFrame] = None
     is_graph = False
     edges: Type[cudf.DataFrame] = None
+    sample: RowSample = None
 
     @classmethod
     def from_arrow(cls, dataframe_location):
@@ -169,6 +171,33 @@ class DataFrame:
             return data.set_index(data.index.to_series(), npartitions=2)
         return data
 
+    def build_sample(self, sample_size, stratify_by=None, seed=0):
+        """
+        Build the row sample of the data used by dashboards for approximate
+        answers, once: the sample is kept on the DataFrame and only rebuilt
+        when asked for with other parameters.
+
+        Parameters
+        ----------
+        sample_size: int
+            expected number of sampled rows
+        stratify_by: str, optional
+            column to stratify the sample by, so that the rows of its rare
+            values are represented, default uniform sample
+        seed: int, default 0
+
+        Returns
+        -------
+        cuxfilter.assets.row_sample.RowSample
+        """
+        if self.sample is None or not self.sample.matches(
+            sample_size, stratify_by, seed
+        ):
+            self.sample = RowSample.from_data(
+                self.data, sample_size, stratify_by=stratify_by, seed=seed
+            )
+        return self.sample
+
     def preprocess_data(self):
         self.data = self.validate_dask_index(self.data)
         if self.is_graph:
@@ -184,6 +213,16 @@ class DataFrame:
         data_size_widget=True,
         warnings=False,
         layout_array=None,
+        use_sorted_index=False,
+        reload_interval=0,
+        reload_workers=0,
+        data_tiles_memory_limit=None,
+        cumulative_data_tiles=False,
+        progressive_chunk_size=0,
+        sample_size=0,
+        sample_stratify_by=None,
+        sample_confidence=0.95,
+        exact_reload="ready",
     ):
         """
         Creates a cuxfilter.DashBoard object
@@ -209,6 +248,72 @@ class DataFrame:
             flag to disable or enable runtime warnings related to layouts,
             default False
 
+        use_sorted_index: boolean
+            flag to resolve range filters (range sliders, histogram and
+            box selections) through a per-column sorted index, built the
+            first time a column is filtered. Moving a range then only
+            updates the rows between the old and new bounds, at the cost of
+            keeping the argsort and the sorted values of each filtered
+            column in memory, default False
+
+        reload_interval: float
+            minimum interval in milliseconds between two reloads of the
+            charts. Interaction events received in between are coalesced
+            into a single reload with the latest filter state. With the
+            default 0 the charts are reloaded on every event
+
+        reload_workers: int
+            number of threads computing the chart aggregations of a reload
+            concurrently. The chart models are still updated one after
+            another on the document thread. With the default 0 the charts
+            are reloaded sequentially
+
+        data_tiles_memory_limit: int
+            maximum size in bytes of the data tiles built when brushing an
+            aggregate chart or dragging a range slider. The tiles hold the
+            bin x bin counts of the brushed column against every other
+            binned aggregate chart, so the other charts are updated without
+            scanning the rows. The limit counts the tiles and the temporary
+            arrays needed to build them, charts are reloaded from the rows
+            when they would be larger. The tiles require use_sorted_index.
+            Default None, the data tiles are disabled
+
+        cumulative_data_tiles: bool
+            store the data tiles as running sums over the bins of the
+            brushed chart (or range slider), so a range brush costs a
+            single subtraction per bin of the other charts, whatever the
+            width of the range, default False
+
+        progressive_chunk_size: int
+            reload the histograms, bar charts and number charts chunk by
+            chunk of this many filtered rows (of every partition for
+            dask_cudf dataframes), pushing the intermediate results after
+            every chunk, until the exact result is shown with the last one.
+            A new interaction aborts the remaining chunks. Charts updated
+            from the data tiles or from a fused count of the cached bin
+            ids are not chunked. With the default 0 the charts are
+            reloaded in one go
+
+        sample_size: int
+            number of rows of the sample of the data (see build_sample),
+            e.g. 1_000_000. When set, every interaction first renders the
+            histograms, bar charts, number charts and the data size
+            indicator from the sample, scaled up to the whole data, then
+            replaces the estimates with the exact results. The bounds of
+            the confidence intervals of the displayed estimates are
+            available as `chart.confidence_interval`. Default 0, no sample
+
+        sample_stratify_by: str
+            column to stratify the sample by, default uniform sample
+
+        sample_confidence: float
+            confidence level of the intervals of the estimates, default 0.95
+
+        exact_reload: {"ready", "release"}
+            with a sample, replace the estimates with the exact results as
+            soon as they are computed ("ready", default), or only once the
+            slider being dragged is released ("release")
+
         Examples
         --------
         >>> import cudf
@@ -246,4 +351,14 @@ class DataFrame:
             data_size_widget=data_size_widget,
             show_warnings=warnings,
             layout_array=layout_array,
+            use_sorted_index=use_sorted_index,
+            reload_interval=reload_interval,
+            reload_workers=reload_workers,
+            data_tiles_memory_limit=data_tiles_memory_limit,
+            cumulative_data_tiles=cumulative_data_tiles,
+            progressive_chunk_size=progressive_chunk_size,
+            sample_size=sample_size,
+            sample_stratify_by=sample_stratify_by,
+            sample_confidence=sample_confidence,
+            exact_reload=exact_reload,
         )
@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from functools import reduce
+
+import pytest
+
+import cudf
+import dask_cudf
+import numpy as np
+import pandas as pd
+
+from cuxfilter.assets.aggregate_states import (
+    AGGREGATE_STATES,
+    AggregateState,
+    aggregate,
+    aggregate_state,
+    approx_quantile,
+    is_sketch,
+)
+
+rng = np.random.default_rng(0)
+# large mean, small spread
+values = pd.Series(rng.normal(1e6, 1, 999))
+values[::7] = np.nan
+chunks = [values[i : i + 100] for i in range(0, len(values), 100)]
+
+
+@pytest.mark.parametrize("aggregate_fn", list(AGGREGATE_STATES))
+@pytest.mark.parametrize("to_series", [cudf.Series, pd.Series])
+def test_update_and_merge(aggregate_fn, to_series):
+    state_cls = AGGREGATE_STATES[aggregate_fn]
+    expected = getattr(values, aggregate_fn)()
+
+    # updated chunk by chunk, an empty chunk included
+    state = reduce(
+        lambda state, chunk: state.update(to_series(chunk)),
+        chunks + [values[:0]],
+        state_cls(),
+    )
+    assert np.isclose(state.finalize(), expected)
+
+    # merged pairwise
+    states = [state_cls.from_values(to_series(chunk)) for chunk in chunks]
+    while len(states) > 1:
+        states = [
+            reduce(state_cls.merge, states[i : i + 2])
+            for i in range(0, len(states), 2)
+        ]
+    assert np.isclose(states[0].finalize(), expected)
+
+
+@pytest.mark.parametrize(
+    "aggregate_fn",
+    [fn for fn, state in AGGREGATE_STATES.items() if state.invertible],
+)
+def test_subtract(aggregate_fn):
+    state_cls = AGGREGATE_STATES[aggregate_fn]
+
+    state = state_cls.from_values(values).subtract(
+        state_cls.from_values(chunks[0])
+    )
+
+    assert np.isclose(
+        state.finalize(), getattr(values[100:], aggregate_fn)(), rtol=1e-7
+    )
+
+
+def test_subtract_not_invertible():
+    with pytest.raises(TypeError):
+        AGGREGATE_STATES["min"]().subtract(AGGREGATE_STATES["min"]())
+
+
+def test_incomplete_state():
+    class NoFinalize(AggregateState):
+        fields = {"count": 0}
+
+        @classmethod
+        def from_values(cls, values):
+            return cls(count=len(values))
+
+        def merge(self, other):
+            return type(self)(count=self.count + other.count)
+
+    # fails when the state is built, not when a reload finalizes it
+    with pytest.raises(TypeError):
+        NoFinalize.from_values(values)
+
+
+@pytest.mark.parametrize("aggregate_fn", list(AGGREGATE_STATES))
+def test_aggregate(aggregate_fn):
+    df = dask_cudf.from_cudf(cudf.Series(values), npartitions=4)
+
+    assert np.isclose(
+        aggregate(df, aggregate_fn), getattr(values, aggregate_fn)()
+    )
+    assert np.isclose(
+        aggregate(cudf.Series(values), aggregate_fn),
+        getattr(values, aggregate_fn)(),
+    )
+
+
+@pytest.mark.parametrize(
+    "aggregate_fn, expected",
+    [
+        ("approx_nunique", values.nunique()),
+        ("approx_median", values.median()),
+        ("approx_quantile_0.9", values.quantile(0.9)),
+    ],
+)
+def test_sketch_states(aggregate_fn, expected):
+    state_cls = aggregate_state(aggregate_fn)
+
+    state = reduce(
+        state_cls.merge,
+        [state_cls.from_values(chunk) for chunk in chunks + [values[:0]]],
+    )
+
+    assert np.isclose(state.finalize(), expected, rtol=0.05)
+    assert np.isclose(
+        aggregate(
+            dask_cudf.from_cudf(cudf.Series(values), npartitions=4),
+            aggregate_fn,
+        ),
+        expected,
+        rtol=0.05,
+    )
+    assert np.isclose(aggregate(values, aggregate_fn), expected, rtol=0.05)
+
+
+def test_approx_quantile():
+    assert approx_quantile(0.25) == "approx_quantile_0.25"
+    # the names are parsed, without registering them first
+    assert aggregate_state("approx_quantile_0.75").quantile == 0.75
+    assert is_sketch("approx_quantile_0.75")
+    assert not is_sketch("mean")
+    with pytest.raises(ValueError):
+        approx_quantile(2)
+    with pytest.raises(ValueError):
+        aggregate_state("approx_quantile_1.5")
+    with pytest.raises(ValueError):
+        aggregate_state("approx_quantile_high")
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cupy as cp
+import numpy as np
+
+from cuxfilter.assets.buffer_pool import BufferPool
+
+
+@pytest.mark.parametrize("xp", [np, cp])
+def test_acquire_release(xp):
+    pool = BufferPool()
+    buffer = pool.acquire(10, np.int64, xp, fill=0)
+    assert isinstance(buffer, xp.ndarray)
+    assert buffer.shape == (10,)
+    assert int(buffer.sum()) == 0
+    buffer[:] = 1
+    pool.release(buffer)
+    # sizes are rounded up to a power of two
+    assert pool.nbytes == 16 * 8
+
+    # same dtype and size bucket, the buffer is reused with a new shape
+    reused = pool.acquire((2, 5), np.int64, xp, fill=0)
+    assert reused.shape == (2, 5)
+    assert int(reused.sum()) == 0
+    assert (pool.hits, pool.misses) == (1, 1)
+    assert pool.nbytes == 0
+
+    # a different key allocates
+    other = pool.acquire(10, np.int32, xp)
+    assert other.dtype == np.int32
+    assert pool.misses == 2
+
+
+def test_max_buffers_and_clear():
+    pool = BufferPool(max_buffers=2)
+    buffers = [pool.acquire(4, np.uint8) for _ in range(3)]
+    for buffer in buffers:
+        pool.release(buffer)
+    assert pool.nbytes == 8
+
+    pool.clear()
+    assert pool.nbytes == 0
+    pool.acquire(4, np.uint8)
+    assert pool.misses == 4
+
+
+@pytest.mark.parametrize("xp", [np, cp])
+def test_size_buckets(xp):
+    pool = BufferPool()
+    # two selections of different sizes share the same bucket
+    buffer = pool.acquire(1000, np.float64, xp)
+    assert buffer.shape == (1000,)
+    pool.release(buffer)
+    reused = pool.acquire(700, np.float64, xp, fill=1)
+    assert reused.shape == (700,)
+    assert int(reused.sum()) == 700
+    assert (pool.hits, pool.misses) == (1, 1)
+    pool.release(reused)
+    assert pool.nbytes == 1024 * 8
+
+
+def test_max_bytes():
+    pool = BufferPool(max_bytes=3072)
+    for size in range(100, 2000, 37):
+        pool.release(pool.acquire(size, np.uint8))
+        assert pool.nbytes <= 3072
+    # the least recently used sizes were evicted, the latest is kept
+    misses = pool.misses
+    pool.acquire(1900, np.uint8)
+    pool.acquire(100, np.uint8)
+    assert pool.misses == misses + 1
+
+    # buffers larger than the pool are not kept
+    pool.release(pool.acquire(4096, np.uint8))
+    assert pool.nbytes <= 3072
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cudf
+import cupy as cp
+import numpy as np
+import pandas as pd
+
+from cuxfilter.assets import cudf_utils
+
+df_args = {"key": [0, 1, 2, 3, 4], "val": [float(i + 10) for i in range(5)]}
+
+
+@pytest.mark.parametrize("df_module", [cudf, pd])
+@pytest.mark.parametrize(
+    "query, local_dict, result",
+    [
+        (
+            "@key_min<=key<=@key_max",
+            {"key_min": 1, "key_max": 3},
+            [False, True, True, True, False],
+        ),
+        (
+            "key == @key_value",
+            {"key_value": 2},
+            [False, False, True, False, False],
+        ),
+        ("key in (0,4)", {}, [True, False, False, False, True]),
+        ("key<3 and val>10", {}, [False, True, True, False, False]),
+        ("key<1 or val>=14", {}, [True, False, False, False, True]),
+    ],
+)
+def test_query_mask(df_module, query, local_dict, result):
+    df = df_module.DataFrame(df_args)
+    mask = cudf_utils.to_mask_array(
+        cudf_utils.query_mask(df, query, local_dict)
+    )
+
+    assert np.array_equal(cp.asnumpy(mask), np.array(result, dtype=bool))
+    assert df[mask].equals(df.query(query, local_dict=local_dict))
+
+
+@pytest.mark.parametrize("df_module", [cudf, pd])
+def test_query_mask_fallback_repeated_index(df_module):
+    # the arithmetic is evaluated by DataFrame.query, and the labels of the
+    # selected row are shared with unselected ones
+    df = df_module.DataFrame(df_args, index=[0, 0, 1, 1, 1])
+    mask = cudf_utils.to_mask_array(
+        cudf_utils.query_mask(df, "key + 1 == 4", {})
+    )
+
+    assert np.array_equal(
+        cp.asnumpy(mask), np.array([False, False, False, True, False])
+    )
+
+
+@pytest.mark.parametrize("df_module", [cudf, pd])
+def test_to_mask_array(df_module):
+    mask = df_module.DataFrame({"a": [True, None, True], "b": [1, 1, 0]})
+
+    assert np.array_equal(
+        cp.asnumpy(cudf_utils.to_mask_array(mask)), [True, False, False]
+    )
+    assert np.array_equal(
+        cp.asnumpy(cudf_utils.to_mask_array(mask["a"])), [True, False, True]
+    )
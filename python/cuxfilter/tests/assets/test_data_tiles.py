@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cupy as cp
+import numpy as np
+
+from cuxfilter.assets.data_tiles import DataTiles
+from cuxfilter.assets.sorted_index import SortedIndex
+
+rng = np.random.default_rng(0)
+x = rng.normal(size=5000) * 3
+y = rng.uniform(0, 10, size=5000)
+x_bin_ids = np.rint((x - x.min()) / ((x.max() - x.min()) / 20)).astype(
+    np.int16
+)
+y_bin_ids = np.rint(y / 0.5).astype(np.int16)
+selection = rng.uniform(size=5000) < 0.7
+
+
+@pytest.mark.parametrize("xp", [cp, np])
+@pytest.mark.parametrize("cumulative", [True, False])
+@pytest.mark.parametrize("use_selection", [True, False])
+@pytest.mark.parametrize(
+    "lo, hi", [(-1, 1), (-100, 100), (0.3, 0.31), (5, 4), (-2.2, 3.7)]
+)
+def test_counts(xp, cumulative, use_selection, lo, hi):
+    tiles = DataTiles(
+        "x",
+        xp.asarray(x_bin_ids),
+        21,
+        SortedIndex(xp.asarray(x)),
+        xp.asarray(selection) if use_selection else None,
+        {"y": (xp.asarray(y_bin_ids), 21)},
+        cumulative=cumulative,
+    )
+    mask = (x >= lo) & (x <= hi)
+    if use_selection:
+        mask &= selection
+
+    assert np.array_equal(
+        tiles.counts("y", lo, hi), np.bincount(y_bin_ids[mask], minlength=21)
+    )
+
+
+def test_nbytes():
+    bin_ids = np.zeros(100, dtype=np.int16)
+    charts = {"y": (bin_ids, 10), "z": (bin_ids, 4)}
+
+    tiles = (21 * 11 + 21 * 5) * 4
+    # sorted and int64 bin ids of the active column
+    kept = 100 * 2 + 2 * 100 * 8
+    # temporaries of the largest tile
+    build = 100 * 2 + 2 * 100 * 8 + 21 * 11 * 8
+    assert DataTiles.nbytes(bin_ids, 20, charts) == tiles + kept + build
@@ -119,3 +119,72 @@ def test_to_np_dt64_if_datetime(dates, _type, result_dates):
 )
 def test_to_int64_if_datetime(dates, _type, result_dates):
     assert (dt.to_int64_if_datetime(dates, _type) == result_dates).all()
+
+
+dates = pd.Series(
+    pd.to_datetime(
+        [
+            "1969-12-31 23:59:59",
+            "1970-01-01 00:00:00",
+            "2024-02-29 13:30:00",
+            "2024-03-04 00:00:00",
+            "2024-12-31 23:00:00",
+        ]
+    )
+)
+
+
+@pytest.mark.parametrize(
+    "bin_by, expected",
+    [
+        ("hour", dates.dt.floor("h")),
+        ("day", dates.dt.floor("D")),
+        ("week", dates.dt.to_period("W-SUN").dt.start_time),
+        ("month", dates.dt.to_period("M").dt.start_time),
+    ],
+)
+@pytest.mark.parametrize("unit", ["s", "ms", "ns"])
+@pytest.mark.parametrize("to_series", [cudf.Series, pd.Series])
+def test_calendar_bin_ids(bin_by, expected, unit, to_series):
+    series = to_series(dates.astype(f"datetime64[{unit}]"))
+
+    ids = dt.calendar_bin_ids(series, bin_by)
+    if isinstance(ids, cudf.Series):
+        ids = ids.to_pandas()
+
+    starts = dt.calendar_bin_starts(
+        int(ids.min()), int(ids.max() - ids.min()) + 1, bin_by, series.dtype
+    )
+    assert np.array_equal(
+        starts[(ids - ids.min()).to_numpy()],
+        expected.astype(f"datetime64[{unit}]").to_numpy(),
+    )
+
+
+def test_calendar_bin_ids_nulls():
+    ids = dt.calendar_bin_ids(
+        pd.Series([pd.NaT, pd.Timestamp("2000-02-01")]), "month"
+    )
+
+    assert np.isnan(ids[0])
+    assert ids[1] == 30 * 12 + 1
+
+
+@pytest.mark.parametrize(
+    "bin_by, lo, hi",
+    [
+        ("hour", "2024-02-10 13:00:00", "2024-03-03 09:59:59"),
+        ("day", "2024-02-10", "2024-03-03 23:59:59"),
+        ("week", "2024-02-05", "2024-03-03 23:59:59"),
+        ("month", "2024-02-01", "2024-03-31 23:59:59"),
+    ],
+)
+def test_snap_to_calendar(bin_by, lo, hi):
+    assert dt.snap_to_calendar(
+        (
+            datetime.datetime(2024, 2, 10, 13, 20),
+            np.datetime64("2024-03-03T09:15"),
+        ),
+        bin_by,
+        "datetime64[s]",
+    ) == (pd.Timestamp(lo), pd.Timestamp(hi))
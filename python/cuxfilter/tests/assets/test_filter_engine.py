@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cupy as cp
+import numpy as np
+
+from cuxfilter.assets.buffer_pool import BufferPool
+from cuxfilter.assets.filter_engine import FilterBitfield, exclusive_masks
+
+mask_a = [True, True, False, False, True, True]
+mask_b = [True, False, True, False, True, False]
+
+
+@pytest.mark.parametrize("xp", [np, cp])
+class TestFilterBitfield:
+    def test_selection(self, xp):
+        bitfield = FilterBitfield(6, xp=xp)
+        assert bitfield.selection() is None
+
+        bitfield.set_filter("a", xp.asarray(mask_a))
+        bitfield.set_filter("b", xp.asarray(mask_b))
+
+        assert bitfield.filters == ["a", "b"]
+        assert np.array_equal(
+            cp.asnumpy(bitfield.selection()),
+            [True, False, False, False, True, False],
+        )
+
+    @pytest.mark.parametrize(
+        "exclude, result",
+        [
+            ("a", mask_b),
+            ("b", mask_a),
+            (["a", "b"], None),
+            ("c", [True, False, False, False, True, False]),
+        ],
+    )
+    def test_selection_exclude(self, xp, exclude, result):
+        bitfield = FilterBitfield(6, xp=xp)
+        bitfield.set_filter("a", xp.asarray(mask_a))
+        bitfield.set_filter("b", xp.asarray(mask_b))
+
+        selection = bitfield.selection(exclude=exclude)
+        if result is None:
+            assert selection is None
+        else:
+            assert np.array_equal(cp.asnumpy(selection), result)
+
+    def test_set_filter_rewrites_own_bit(self, xp):
+        bitfield = FilterBitfield(6, xp=xp)
+        bitfield.set_filter("a", xp.asarray(mask_a))
+        bitfield.set_filter("b", xp.asarray(mask_b))
+        version_b = bitfield.versions["b"]
+
+        bitfield.set_filter("a", xp.ones(6, dtype=bool))
+
+        assert np.array_equal(cp.asnumpy(bitfield.selection()), mask_b)
+        assert bitfield.versions["b"] == version_b
+        assert bitfield.versions["a"] > version_b
+
+    def test_remove_filter(self, xp):
+        bitfield = FilterBitfield(6, xp=xp)
+        bitfield.set_filter("a", xp.asarray(mask_a))
+        bitfield.set_filter("b", xp.asarray(mask_b))
+        bitfield.remove_filter("a")
+
+        assert "a" not in bitfield
+        assert np.array_equal(cp.asnumpy(bitfield.selection()), mask_b)
+
+        # the released bit is reused by the next filter
+        bitfield.set_filter("c", xp.asarray(mask_a))
+        assert len(bitfield) == 2
+        assert bitfield.bits.dtype == np.uint8
+
+    def test_widening(self, xp):
+        bitfield = FilterBitfield(6, xp=xp)
+        for i in range(9):
+            bitfield.set_filter(str(i), xp.ones(6, dtype=bool))
+        bitfield.set_filter("a", xp.asarray(mask_a))
+
+        assert bitfield.bits.dtype == np.uint16
+        assert np.array_equal(cp.asnumpy(bitfield.selection()), mask_a)
+        assert np.array_equal(
+            cp.asnumpy(bitfield.selection(exclude="a")), [True] * 6
+        )
+
+    def test_buffer_pool(self, xp):
+        pool = BufferPool()
+        bitfield = FilterBitfield(6, xp=xp, pool=pool)
+        for mask in [mask_a, mask_b, mask_a]:
+            bitfield.set_filter("a", xp.asarray(mask))
+            bitfield.set_filter("b", xp.asarray(mask_b))
+            selection = bitfield.selection(exclude="b")
+            assert np.array_equal(cp.asnumpy(selection), mask)
+
+        # a single scratch array is allocated and then reused
+        assert pool.misses == 1
+        assert pool.hits > 0
+
+    def test_invalid_mask_length(self, xp):
+        bitfield = FilterBitfield(6, xp=xp)
+        with pytest.raises(ValueError):
+            bitfield.set_filter("a", xp.ones(5, dtype=bool))
+
+
+@pytest.mark.parametrize("n_masks", [0, 1, 2, 5])
+def test_exclusive_masks(n_masks):
+    masks = [np.random.default_rng(i).random(20) > 0.3 for i in range(n_masks)]
+    result = exclusive_masks(masks)
+
+    assert len(result) == n_masks
+    for i in range(n_masks):
+        others = [mask for j, mask in enumerate(masks) if j != i]
+        if len(others) == 0:
+            assert result[i] is None
+        else:
+            assert np.array_equal(result[i], np.logical_and.reduce(others))
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cudf
+import cupy as cp
+import numpy as np
+import pandas as pd
+
+from cuxfilter.assets.filtered_view import FilteredView
+
+df_args = {
+    "key": [0, 1, 2, 3, 4],
+    "val": [float(i + 10) for i in range(5)],
+    "other": [5, 6, 7, 8, 9],
+}
+
+
+@pytest.mark.parametrize("df_module, xp", [(cudf, cp), (pd, np)])
+@pytest.mark.parametrize(
+    "selection",
+    [
+        None,
+        [True, False, True, False, True],
+        [0, 2, 4],
+    ],
+)
+def test_project(df_module, xp, selection):
+    df = df_module.DataFrame(df_args)
+    rows = [0, 1, 2, 3, 4] if selection is None else [0, 2, 4]
+    view = FilteredView(
+        df, None if selection is None else xp.asarray(selection)
+    )
+
+    assert len(view) == len(rows)
+    assert list(view.columns) == list(df.columns)
+    assert view.project(["key"]).equals(df[["key"]].iloc[rows])
+    assert view.project(["key", "val"]).equals(df[["key", "val"]].iloc[rows])
+    assert view.materialize().equals(df.iloc[rows])
+    # projections are shared between the charts reading the same columns
+    assert view.project(["key"]) is view.project(["key"])
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cupy as cp
+import numpy as np
+
+from cuxfilter.assets.numba_kernels import calc_fused_bincount, stack_bin_ids
+
+rng = np.random.default_rng(0)
+x_bin_ids = rng.integers(0, 6, 1000).astype(np.int16)
+y_bin_ids = rng.integers(0, 11, 1000).astype(np.int32)
+mask = rng.uniform(size=1000) < 0.5
+
+
+@pytest.mark.parametrize("xp", [cp, np])
+@pytest.mark.parametrize(
+    "selection, rows",
+    [(None, slice(None)), (mask, mask), (np.nonzero(mask)[0], mask)],
+)
+def test_calc_fused_bincount(xp, selection, rows):
+    stacked = stack_bin_ids([xp.asarray(x_bin_ids), xp.asarray(y_bin_ids)])
+    if selection is not None:
+        selection = xp.asarray(selection)
+
+    x_counts, y_counts = calc_fused_bincount(stacked, [5, 10], selection)
+
+    # the last bin id of each chart holds the null rows
+    assert np.array_equal(
+        x_counts, np.bincount(x_bin_ids[rows], minlength=6)[:5]
+    )
+    assert np.array_equal(
+        y_counts, np.bincount(y_bin_ids[rows], minlength=11)[:10]
+    )
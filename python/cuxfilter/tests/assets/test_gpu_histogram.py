@@ -5,9 +5,13 @@ import pytest
 
 from cuxfilter.assets.numba_kernels import gpu_histogram
 import cudf
+import cupy as cp
+import dask_cudf
 import numpy as np
+import pandas as pd
 from numba import cuda
 
+from cuxfilter.assets.buffer_pool import BufferPool
 from cuxfilter.charts.core.core_chart import BaseChart
 
 test_arr1 = [1, 5, 10, 11, 15, 22, 23, 25, 27, 30, 35, 39, 99, 104, 109]
@@ -62,6 +66,110 @@ def test_calc_value_counts(custom_binning, result):
     assert np.array_equal(_result, result)
 
 
+@pytest.mark.parametrize(
+    "to_series",
+    [
+        cudf.Series,
+        pd.Series,
+        lambda x: dask_cudf.from_cudf(cudf.Series(x), npartitions=3),
+    ],
+)
+def test_calc_bincount(to_series):
+    x = to_series(np.array(test_arr3 * 50))
+    stride = (109 - 1) / 8
+
+    bin_values, counts = gpu_histogram.calc_bincount(x, stride, 1, 9)
+
+    # empty bins are kept, the output has a fixed length
+    assert np.array_equal(
+        bin_values, [1.0, 14.5, 28.0, 41.5, 55.0, 68.5, 82.0, 95.5, 109.0]
+    )
+    assert np.array_equal(counts, [100, 150, 300, 100, 0, 0, 0, 50, 150])
+
+
+def test_calc_bincount_clip_and_nulls():
+    x = cudf.Series([-5.0, 0.0, None, 2.0, 10.0])
+
+    bin_values, counts = gpu_histogram.calc_bincount(x, 1.0, 0.0, 3)
+
+    assert np.array_equal(counts, [2, 0, 2])
+
+
+@pytest.mark.parametrize(
+    "to_values",
+    [
+        lambda x: cudf.Series(x, nan_as_null=False),
+        pd.Series,
+        cp.asarray,
+        np.asarray,
+    ],
+)
+def test_calc_bincount_nan(to_values):
+    x = to_values(np.array([0.0, np.nan, 1.0, np.nan, 2.0, 2.0]))
+
+    bin_values, counts = gpu_histogram.calc_bincount(x, 1.0, 0.0, 3)
+
+    # NaN values are not counted
+    assert np.array_equal(counts, [1, 1, 2])
+
+
+def test_calc_bincount_nat():
+    x = np.array(
+        ["2020-01-01", "NaT", "2020-01-02", "NaT", "2020-01-03"],
+        dtype="datetime64[ns]",
+    )
+
+    bin_values, counts = gpu_histogram.calc_bincount(
+        x, np.timedelta64(1, "D"), np.datetime64("2020-01-01"), 3
+    )
+
+    # NaT values are not counted
+    assert np.array_equal(counts, [1, 1, 1])
+
+
+@pytest.mark.parametrize("to_values", [cudf.Series, np.asarray])
+def test_calc_bincount_pool(to_values):
+    values = np.array(test_arr3 * 50, dtype=float)
+    stride = (109 - 1) / 8
+    pool = BufferPool()
+
+    # two selections of different sizes
+    for size in [len(values), len(values) - 100]:
+        x = to_values(values[:size])
+        _, expected = gpu_histogram.calc_bincount(x, stride, 1, 9)
+        _, counts = gpu_histogram.calc_bincount(x, stride, 1, 9, pool=pool)
+        assert np.array_equal(counts, expected)
+
+    # the scratch arrays of the first call are reused by the second
+    assert (pool.hits, pool.misses) == (2, 2)
+    assert pool.nbytes == 2 * 8 * BufferPool._bucket(len(values))
+
+
+@pytest.mark.parametrize("df_module", [cudf, pd])
+def test_calc_bin_ids(df_module):
+    x = df_module.Series([-5.0, 0.0, None, 2.0, 10.0, 0.6])
+
+    bin_ids = gpu_histogram.calc_bin_ids(x, 1.0, 0.0, 3)
+
+    assert bin_ids.dtype == np.int16
+    # nulls get the id n_bins
+    assert np.array_equal(np.asarray(bin_ids.tolist()), [0, 0, 3, 2, 2, 1])
+
+    bin_values, counts = gpu_histogram.calc_bincount_from_bin_ids(
+        bin_ids, x.dtype, 1.0, 0.0, 3
+    )
+    assert np.array_equal(bin_values, [0.0, 1.0, 2.0])
+    assert np.array_equal(counts, [2, 1, 2])
+
+    selection = np.array([True, False, True, True, False, True])
+    if df_module is cudf:
+        selection = cp.asarray(selection)
+    _, counts = gpu_histogram.calc_bincount_from_bin_ids(
+        bin_ids, x.dtype, 1.0, 0.0, 3, selection
+    )
+    assert np.array_equal(counts, [1, 1, 1])
+
+
 @pytest.mark.parametrize(
     "aggregate_fn, result",
     [
@@ -124,6 +232,237 @@ def test_calc_groupby_for_nulls(x, y, aggregate_fn, result):
     )
 
 
+@pytest.mark.parametrize(
+    "agg",
+    [
+        {"val": "count", "val2": "sum"},
+        {"val": "min", "val2": "max"},
+        {"val": "mean", "val2": "var"},
+        {"val": "std", "val2": "mean"},
+    ],
+)
+def test_calc_groupby_dask_multiple_aggregates(agg):
+    rng = np.random.default_rng(0)
+    pdf = pd.DataFrame(
+        {
+            "key": rng.integers(0, 7, 1000).astype(float),
+            "val": rng.normal(5, 2, 1000),
+            # large mean, small spread
+            "val2": rng.normal(1e6, 1, 1000),
+        }
+    )
+    pdf.loc[::13, "val"] = np.nan
+    pdf.loc[::17, "key"] = np.nan
+    df = dask_cudf.from_cudf(cudf.from_pandas(pdf), npartitions=5)
+    bc = BaseChart()
+    bc.x = "key"
+
+    result = gpu_histogram.calc_groupby(bc, df, agg=agg).to_pandas()
+    expected = (
+        pdf.dropna(subset=["key"])
+        .groupby("key", sort=True, as_index=False)
+        .agg(agg)
+    )
+
+    assert list(result.columns) == ["key", *agg]
+    assert np.allclose(
+        result.to_numpy(dtype=float),
+        expected.to_numpy(dtype=float),
+        equal_nan=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "to_series",
+    [
+        cudf.Series,
+        pd.Series,
+        lambda s: dask_cudf.from_cudf(cudf.Series(s), npartitions=2),
+    ],
+)
+def test_calc_bincount_calendar(to_series):
+    dates = pd.Series(
+        pd.to_datetime(
+            [
+                "2024-01-15 00:00",
+                "2024-01-31 23:59",
+                "2024-03-01 00:00",
+                None,
+                "2024-04-30 00:00",
+            ]
+        )
+    )
+    min_value = dates.min()
+    series = to_series(dates)
+
+    bin_values, counts = gpu_histogram.calc_bincount(
+        series, "month", min_value, 4
+    )
+
+    assert np.array_equal(
+        bin_values,
+        pd.to_datetime(
+            ["2024-01-01", "2024-02-01", "2024-03-01", "2024-04-01"]
+        ).to_numpy(),
+    )
+    assert np.array_equal(counts, [2, 0, 1, 1])
+    if not isinstance(series, dask_cudf.Series):
+        # nulls get the id n_bins
+        bin_ids = gpu_histogram.calc_bin_ids(series, "month", min_value, 4)
+        assert np.array_equal(cp.asnumpy(bin_ids), [0, 0, 2, 4, 3])
+
+
+@pytest.mark.parametrize(
+    "to_df",
+    [
+        cudf.from_pandas,
+        lambda df: df,
+        lambda df: dask_cudf.from_cudf(cudf.from_pandas(df), npartitions=5),
+    ],
+)
+def test_calc_groupby_sketches(to_df):
+    rng = np.random.default_rng(0)
+    pdf = pd.DataFrame(
+        {
+            "key": rng.integers(0, 7, 10_000).astype(float),
+            "val": rng.integers(0, 500, 10_000).astype(float),
+            "val2": rng.normal(5, 2, 10_000),
+        }
+    )
+    pdf["val3"] = pdf["val2"]
+    pdf.loc[::13, "val"] = np.nan
+    pdf.loc[::17, "key"] = np.nan
+    bc = BaseChart()
+    bc.x = "key"
+    # with an exact aggregate
+    agg = {"val": "approx_nunique", "val2": "approx_median", "val3": "mean"}
+
+    result = gpu_histogram.calc_groupby(bc, to_df(pdf), agg=agg)
+    if isinstance(result, cudf.DataFrame):
+        result = result.to_pandas()
+    expected = (
+        pdf.dropna(subset=["key"])
+        .groupby("key", sort=True, as_index=False)
+        .agg({"val": "nunique", "val2": "median", "val3": "mean"})
+    )
+
+    assert list(result.columns) == ["key", *agg]
+    assert np.array_equal(result["key"], expected["key"])
+    assert np.allclose(result["val"], expected["val"], rtol=0.05)
+    assert np.allclose(result["val2"], expected["val2"], atol=0.1)
+    assert np.allclose(result["val3"], expected["val3"])
+
+
+@pytest.mark.parametrize(
+    "aggregate_fn", ["count", "sum", "min", "max", "mean", "var", "std"]
+)
+@pytest.mark.parametrize("df_module", [cudf, pd])
+def test_calc_dense_groupby(aggregate_fn, df_module):
+    rng = np.random.default_rng(0)
+    pdf = pd.DataFrame(
+        {
+            "key": pd.array(rng.integers(3, 10, 300), dtype="Int64"),
+            "val": rng.normal(5, 2, 300),
+        }
+    )
+    pdf.loc[::11, "key"] = pd.NA
+    pdf.loc[::7, "val"] = np.nan
+    df = cudf.from_pandas(pdf) if df_module is cudf else pdf
+    bc = BaseChart()
+    bc.x = "key"
+    bc.y = "val"
+    bc.aggregate_fn = aggregate_fn
+    # the key 10 has no rows
+    keys = np.arange(3, 11)
+
+    result = gpu_histogram.calc_dense_groupby(bc, df, keys)
+    if df_module is cudf:
+        result = result.to_pandas()
+    expected = (
+        pdf.dropna(subset=["key"])
+        .groupby("key")
+        .agg({"val": aggregate_fn})["val"]
+        .reindex(keys)
+    )
+    if aggregate_fn in ("count", "sum"):
+        expected = expected.fillna(0)
+
+    assert np.array_equal(result["key"].to_numpy(), keys)
+    assert np.allclose(
+        result["val"].to_numpy(dtype=float),
+        expected.to_numpy(dtype=float),
+        equal_nan=True,
+    )
+
+
+@pytest.mark.parametrize("aggregate_fn", ["count", "min", "var"])
+def test_calc_dense_groupby_pool(aggregate_fn):
+    df = pd.DataFrame(
+        {
+            "key": pd.array([3, 4, None, 3, 6, 4], dtype="Int64"),
+            "val": [1.0, 2.0, 3.0, np.nan, 5.0, 6.0],
+        }
+    )
+    bc = BaseChart()
+    bc.x = "key"
+    bc.y = "val"
+    bc.aggregate_fn = aggregate_fn
+    keys = np.arange(3, 7)
+    pool = BufferPool()
+
+    expected = gpu_histogram.calc_dense_groupby(bc, df, keys)
+    for _ in range(2):
+        result = gpu_histogram.calc_dense_groupby(bc, df, keys, pool=pool)
+        assert np.allclose(
+            result["val"].to_numpy(dtype=float),
+            expected["val"].to_numpy(dtype=float),
+            equal_nan=True,
+        )
+
+    assert pool.hits == pool.misses > 0
+
+
+@pytest.mark.parametrize("df_module", [cudf, pd])
+def test_calc_dense_groupby_string_y(df_module):
+    df = df_module.DataFrame(
+        {"key": [1, 2, 1, 3, 1], "val": ["a", None, "b", "c", "d"]}
+    )
+    bc = BaseChart()
+    bc.x = "key"
+    bc.y = "val"
+    bc.aggregate_fn = "count"
+
+    result = gpu_histogram.calc_dense_groupby(bc, df, np.arange(1, 4))
+
+    # the null y is not counted
+    assert np.array_equal(result["val"].to_numpy(), [3, 0, 1])
+
+    bc.aggregate_fn = "max"
+    with pytest.raises(TypeError):
+        gpu_histogram.calc_dense_groupby(bc, df, np.arange(1, 4))
+
+
+def test_calc_dense_groupby_categorical():
+    df = cudf.DataFrame(
+        {
+            "key": cudf.Series(["a", "b", None, "a", "d"], dtype="category"),
+            "val": [1.0, 2.0, 3.0, 4.0, 5.0],
+        }
+    )
+    df["key"] = df["key"].cat.set_categories(["a", "b", "c", "d"])
+    bc = BaseChart()
+    bc.x = "key"
+    bc.y = "val"
+    bc.aggregate_fn = "sum"
+
+    result = gpu_histogram.calc_dense_groupby(
+        bc, df, np.array(["a", "b", "c", "d"])
+    )
+
+    assert result["key"].to_arrow().to_pylist() == ["a", "b", "c", "d"]
+    assert np.array_equal(result["val"].to_numpy(), [5.0, 2.0, 0.0, 5.0])
+
+
 def test_aggregated_column_unique():
     df = cudf.DataFrame(
         {
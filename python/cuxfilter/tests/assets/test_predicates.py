@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cudf
+import cupy as cp
+import numpy as np
+import pandas as pd
+
+from cuxfilter.assets.cudf_utils import to_mask_array
+from cuxfilter.assets.predicates import (
+    And,
+    Equals,
+    In,
+    Mask,
+    Polygon,
+    Predicate,
+    Range,
+)
+
+df_args = {
+    "x": [0.0, 1.0, 2.0, 3.0, 4.0],
+    "y": [0.0, 1.0, 2.0, 3.0, 4.0],
+    "key": [0, 1, 2, 3, 4],
+}
+
+
+@pytest.mark.parametrize("df_module", [cudf, pd])
+@pytest.mark.parametrize(
+    "predicate, result",
+    [
+        (Range("key", 1, 3), [False, True, True, True, False]),
+        (Equals("key", 2), [False, False, True, False, False]),
+        (In("key", [0, 4]), [True, False, False, False, True]),
+        (In("key", [0, 4], negate=True), [False, True, True, True, False]),
+        (
+            And(Range("x", 0, 2), Range("y", 1, 4)),
+            [False, True, True, False, False],
+        ),
+        (
+            Polygon(
+                "x", "y", [(0.5, 0.5), (3.5, 0.5), (3.5, 3.5), (0.5, 3.5)]
+            ),
+            [False, True, True, True, False],
+        ),
+    ],
+)
+def test_evaluate(df_module, predicate, result):
+    df = df_module.DataFrame(df_args)
+    mask = to_mask_array(predicate.evaluate(df))
+
+    assert np.array_equal(cp.asnumpy(mask), np.array(result, dtype=bool))
+
+
+@pytest.mark.parametrize("df_module", [cudf, pd])
+def test_evaluate_range_mask(df_module):
+    df = df_module.DataFrame(df_args)
+    calls = []
+
+    def range_mask(column, lo, hi):
+        calls.append((column, lo, hi))
+        return None if column == "x" else np.array([True] * 4 + [False])
+
+    mask = And(Range("x", 1, 4), Range("key", 0, 3)).evaluate(
+        df, range_mask=range_mask
+    )
+
+    assert calls == [("x", 1, 4), ("key", 0, 3)]
+    assert np.array_equal(
+        cp.asnumpy(to_mask_array(mask)), [False, True, True, True, False]
+    )
+
+
+def test_equality():
+    mask = np.ones(5, dtype=bool)
+
+    assert Range("x", 1, 2) == Range("x", 1, 2)
+    assert Range("x", 1, 2) != Range("x", 1, 3)
+    assert Range("x", 1, 2) != Range("y", 1, 2)
+    assert In("x", [1, 2]) == In("x", (1, 2))
+    assert And(Range("x", 1, 2), Equals("y", 1)) == Range("x", 1, 2) & Equals(
+        "y", 1
+    )
+    assert And(Range("x", 1, 2)) != And(Range("x", 1, 2), Equals("y", 1))
+    assert Mask(mask) == Mask(mask)
+    assert Mask(mask) != Mask(mask.copy())
+    assert Polygon("x", "y", [(0, 0), (1, 0), (1, 1)]) == Polygon(
+        "x", "y", [[0, 0], [1, 0], [1, 1]]
+    )
+    assert Range("x", 1, 2) != ("x", 1, 2)
+
+
+def test_incomplete_predicate():
+    class NoEvaluate(Predicate):
+        def _key(self):
+            return ()
+
+    with pytest.raises(TypeError):
+        NoEvaluate()
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import mock
+
+from cuxfilter.assets.reload_scheduler import ReloadScheduler
+
+
+class TestReloadScheduler:
+    def test_synchronous(self):
+        reload_fn = mock.Mock()
+        scheduler = ReloadScheduler(reload_fn)
+        for _ in range(3):
+            scheduler.request()
+
+        assert reload_fn.call_count == 3
+        assert scheduler.stats == {
+            "events_received": 3,
+            "reloads_executed": 3,
+        }
+
+    def test_coalescing(self):
+        reload_fn = mock.Mock()
+        scheduler = ReloadScheduler(reload_fn, interval=1000)
+        scheduler._schedule = mock.Mock()
+        for _ in range(5):
+            scheduler.request()
+
+        # the first event reloads immediately, the burst is deferred once
+        assert reload_fn.call_count == 1
+        assert scheduler._schedule.call_count == 1
+        assert 0 < scheduler._schedule.call_args[0][0] <= 1000
+
+        scheduler.flush()
+        assert reload_fn.call_count == 2
+        # nothing left to reload
+        scheduler.flush()
+        assert scheduler.stats == {
+            "events_received": 5,
+            "reloads_executed": 2,
+        }
+
+    def test_request_while_reloading(self):
+        scheduler = ReloadScheduler(None)
+
+        def reload_fn():
+            if scheduler.reloads_executed == 1:
+                scheduler.request()
+
+        scheduler.reload_fn = reload_fn
+        scheduler.request()
+
+        # the request received during the reload runs once it is done
+        assert scheduler.stats == {
+            "events_received": 2,
+            "reloads_executed": 2,
+        }
+
+    def test_cancel(self):
+        reload_fn = mock.Mock()
+        scheduler = ReloadScheduler(reload_fn, interval=1000)
+        scheduler._schedule = mock.Mock()
+        scheduler.request()
+        scheduler.request()
+        scheduler.cancel()
+        scheduler.flush()
+
+        assert reload_fn.call_count == 1
+
+    def test_no_document(self):
+        reload_fn = mock.Mock()
+        scheduler = ReloadScheduler(reload_fn, interval=1000)
+        # outside of a bokeh document
+        scheduler.request()
+        scheduler.request()
+
+        # without a document event loop the deferred reload runs in place
+        # instead of on another thread
+        assert reload_fn.call_count == 2
+        assert scheduler._timer is None
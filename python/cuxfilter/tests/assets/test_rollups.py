@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cudf
+import dask_cudf
+import numpy as np
+import pandas as pd
+
+from cuxfilter.assets.rollups import RollupPyramid
+
+rng = np.random.default_rng(0)
+n_rows = 100_000
+pdf = pd.DataFrame(
+    {
+        "date": pd.Timestamp("2024-01-01")
+        + pd.to_timedelta(rng.integers(0, 60 * 86400, n_rows), unit="s"),
+        "val": rng.normal(10, 3, n_rows),
+    }
+)
+pdf.loc[::13, "val"] = np.nan
+lo, hi = pd.Timestamp("2024-02-03 05:17:20"), pd.Timestamp("2024-02-05 11:00")
+
+
+def _binned(edges, fn="count"):
+    """
+    aggregate of the rows between the edges, from the raw rows
+    """
+    edges = edges.astype("datetime64[ns]")
+    rows = pdf[(pdf["date"] >= edges[0]) & (pdf["date"] < edges[-1])]
+    bins = np.searchsorted(edges, rows["date"].to_numpy(), side="right") - 1
+    values = rows["val"] if fn != "count" else rows["date"]
+    result = np.full(len(edges) - 1, 0.0 if fn in ("count", "sum") else np.nan)
+    grouped = values.groupby(bins).agg(fn)
+    result[grouped.index] = grouped
+    return result
+
+
+@pytest.mark.parametrize(
+    "to_df",
+    [
+        cudf.from_pandas,
+        lambda df: df,
+        lambda df: dask_cudf.from_cudf(cudf.from_pandas(df), npartitions=4),
+    ],
+)
+def test_from_data(to_df):
+    pyramid = RollupPyramid.from_data(to_df(pdf), "date", ["val"])
+
+    assert len(pyramid.levels["day"]) == 60
+    assert len(pyramid.levels["hour"]) == 60 * 24
+    assert pyramid.levels["minute"].rows.sum() == n_rows
+    assert pyramid.levels["day"].columns["val"]["count"].sum() == (
+        pdf["val"].notna().sum()
+    )
+
+
+@pytest.mark.parametrize(
+    "data_points, level", [(2, "day"), (24, "hour"), (1000, "minute")]
+)
+def test_level_for(data_points, level):
+    pyramid = RollupPyramid.from_data(pdf, "date")
+
+    # the window overlaps 3 days, 55 hours and 3224 minutes
+    assert pyramid.level_for(lo, hi, data_points) == level
+    # windows shorter than data_points minutes use the finest level
+    assert pyramid.level_for(lo, lo, data_points) == "minute"
+
+
+@pytest.mark.parametrize("level", ["minute", "hour", "day"])
+@pytest.mark.parametrize(
+    "aggregate_fn", ["count", "sum", "min", "max", "mean"]
+)
+def test_aggregate(level, aggregate_fn):
+    pyramid = RollupPyramid.from_data(pdf, "date", ["val"])
+
+    edges, values = pyramid.aggregate(
+        lo,
+        hi,
+        level,
+        aggregate_fn,
+        None if aggregate_fn == "count" else "val",
+    )
+
+    assert edges[0] <= lo.to_datetime64() < edges[1]
+    assert edges[-2] <= hi.to_datetime64() < edges[-1]
+    assert np.allclose(values, _binned(edges, aggregate_fn), equal_nan=True)
+
+
+def test_covers():
+    pyramid = RollupPyramid.from_data(pdf, "date")
+    day = (
+        pd.Timestamp("2024-02-01"),
+        pd.Timestamp("2024-02-02") - pd.Timedelta(1, "ns"),
+    )
+
+    assert pyramid.covers(*day, "day")
+    assert pyramid.covers(*day, "hour")
+    assert not pyramid.covers(lo, hi, "minute")
+    # bounds outside of the data do not split any period
+    assert pyramid.covers(pd.Timestamp("2000-01-01 12:30"), day[1], "day")
+
+    _, counts = pyramid.aggregate(lo, hi, "hour", ranges=[day, (lo, hi)])
+    assert counts.sum() == 0
+    _, counts = pyramid.aggregate(
+        pd.Timestamp("2024-02-01"), hi, "hour", ranges=[day]
+    )
+    assert (
+        counts.sum()
+        == ((pdf["date"] >= day[0]) & (pdf["date"] <= day[1])).sum()
+    )
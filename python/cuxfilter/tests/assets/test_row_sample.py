@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cudf
+import dask_cudf
+import numpy as np
+import pandas as pd
+
+from cuxfilter.assets.filtered_view import FilteredView
+from cuxfilter.assets.row_sample import (
+    WEIGHT_COLUMN,
+    RowSample,
+    estimate_aggregate,
+    estimate_bincount,
+    estimate_groups,
+    sample_weights,
+)
+
+rng = np.random.default_rng(0)
+n_rows = 200_000
+pdf = pd.DataFrame(
+    {
+        "key": rng.choice(4, n_rows, p=[0.6, 0.3, 0.099, 0.001]),
+        "val": rng.normal(10, 3, n_rows),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "to_df",
+    [
+        cudf.from_pandas,
+        lambda df: df,
+        lambda df: dask_cudf.from_cudf(cudf.from_pandas(df), npartitions=4),
+    ],
+)
+def test_from_data(to_df):
+    sample = RowSample.from_data(to_df(pdf), 10_000)
+
+    assert isinstance(sample.data, (cudf.DataFrame, pd.DataFrame))
+    assert 9_000 < len(sample) < 11_000
+    assert np.allclose(sample.data[WEIGHT_COLUMN].to_numpy(), 20)
+    assert sample.matches(10_000)
+    assert not sample.matches(10_000, stratify_by="key")
+
+
+def test_from_data_stratified():
+    sample = RowSample.from_data(
+        pdf, 10_000, stratify_by="key", min_rows=1_000
+    )
+
+    # the rare key keeps all of its rows
+    rare = sample.data[sample.data["key"] == 3]
+    assert len(rare) == (pdf["key"] == 3).sum()
+    assert np.allclose(rare[WEIGHT_COLUMN], 1)
+    # and the weights still add up to the number of rows
+    assert np.isclose(sample.data[WEIGHT_COLUMN].sum(), n_rows, rtol=0.05)
+
+
+@pytest.mark.parametrize("aggregate_fn", ["count", "sum", "mean"])
+def test_estimate_aggregate(aggregate_fn):
+    sample = RowSample.from_data(pdf, 20_000)
+    view = FilteredView(sample.data, (sample.data["val"] > 8).to_numpy())
+
+    estimate, (lower, upper) = estimate_aggregate(
+        view.project(["val"])["val"], sample_weights(view), aggregate_fn
+    )
+
+    expected = getattr(pdf["val"][pdf["val"] > 8], aggregate_fn)()
+    assert lower <= estimate <= upper
+    assert np.isclose(estimate, expected, rtol=0.05)
+
+
+def test_estimate_groups():
+    sample = RowSample.from_data(pdf, 20_000, stratify_by="key")
+    data = sample.data
+
+    result, intervals = estimate_groups(
+        data["key"], data["val"], data[WEIGHT_COLUMN], "sum"
+    )
+
+    expected = pdf.groupby("key")["val"].sum()
+    assert list(result.columns) == ["key", "val"]
+    assert list(intervals.columns) == ["key", "lower", "upper"]
+    assert np.array_equal(result["key"], expected.index)
+    assert np.allclose(result["val"], expected, rtol=0.1)
+    assert (intervals["lower"] <= result["val"]).all()
+    assert (result["val"] <= intervals["upper"]).all()
+
+
+def test_estimate_bincount():
+    counts, (lower, upper) = estimate_bincount(
+        np.array([0, 1, 1, 2, 3]), pd.Series([2.0, 2.0, 2.0, 1.0, 1.0]), 3
+    )
+
+    # the last id holds the null rows
+    assert np.array_equal(counts, [2.0, 4.0, 1.0])
+    # rows sampled with certainty do not add any uncertainty
+    assert lower[2] == upper[2] == 1.0
+    assert np.all(lower[:2] < counts[:2])
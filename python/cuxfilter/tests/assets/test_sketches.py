@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cudf
+import numpy as np
+import pandas as pd
+
+from cuxfilter.assets.sketches import HyperLogLog, TDigest
+
+rng = np.random.default_rng(0)
+n_rows = 100_000
+values = pd.Series(rng.integers(0, 20_000, n_rows))
+groups = rng.integers(0, 3, n_rows)
+
+
+@pytest.mark.parametrize("to_series", [cudf.Series, pd.Series])
+def test_hyperloglog(to_series):
+    sketch = HyperLogLog.from_values(to_series(values))
+
+    assert np.isclose(sketch.estimate()[0], values.nunique(), rtol=0.05)
+
+
+def test_hyperloglog_small_cardinality():
+    sketch = HyperLogLog.from_values(pd.Series([1, 2, 3, 3, 2]))
+
+    assert np.isclose(sketch.estimate()[0], 3, atol=0.1)
+
+
+def test_hyperloglog_groups_and_merge():
+    half = n_rows // 2
+    sketch = HyperLogLog.from_values(
+        values[:half], groups[:half], n_groups=3
+    ).merge(HyperLogLog.from_values(values[half:], groups[half:], n_groups=3))
+
+    expected = values.groupby(groups).nunique()
+    assert np.allclose(sketch.estimate(), expected, rtol=0.05)
+
+
+def test_hyperloglog_reindex():
+    sketch = HyperLogLog.from_values(values, groups, n_groups=3).reindex(
+        np.array([2, 0, 3]), 4
+    )
+
+    estimate = sketch.estimate()
+    expected = values.groupby(groups).nunique()
+    assert estimate[1] == 0
+    assert np.allclose(estimate[[2, 0, 3]], expected, rtol=0.05)
+
+
+@pytest.mark.parametrize("q", [0.001, 0.1, 0.5, 0.99])
+@pytest.mark.parametrize("to_series", [cudf.Series, pd.Series])
+def test_tdigest(q, to_series):
+    normal = pd.Series(rng.normal(10, 3, n_rows))
+
+    sketch = TDigest.from_values(to_series(normal))
+
+    # rank error
+    assert abs((normal < sketch.quantile(q)[0]).mean() - q) < 0.01
+
+
+def test_tdigest_groups_and_merge():
+    normal = pd.Series(rng.normal(10, 3, n_rows))
+    half = n_rows // 2
+    sketch = TDigest.from_values(normal[:half], groups[:half], 3).merge(
+        TDigest.from_values(normal[half:], groups[half:], 3)
+    )
+
+    assert len(sketch.means) < 3 * sketch.compression
+    assert np.allclose(
+        sketch.quantile(0.5), normal.groupby(groups).median(), atol=0.1
+    )
+    assert np.array_equal(sketch.quantile(0), normal.groupby(groups).min())
+    assert np.array_equal(sketch.quantile(1), normal.groupby(groups).max())
+
+
+def test_tdigest_reindex():
+    sketch = TDigest.from_values(
+        pd.Series([1.0, 2.0, 3.0]), np.array([0, 0, 1]), 2
+    ).reindex(np.array([2, 0]), 3)
+
+    assert np.allclose(sketch.quantile(1), [3.0, np.nan, 2.0], equal_nan=True)
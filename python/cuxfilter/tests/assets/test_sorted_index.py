@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+import cudf
+import cupy as cp
+import datetime
+import numpy as np
+import pandas as pd
+
+from cuxfilter.assets.sorted_index import SortedIndex, RangeSelection
+
+values = np.random.default_rng(0).integers(0, 100, 1000)
+
+
+@pytest.mark.parametrize("xp", [np, cp])
+@pytest.mark.parametrize("lo, hi", [(10, 20), (-5, 150), (40, 39), (3, 3)])
+def test_range_mask(xp, lo, hi):
+    index = SortedIndex(xp.asarray(values))
+
+    assert np.array_equal(
+        cp.asnumpy(index.range_mask(lo, hi)), (values >= lo) & (values <= hi)
+    )
+
+
+@pytest.mark.parametrize("xp", [np, cp])
+def test_range_selection_update(xp):
+    selection = RangeSelection(SortedIndex(xp.asarray(values)))
+    # overlapping, disjoint, growing and shrinking moves of the bounds
+    for lo, hi in [(10, 20), (15, 30), (50, 60), (0, 99), (40, 41), (7, 7)]:
+        mask = selection.update(lo, hi)
+        assert np.array_equal(
+            cp.asnumpy(mask), (values >= lo) & (values <= hi)
+        )
+
+
+@pytest.mark.parametrize("df_module", [cudf, pd])
+def test_from_series_datetime(df_module):
+    series = df_module.Series(pd.date_range("2020-01-01", periods=10))
+    index = SortedIndex.from_series(series)
+
+    assert np.array_equal(
+        cp.asnumpy(
+            index.range_mask(
+                datetime.datetime(2020, 1, 3), np.datetime64("2020-01-05")
+            )
+        ),
+        [False, False, True, True, True] + [False] * 5,
+    )
+
+
+@pytest.mark.parametrize("df_module", [cudf, pd])
+def test_from_series_with_nulls(df_module):
+    assert SortedIndex.from_series(df_module.Series([1.0, None])) is None
@@ -2,15 +2,24 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+import cudf
+import numpy as np
+import pandas as pd
 import panel as pn
 
 from cuxfilter.charts.core.aggregate.core_aggregate import BaseAggregateChart
 from cuxfilter.charts.bokeh.plots.bar import InteractiveBar
+from cuxfilter.charts.bokeh.plots.histogram import Histogram
+from cuxfilter.assets.predicates import Equals, In, Range
 import cuxfilter
 from ..utils import initialize_df, df_types
 from unittest import mock
 
-df_args = {"key": [0, 1, 2, 3, 4], "val": [float(i + 10) for i in range(5)]}
+df_args = {
+    "key": [0, 1, 2, 3, 4],
+    "val": [float(i + 10) for i in range(5)],
+    "label": ["a", "b", None, "d", "e"],
+}
 dfs = [initialize_df(type, df_args) for type in df_types]
 cux_dfs = [cuxfilter.DataFrame.from_dataframe(df) for df in dfs]
 # create cudf and dask_cudf backed cuxfilter dataframes
@@ -43,6 +52,32 @@ class TestBaseAggregateChart:
         assert bb.stride is None
         assert bb.stride_type is int
 
+    @pytest.mark.parametrize(
+        "dashboard, use_dense_keys, y, aggregate_fn, dense_keys",
+        [
+            (dashboards[0], True, "val", "count", [0, 1, 2, 3, 4]),
+            (dashboards[0], True, "val", "median", None),
+            (dashboards[0], False, "val", "count", None),
+            # only counts of a non-numeric y
+            (dashboards[0], True, "label", "count", [0, 1, 2, 3, 4]),
+            (dashboards[0], True, "label", "max", None),
+            # dask_cudf
+            (dashboards[1], True, "val", "count", None),
+        ],
+    )
+    def test_dense_keys(
+        self, dashboard, use_dense_keys, y, aggregate_fn, dense_keys
+    ):
+        bb = BaseAggregateChart(x="key", y=y, aggregate_fn=aggregate_fn)
+        bb.use_dense_keys = use_dense_keys
+        bb.add_events = mock.Mock()
+        bb.initiate_chart(dashboard)
+
+        if dense_keys is None:
+            assert bb.dense_keys is None
+        else:
+            assert np.array_equal(bb.dense_keys, dense_keys)
+
     @pytest.mark.parametrize("chart, _chart", [(None, None), (1, 1)])
     def test_view(self, chart, _chart):
         bac = BaseAggregateChart(x="test_x", add_interaction=False)
@@ -85,6 +120,26 @@ class TestBaseAggregateChart:
                 dashboard._query_local_variables_dict[key] == local_dict[key]
             )
 
+    @pytest.mark.parametrize(
+        "predicate, result",
+        [
+            (Range("key", 0, 4), 1.0),
+            (Range("key", 1, 2), 0.4),
+            (Range("key", 5, 6), 0.0),
+            (Range("val", 0, 1), None),
+            (Equals("key", 1), None),
+        ],
+    )
+    def test_estimate_selectivity(self, predicate, result):
+        bb = BaseAggregateChart(x="key")
+        assert bb.estimate_selectivity(predicate) is None
+
+        bb.selectivity_histogram = (
+            np.array([0, 1, 2, 3, 4]),
+            np.array([2, 1, 1, 3, 3]),
+        )
+        assert bb.estimate_selectivity(predicate) == result
+
     @pytest.mark.parametrize("dashboard", dashboards)
     @pytest.mark.parametrize(
         "event_1, event_2",
@@ -117,3 +172,191 @@ class TestBaseAggregateChart:
 
         assert self.event_1 == event_1
         assert self.event_2 == event_2
+
+
+@pytest.mark.parametrize("df_type", df_types)
+@pytest.mark.parametrize(
+    "aggregate_fn, values",
+    [("sum", [8.0, 6.0, 3.0]), ("mean", [4.0, 3.0, 1.0])],
+)
+def test_bar_top_n(df_type, aggregate_fn, values):
+    df = initialize_df(
+        df_type,
+        {
+            "key": [0, 0, 1, 1, 2, 2, 3],
+            "val": [1.0, 2.0, 3.0, 3.0, 4.0, 4.0, 0.0],
+        },
+    )
+    dashboard = cuxfilter.DataFrame.from_dataframe(df).dashboard(charts=[])
+    bar = cuxfilter.charts.bar(
+        "key", "val", aggregate_fn=aggregate_fn, top_n=2
+    )
+    bar.initiate_chart(dashboard)
+
+    assert bar.top_keys == [2, 1]
+    source_df = bar.chart.source_df
+    assert source_df["key"].to_arrow().to_pylist() == ["2", "1", "other"]
+    assert np.allclose(source_df["val"].to_numpy(), values)
+
+    # selecting the other bar filters the rows outside of the top_n groups
+    bar.selected_labels = ["1", "other"]
+    bar.compute_query_dict(dashboard._query_str_dict, {})
+    assert bar.query_predicate == In("key", [2], negate=True)
+    assert dashboard._query_str_dict[bar.name] == "key not in [2]"
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_bar_top_n_other_key(df_type):
+    df = initialize_df(
+        df_type,
+        {
+            "key": ["other", "other", "a", "a", "a", "b"],
+            "val": [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+        },
+    )
+    dashboard = cuxfilter.DataFrame.from_dataframe(df).dashboard(charts=[])
+    bar = cuxfilter.charts.bar("key", "val", aggregate_fn="sum", top_n=2)
+    bar.initiate_chart(dashboard)
+
+    # the key "other" keeps its bar, the other bar gets a distinct label
+    assert bar.top_keys == ["a", "other"]
+    source_df = bar.chart.source_df
+    assert source_df["key"].to_arrow().to_pylist() == ["a", "other", "other*"]
+    assert np.allclose(source_df["val"].to_numpy(), [3.0, 2.0, 1.0])
+
+    bar.selected_labels = ["other"]
+    bar.compute_query_dict(dashboard._query_str_dict, {})
+    assert bar.query_predicate == In("key", ["other"])
+
+    bar.selected_labels = ["other*"]
+    bar.compute_query_dict(dashboard._query_str_dict, {})
+    assert bar.query_predicate == In("key", ["a", "other"], negate=True)
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_histogram_bin_by(df_type):
+    df = initialize_df(
+        df_type,
+        {
+            "date": cudf.to_datetime(
+                [
+                    "2024-01-02",
+                    "2024-01-20",
+                    "2024-03-05",
+                    "2024-03-31",
+                    "2024-04-01",
+                ]
+            ),
+        },
+    )
+    dashboard = cuxfilter.DataFrame.from_dataframe(df).dashboard(charts=[])
+    histogram = cuxfilter.charts.bar("date", bin_by="month")
+    histogram.add_events = mock.Mock()
+    histogram.initiate_chart(dashboard)
+
+    assert histogram.stride == "month"
+    assert histogram.n_bins == 4
+    bin_values, counts = histogram.calculate_source()
+    assert np.array_equal(counts, [2, 0, 2, 1])
+    # the bars span their calendar periods
+    edges, _ = histogram.chart.source_df
+    assert np.array_equal(
+        edges,
+        np.array(
+            [
+                "2024-01-01",
+                "2024-02-01",
+                "2024-03-01",
+                "2024-04-01",
+                "2024-05-01",
+            ],
+            dtype=df["date"].dtype,
+        ),
+    )
+
+    # box selections snap to the calendar periods
+    dashboard._reload_charts = mock.Mock()
+    histogram.get_box_select_callback(dashboard)(
+        None,
+        (np.datetime64("2024-01-10"), np.datetime64("2024-03-12")),
+        None,
+    )
+    assert histogram.query_predicate == Range(
+        "date",
+        pd.Timestamp("2024-01-01"),
+        pd.Timestamp("2024-03-31 23:59:59.999999999"),
+    )
+
+
+def test_bar_bin_by():
+    df = cudf.DataFrame(
+        {
+            "date": cudf.to_datetime(
+                ["2024-01-02", "2024-01-05 10:00", "2024-01-08", "2024-01-21"]
+            ),
+            "val": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    dashboard = cuxfilter.DataFrame.from_dataframe(df).dashboard(charts=[])
+    bar = cuxfilter.charts.bar(
+        "date", "val", aggregate_fn="sum", bin_by="week"
+    )
+    bar.add_events = mock.Mock()
+    bar.initiate_chart(dashboard)
+
+    # weeks starting on Monday, empty weeks included
+    source_df = bar.chart.source_df.to_pandas()
+    assert list(source_df["date"]) == list(
+        pd.to_datetime(["2024-01-01", "2024-01-08", "2024-01-15"])
+    )
+    assert list(source_df["val"]) == [3.0, 3.0, 4.0]
+
+    with pytest.raises(TypeError):
+        cuxfilter.charts.bar("val", bin_by="day").initiate_chart(dashboard)
+    with pytest.raises(ValueError):
+        cuxfilter.charts.bar("date", bin_by="year")
+
+
+def test_histogram_rollups_zoom():
+    dates = pd.date_range("2024-01-01", periods=3 * 1440, freq="min")
+    df = cudf.DataFrame({"date": dates, "val": np.arange(len(dates)) % 7})
+    dashboard = cuxfilter.DataFrame.from_dataframe(df).dashboard(charts=[])
+    histogram = cuxfilter.charts.bar("date", data_points=12, rollups=True)
+    histogram.initiate_chart(dashboard)
+    zoom = histogram.get_range_callback(dashboard)
+
+    # a day splits into 24 hours, enough for 12 bins
+    zoom((pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-02 23:59")))
+    edges, counts = histogram.chart.source_df
+    assert len(edges) == 25
+    assert edges[0] == np.datetime64("2024-01-02")
+    assert np.array_equal(counts, np.full(24, 60))
+
+    # while zoomed, the window is rebinned once per reload
+    assert not histogram.progressive
+    assert not histogram.approximate
+    assert histogram.compute_reload(dashboard._filtered_view()) is None
+
+    # filters on other columns are answered from the rows
+    dashboard._query_str_dict["val_filter"] = "val == 0"
+    histogram.apply_reload(None)
+    edges, counts = histogram.chart.source_df
+    day = df.to_pandas().set_index("date").loc["2024-01-02"]
+    expected = (day["val"] == 0).groupby(day.index.hour).sum()
+    assert np.array_equal(counts, expected.to_numpy())
+
+    # zooming out goes back to the bins of the chart
+    dashboard._query_str_dict.pop("val_filter")
+    zoom(None)
+    assert histogram.zoom_range is None
+    assert histogram.progressive
+    assert len(histogram.chart.source_df[1]) == histogram.n_bins
+    assert histogram.chart.source_df[1].sum() == len(df)
+
+    with pytest.raises(TypeError):
+        cuxfilter.charts.bar("val", rollups=True).initiate_chart(dashboard)
+    # the rollups only hold the row counts
+    with pytest.raises(ValueError):
+        Histogram(
+            x="date", y="val", aggregate_fn="mean", rollups=True
+        ).initiate_chart(dashboard)
@@ -1,7 +1,12 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import cudf
+import cupy as cp
 import panel as pn
+from unittest import mock
+
+from cuxfilter.assets.filtered_view import FilteredView
 from cuxfilter.charts.core.core_chart import BaseChart
 
 
@@ -26,6 +31,8 @@ class TestBaseChart:
         assert bc.x_label_map is None
         assert bc.y_label_map is None
         assert bc.title == ""
+        assert bc.progressive is False
+        assert bc.approximate is False
 
         bc.x = "test_x"
         bc.chart_type = "test_chart_type"
@@ -59,6 +66,17 @@ class TestBaseChart:
 
         assert bc.color == "blue"
 
+    def test_reload(self):
+        bc = BaseChart()
+        bc.x = "a"
+        bc.reload_chart = mock.Mock()
+        df = cudf.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        bc.reload(FilteredView(df, cp.asarray([True, False, True])))
+
+        # only the declared columns of the selected rows are gathered
+        assert bc.data_columns == ["a"]
+        assert bc.reload_chart.call_args[0][0].equals(df[["a"]].iloc[[0, 2]])
+
     def test_umimplemented_fns(self):
         bc = BaseChart()
         assert bc.calculate_source(data={}) == -1
@@ -71,3 +89,7 @@ class TestBaseChart:
         assert bc.format_source_data(source_dict={}) == -1
         assert bc.format_source_data(source_dict={}) == -1
         assert bc.apply_mappers() == -1
+        assert bc.compute_partial(data={}) == -1
+        assert bc.merge_partials(partial=-1, other=-1) == -1
+        assert bc.result_from_partial(partial=-1) == -1
+        assert bc.compute_estimate(data={}, confidence=0.95) == -1
@@ -1,12 +1,14 @@
 # SPDX-FileCopyrightText: Copyright (c) 2020-2025, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import cupy as cp
 import dask_cudf
 import pytest
 import panel as pn
 import cudf
 import numpy as np
 
+from cuxfilter.assets.filtered_view import FilteredView
 from cuxfilter.charts.core.non_aggregate.core_graph import BaseGraph
 from cuxfilter.charts.datashader.custom_extensions import (
     holoviews_datashader as hv_dt,
@@ -56,6 +58,28 @@ class TestCoreGraph:
         assert bg.use_data_tiles is False
         assert bg.reset_event is None
 
+    def test_data_columns(self):
+        nodes = cudf.DataFrame(
+            {
+                "vertex": [0, 1, 2],
+                "x": [0.0, 1.0, 2.0],
+                "y": [0.0, 1.0, 2.0],
+                "label": ["a", "b", "c"],
+            }
+        )
+        bg = BaseGraph()
+        bg.inspect_neighbors = CustomInspectTool(_active=False)
+
+        data, edges = bg.compute_reload(
+            FilteredView(nodes, cp.asarray([True, False, True]))
+        )
+
+        # only the node columns of the selected rows are gathered
+        assert bg.data_columns == ["vertex", "x", "y"]
+        assert list(data.columns) == ["vertex", "x", "y"]
+        assert data["vertex"].to_arrow().to_pylist() == [0, 2]
+        assert edges is None
+
     def test_view(self):
         bg = BaseGraph()
         bg.chart = mock.Mock(
@@ -136,6 +160,7 @@ class TestCoreGraph:
         bg.reload_chart = t_function
 
         dashboard._active_view = bg
+        dashboard._charts[bg.name] = bg
 
         class evt:
             bounds = (1, 3, 0, 1)
@@ -185,6 +210,7 @@ class TestCoreGraph:
                 self.result = None
 
         bg.reload_chart = t_function
+        dashboard._charts[bg.name] = bg
         # Define the lasso polygon - square from (1,1) to (2,2)
         geometry = np.array(
             [[1.0, 1.0], [1.0, 2.0], [2.0, 2.0], [2.0, 1.0], [1.0, 1.0]],
@@ -1,2 +1,61 @@
 # SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+
+import cupy as cp
+import pandas as pd
+import pytest
+from unittest import mock
+
+import cudf
+import cuxfilter
+from cuxfilter.assets.filtered_view import FilteredView
+
+
+@pytest.mark.parametrize(
+    "bin_by, lo, hi",
+    [
+        (None, "2024-01-10", "2024-02-20"),
+        ("week", "2024-01-08", "2024-02-25 23:59:59.999999999"),
+        ("month", "2024-01-01", "2024-02-29 23:59:59.999999999"),
+    ],
+)
+def test_date_range_slider_bin_by(bin_by, lo, hi):
+    df = cudf.DataFrame(
+        {"date": cudf.date_range("2024-01-01", "2024-03-31", freq="D")}
+    )
+    dashboard = cuxfilter.DataFrame.from_dataframe(df).dashboard(charts=[])
+    slider = cuxfilter.charts.date_range_slider("date", bin_by=bin_by)
+    slider.add_events = mock.Mock()
+    slider.initiate_chart(dashboard)
+    slider.chart.value = (
+        pd.Timestamp("2024-01-10"),
+        pd.Timestamp("2024-02-20"),
+    )
+
+    slider.compute_query_dict(
+        dashboard._query_str_dict, dashboard._query_local_variables_dict
+    )
+
+    assert slider.query_predicate.lo == pd.Timestamp(lo)
+    assert slider.query_predicate.hi == pd.Timestamp(hi)
+    if bin_by is not None:
+        # the data tiles of the slider are the calendar periods
+        assert slider.bin_ids is not None
+        assert slider.n_bins == {"week": 13, "month": 3}[bin_by]
+
+
+def test_number_data_columns():
+    df = cudf.DataFrame(
+        {"key": [0, 1, 2], "val": [1.0, 2.0, 3.0], "other": [4, 5, 6]}
+    )
+    dashboard = cuxfilter.DataFrame.from_dataframe(df).dashboard(charts=[])
+    number = cuxfilter.charts.number(
+        expression="(key + val) / 2", aggregate_fn="sum"
+    )
+    number.initiate_chart(dashboard)
+    view = FilteredView(df, cp.asarray([True, False, True]))
+
+    # only the columns of the expression are gathered
+    assert number.data_columns == ["key", "val"]
+    assert number.compute_reload(view) == 3.0
+    assert list(view._projections) == [("key", "val")]
@@ -2,10 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+import threading
+from unittest import mock
 
 import cuxfilter
 from cuxfilter.charts import bokeh, panel_widgets
 import cudf
+import dask_cudf
+import numpy as np
 
 
 class TestDashBoard:
@@ -108,3 +112,477 @@ class TestDashBoard:
         )
 
         assert dashboard.export().equals(self.df[self.df.key.between(0, 3)])
+
+    def test_filtered_data(self):
+        dashboard = self.cux_df.dashboard(charts=[], title="test_title")
+        dashboard._query_str_dict = {
+            "a": "@key_min<=key<=@key_max",
+            "b": "val<14",
+        }
+        dashboard._query_local_variables_dict = {"key_min": 1, "key_max": 4}
+
+        assert dashboard._filtered_data().equals(self.df.iloc[1:4])
+        assert dashboard._filtered_data(exclude="a").equals(self.df.iloc[:4])
+        assert dashboard._filtered_data(exclude=["a", "b"]).equals(self.df)
+
+        # only the filter that changed is re-evaluated
+        versions = dashboard._filter_engine.versions
+        dashboard._query_local_variables_dict["key_min"] = 2
+        assert dashboard._filtered_data().equals(self.df.iloc[2:4])
+        assert dashboard._filter_engine.versions["b"] == versions["b"]
+        assert dashboard._filter_engine.versions["a"] != versions["a"]
+
+        dashboard._query_str_dict.pop("a")
+        assert dashboard._filtered_data().equals(self.df.iloc[:4])
+        assert dashboard._filter_engine.filters == ["b"]
+
+    def test_reload_charts_ignore_own_filter(self):
+        dashboard = self.cux_df.dashboard(charts=[], title="test_title")
+        bac = bokeh.bar("key")
+        bac.chart_type = "chart_1"
+        dashboard.add_charts([bac])
+        bac.ignore_own_filter = True
+        bac.calculate_source = mock.Mock()
+        bac.box_selected_range = {
+            bac.x + "_min": 0,
+            bac.x + "_max": 1,
+        }
+        bac.compute_query_dict(
+            dashboard._query_str_dict, dashboard._query_local_variables_dict
+        )
+        dashboard._reload_charts()
+
+        # the chart only gathers the columns it reads
+        assert bac.calculate_source.call_args[0][0].equals(self.df[["key"]])
+
+    def test_predicates_shared_column(self):
+        dashboard = self.cux_df.dashboard(charts=[], title="test_title")
+        bac = bokeh.bar("key")
+        bac.chart_type = "chart_1"
+        slider = panel_widgets.range_slider("key")
+        dashboard.add_charts([bac], sidebar=[slider])
+        bac.box_selected_range = {
+            bac.x + "_min": 0,
+            bac.x + "_max": 3,
+        }
+        bac.compute_query_dict(
+            dashboard._query_str_dict, dashboard._query_local_variables_dict
+        )
+        # both filters use the @key_min and @key_max local variables, the
+        # predicates keep their own bounds
+        slider.chart.value = (2, 4)
+
+        assert dashboard._filtered_data().equals(self.df.iloc[2:4])
+
+        # unchanged predicates are not re-evaluated
+        versions = dashboard._filter_engine.versions
+        assert dashboard._filtered_data().equals(self.df.iloc[2:4])
+        assert dashboard._filter_engine.versions == versions
+
+    def test_filtered_data_selectivity_order(self):
+        df = dask_cudf.from_cudf(self.df, npartitions=2)
+        dashboard = cuxfilter.DataFrame.from_dataframe(df).dashboard(
+            charts=[], title="test_title"
+        )
+        key_chart = bokeh.bar("key")
+        val_chart = bokeh.bar("val")
+        dashboard.add_charts([key_chart, val_chart])
+        key_chart.box_selected_range = {"key_min": 0, "key_max": 3}
+        val_chart.box_selected_range = {"val_min": 13, "val_max": 14}
+        for chart in [key_chart, val_chart]:
+            chart.compute_query_dict(
+                dashboard._query_str_dict,
+                dashboard._query_local_variables_dict,
+            )
+
+        assert dashboard._filter_selectivity(key_chart.name) == 0.8
+        assert dashboard._filter_selectivity(val_chart.name) == 0.4
+        assert dashboard._filtered_data().compute().equals(self.df.iloc[3:4])
+
+    def test_filtered_view(self):
+        dashboard = self.cux_df.dashboard(charts=[], title="test_title")
+        dashboard._query_str_dict = {"a": "key<3"}
+        view = dashboard._filtered_view()
+
+        assert view.data is dashboard._cuxfilter_df.data
+        assert len(view) == 3
+        assert view.project(["val"]).equals(self.df[["val"]].iloc[:3])
+        assert view.materialize().equals(self.df.iloc[:3])
+        assert dashboard._filtered_view(exclude="a").selection is None
+
+    def test_reload_interval(self):
+        dashboard = self.cux_df.dashboard(
+            charts=[], title="test_title", reload_interval=1000
+        )
+        dashboard._reload_scheduler._schedule = mock.Mock()
+        dashboard._execute_reload = mock.Mock()
+        dashboard._reload_scheduler.reload_fn = dashboard._execute_reload
+        for _ in range(10):
+            dashboard._reload_charts()
+
+        assert dashboard._execute_reload.call_count == 1
+        dashboard._reload_scheduler.flush()
+        assert dashboard.reload_stats == {
+            "events_received": 10,
+            "reloads_executed": 2,
+        }
+
+    def test_superseded_reload(self):
+        dashboard = self.cux_df.dashboard(
+            charts=[],
+            title="test_title",
+            data_size_widget=False,
+            reload_workers=1,
+        )
+        bac = bokeh.bar("key", title="bar_1")
+        dashboard.add_charts([bac])
+        bac.apply_reload = mock.Mock()
+        callbacks = []
+        doc = mock.Mock(
+            **{"add_next_tick_callback.side_effect": callbacks.append}
+        )
+
+        def reload(superseded):
+            callbacks.clear()
+            with mock.patch.object(
+                dashboard, "_server_document", return_value=doc
+            ):
+                dashboard._execute_reload()
+            # wait for the aggregation, its done callback schedules the apply
+            dashboard._reload_executor.shutdown(wait=True)
+            dashboard._reload_executor = None
+            if superseded:
+                # a new interaction arrives while the chart is computing
+                dashboard._reload_generation += 1
+            for callback in callbacks:
+                callback()
+
+        dashboard._query_str_dict = {"a": "key<4"}
+        chart_inputs = dict(dashboard._chart_inputs)
+        reload(superseded=True)
+        # the stale result is dropped
+        bac.apply_reload.assert_not_called()
+        assert dashboard._chart_inputs == chart_inputs
+
+        reload(superseded=False)
+        bac.apply_reload.assert_called_once()
+
+    def test_reload_workers(self):
+        dashboard = self.cux_df.dashboard(
+            charts=[],
+            title="test_title",
+            data_size_widget=False,
+            reload_workers=2,
+        )
+        bac_1 = bokeh.bar("key", title="bar_1")
+        bac_2 = bokeh.bar("key", title="bar_2")
+        dashboard.add_charts([bac_1, bac_2])
+        main_thread = threading.get_ident()
+        threads = {}
+
+        def compute_reload(chart):
+            def _compute_reload(data):
+                threads[f"compute_{chart}"] = threading.get_ident()
+                return chart
+
+            return _compute_reload
+
+        def apply_reload(result):
+            threads[f"apply_{result}"] = threading.get_ident()
+
+        bac_1.compute_reload = compute_reload("bar_1")
+        bac_2.compute_reload = compute_reload("bar_2")
+        bac_1.apply_reload = bac_2.apply_reload = apply_reload
+        dashboard._execute_reload()
+
+        # aggregations run on the pool, model updates on the caller thread
+        assert threads["compute_bar_1"] != main_thread
+        assert threads["compute_bar_2"] != main_thread
+        assert threads["apply_bar_1"] == main_thread
+        assert threads["apply_bar_2"] == main_thread
+
+        dashboard._reload_executor.shutdown()
+
+    def test_shared_bin_ids(self):
+        dashboard = self.cux_df.dashboard(
+            charts=[], title="test_title", data_size_widget=False
+        )
+        hist_1 = bokeh.bar("val", data_points=4, title="hist_1")
+        hist_2 = bokeh.bar("val", data_points=4, title="hist_2")
+        dashboard.add_charts([hist_1, hist_2])
+
+        # a single cached column for both charts
+        assert len(dashboard._bin_ids) == 1
+        assert hist_1.bin_ids is hist_2.bin_ids
+
+        hist_1.box_selected_range = {"val_min": 10, "val_max": 12}
+        hist_1.compute_query_dict(
+            dashboard._query_str_dict, dashboard._query_local_variables_dict
+        )
+        bin_values, counts = hist_2.compute_reload(dashboard._filtered_view())
+
+        assert np.array_equal(bin_values, [10.0, 11.0, 12.0, 13.0, 14.0])
+        assert np.array_equal(counts, [1, 1, 1, 0, 0])
+
+    @pytest.mark.parametrize(
+        "memory_limit, use_sorted_index, tiled",
+        [
+            (2**20, True, True),
+            (2**20, False, False),
+            (100, True, False),
+            (None, True, False),
+        ],
+    )
+    def test_data_tiles(self, memory_limit, use_sorted_index, tiled):
+        dashboard = self.cux_df.dashboard(
+            charts=[],
+            title="test_title",
+            data_size_widget=False,
+            use_sorted_index=use_sorted_index,
+            data_tiles_memory_limit=memory_limit,
+        )
+        key_chart = bokeh.bar("key", data_points=4)
+        val_chart = bokeh.bar("val", data_points=4)
+        dashboard.add_charts([key_chart, val_chart])
+        val_chart.chart.update_data = mock.Mock()
+        compute_reload = mock.Mock(wraps=val_chart.compute_reload)
+        val_chart.compute_reload = compute_reload
+
+        for lo, hi in [(0, 2), (1, 3)]:
+            key_chart.box_selected_range = {"key_min": lo, "key_max": hi}
+            key_chart.compute_query_dict(
+                dashboard._query_str_dict,
+                dashboard._query_local_variables_dict,
+            )
+            dashboard._reload_charts()
+            bin_values, counts = val_chart.chart.update_data.call_args[0][0]
+            assert np.array_equal(bin_values, [10.0, 11.0, 12.0, 13.0, 14.0])
+            expected = [0, 0, 0, 0, 0]
+            for i in range(lo, hi + 1):
+                expected[i] = 1
+            assert np.array_equal(counts, expected)
+
+        # the brushed chart's tiles serve the other chart without a scan,
+        # without tiles both charts are counted by the fused scan
+        assert (dashboard._data_tiles is not None) == tiled
+        assert compute_reload.call_count == 0
+        # no sorted index is built without use_sorted_index
+        assert (len(dashboard._sorted_indexes) > 0) == use_sorted_index
+
+    def test_cumulative_data_tiles_range_slider(self):
+        dashboard = self.cux_df.dashboard(
+            charts=[],
+            title="test_title",
+            data_size_widget=False,
+            use_sorted_index=True,
+            data_tiles_memory_limit=2**20,
+            cumulative_data_tiles=True,
+        )
+        val_chart = bokeh.bar("val", data_points=4)
+        slider = panel_widgets.range_slider("key")
+        dashboard.add_charts([val_chart], sidebar=[slider])
+        val_chart.chart.update_data = mock.Mock()
+
+        for value in [(1, 3), (1, 4), (0, 2)]:
+            slider.chart.value = value
+            _, counts = val_chart.chart.update_data.call_args[0][0]
+            expected = [0, 0, 0, 0, 0]
+            for i in range(value[0], value[1] + 1):
+                expected[i] = 1
+            assert np.array_equal(counts, expected)
+
+        assert dashboard._data_tiles.active == slider.name
+        assert dashboard._data_tiles.cumulative
+
+    def test_fused_reload(self):
+        dashboard = self.cux_df.dashboard(
+            charts=[],
+            title="test_title",
+            data_size_widget=False,
+            data_tiles_memory_limit=0,
+        )
+        key_chart = bokeh.bar("key", data_points=4)
+        val_chart = bokeh.bar("val", data_points=4)
+        slider = panel_widgets.range_slider("key")
+        dashboard.add_charts([key_chart, val_chart], sidebar=[slider])
+        for chart in [key_chart, val_chart]:
+            chart.chart.update_data = mock.Mock()
+            chart.compute_reload = mock.Mock()
+
+        slider.chart.value = (1, 3)
+
+        # both histograms are counted in a single scan
+        for chart in [key_chart, val_chart]:
+            chart.compute_reload.assert_not_called()
+            _, counts = chart.chart.update_data.call_args[0][0]
+            assert np.array_equal(counts, [0, 1, 1, 1, 0])
+
+    def test_skip_unchanged_charts(self):
+        dashboard = self.cux_df.dashboard(
+            charts=[], title="test_title", data_size_widget=False
+        )
+        key_chart = bokeh.bar("key")
+        val_chart = bokeh.bar("val")
+        dashboard.add_charts([key_chart, val_chart])
+        dashboard.add_charts(sidebar=[panel_widgets.range_slider("val")])
+        key_chart.ignore_own_filter = True
+        key_chart.calculate_source = mock.Mock()
+        val_chart.calculate_source = mock.Mock()
+
+        def select(lo, hi):
+            key_chart.box_selected_range = {"key_min": lo, "key_max": hi}
+            key_chart.compute_query_dict(
+                dashboard._query_str_dict,
+                dashboard._query_local_variables_dict,
+            )
+            dashboard._reload_charts()
+
+        select(0, 3)
+        assert dashboard.last_reload_stats == {"recomputed": 2, "skipped": 1}
+
+        # nothing changed
+        dashboard._reload_charts()
+        assert dashboard.last_reload_stats == {"recomputed": 0, "skipped": 3}
+
+        # only the filter ignored by key_chart changed
+        select(1, 3)
+        assert dashboard.last_reload_stats == {"recomputed": 1, "skipped": 2}
+        assert key_chart.calculate_source.call_count == 1
+        assert val_chart.calculate_source.call_count == 2
+
+    def test_sorted_index_range_filter(self):
+        dashboard = self.cux_df.dashboard(
+            charts=[], title="test_title", use_sorted_index=True
+        )
+        dashboard._query_str_dict = {"a": "@key_min<=key<=@key_max"}
+        dashboard._query_local_variables_dict = {"key_min": 1, "key_max": 2}
+
+        assert dashboard._filtered_data().equals(self.df.iloc[1:3])
+        assert "key" in dashboard._sorted_indexes
+        # moving the bounds reuses the filter's range selection
+        dashboard._query_local_variables_dict = {"key_min": 2, "key_max": 4}
+        assert dashboard._filtered_data().equals(self.df.iloc[2:])
+        assert list(dashboard._range_selections) == [("a", "key")]
+
+        dashboard._query_str_dict.pop("a")
+        assert dashboard._filtered_data().equals(self.df)
+        assert dashboard._range_selections == {}
+
+    @pytest.mark.parametrize("df_type", ["cudf", "dask_cudf"])
+    def test_exclusive_views(self, df_type):
+        df = self.df
+        if df_type == "dask_cudf":
+            df = dask_cudf.from_cudf(self.df, npartitions=2)
+        dashboard = cuxfilter.DataFrame.from_dataframe(df).dashboard(
+            charts=[], title="test_title"
+        )
+        dashboard._query_str_dict = {
+            "a": "@key_min<=key<=@key_max",
+            "b": "val<14",
+            "c": "key != 2",
+        }
+        dashboard._query_local_variables_dict = {"key_min": 1, "key_max": 4}
+
+        result = {
+            key: value.materialize()
+            for key, value in dashboard._exclusive_views(
+                ["a", "c", "d"]
+            ).items()
+        }
+        if df_type == "dask_cudf":
+            result = {key: value.compute() for key, value in result.items()}
+
+        assert list(result) == ["a", "c"]
+        assert result["a"].equals(self.df.iloc[[0, 1, 3]])
+        assert result["c"].equals(self.df.iloc[1:4])
+
+    @pytest.mark.parametrize("df_type", ["cudf", "dask_cudf"])
+    def test_progressive_reload(self, df_type):
+        df = self.df
+        if df_type == "dask_cudf":
+            df = dask_cudf.from_cudf(self.df, npartitions=2)
+        dashboard = cuxfilter.DataFrame.from_dataframe(df).dashboard(
+            charts=[], title="test_title", progressive_chunk_size=2
+        )
+        bar = bokeh.bar("key", "val", aggregate_fn="mean")
+        dashboard.add_charts([bar])
+        size = dashboard.charts[self._datasize_title]
+        bar.apply_reload = mock.Mock()
+        size.apply_reload = mock.Mock()
+
+        dashboard._query_str_dict = {"a": "key<4"}
+        dashboard._execute_reload()
+
+        # an update per chunk, the last one is exact
+        sizes = [call[0][0] for call in size.apply_reload.call_args_list]
+        if df_type == "cudf":
+            assert sizes == [2, 4, 4]
+        else:
+            assert sizes[-1] == 4
+        result = bar.apply_reload.call_args[0][0].to_pandas()
+        expected = bar.compute_reload(dashboard._filtered_view()).to_pandas()
+        assert np.array_equal(result["key"], expected["key"])
+        assert np.allclose(result["val"], expected["val"], equal_nan=True)
+        assert dashboard._chart_inputs[bar.name] == dashboard._chart_input(bar)
+
+    def test_progressive_reload_aborted(self):
+        dashboard = self.cux_df.dashboard(
+            charts=[],
+            title="test_title",
+            data_size_widget=False,
+            progressive_chunk_size=2,
+        )
+        bar = bokeh.bar("key", "val", aggregate_fn="sum")
+        dashboard.add_charts([bar])
+
+        def apply_reload(result):
+            # a new interaction arrives after the first chunk
+            dashboard._reload_generation += 1
+
+        bar.apply_reload = mock.Mock(side_effect=apply_reload)
+        chart_input = dashboard._chart_inputs.get(bar.name)
+        dashboard._query_str_dict = {"a": "key<4"}
+        dashboard._execute_reload()
+
+        # the remaining chunks are dropped, the next reload recomputes
+        assert bar.apply_reload.call_count == 1
+        assert dashboard._chart_inputs.get(bar.name) == chart_input
+
+    @pytest.mark.parametrize("exact_reload", ["ready", "release"])
+    def test_sample_reload(self, exact_reload):
+        dashboard = self.cux_df.dashboard(
+            charts=[],
+            title="test_title",
+            sample_size=5,
+            exact_reload=exact_reload,
+        )
+        bar = bokeh.bar("key", "val", aggregate_fn="sum")
+        dashboard.add_charts([bar])
+        size = dashboard.charts[self._datasize_title]
+        assert self.cux_df.sample is dashboard._sample
+        estimates = {}
+
+        def apply_reload(chart):
+            def _apply_reload(result):
+                estimates.setdefault(chart.name, chart.confidence_interval)
+
+            return _apply_reload
+
+        bar.apply_reload = apply_reload(bar)
+        size.apply_reload = apply_reload(size)
+        bar.box_selected_range = {"key_min": 1, "key_max": 3}
+        bar.compute_query_dict(
+            dashboard._query_str_dict, dashboard._query_local_variables_dict
+        )
+        dashboard._reload_charts(released=False)
+
+        # rendered from the sample first, with the confidence intervals
+        assert estimates[bar.name] is not None
+        assert estimates[size.name] == (3.0, 3.0)
+        if exact_reload == "ready":
+            assert size.confidence_interval is None
+        else:
+            # the exact results wait for the release
+            assert size.confidence_interval == (3.0, 3.0)
+            dashboard._release_reload()
+            assert size.confidence_interval is None